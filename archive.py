@@ -0,0 +1,76 @@
+"""
+Arsip bulanan: transaksi bulan yang sudah tutup dipindah dari cafe_pos.db ke
+archives/cafe_pos_YYYY-MM.db
+
+Database utama tetap kecil sehingga page cache till hanya berisi bulan
+berjalan. Tabel rollup (daily_sales_summary, item_daily_sales) tetap lengkap
+di database utama, jadi ringkasan harian, laporan periode dan item terpopuler
+tidak membuka arsip. Riwayat transaksi, export dan cetak ulang struk membaca
+arsip lewat Database, yang hanya meng-ATTACH arsip bulan yang tersentuh
+rentang tanggal. File arsip tidak berubah lagi setelah dibuat, cukup
+di-backup sekali.
+
+Pemindahan dilakukan dalam dua commit: salin ke arsip, lalu hapus dari
+database utama dan catat di archived_months. Bila terhenti di antaranya,
+jalankan ulang; baris yang sudah tersalin dilewati.
+"""
+
+from datetime import datetime, timezone
+import os
+import re
+
+ARCHIVE_FOLDER = "archives"
+
+
+def archive_path(db_path, month):
+    """Path file arsip bulan 'YYYY-MM', relatif terhadap folder database utama"""
+    name = os.path.splitext(os.path.basename(db_path))[0]
+    return os.path.join(ARCHIVE_FOLDER, f"{name}_{month}.db")
+
+
+def utc_today():
+    """Tanggal hari ini menurut jam UTC, sama dengan transaction_date (lihat SaleWriter.submit)"""
+    return datetime.now(timezone.utc).date()
+
+
+def archivable_months(db, keep_months=1, today=None):
+    """Bulan (YYYY-MM) di database utama yang lebih tua dari bulan berjalan
+    dan keep_months bulan sebelumnya"""
+    today = today or utc_today()
+    month_index = today.year * 12 + today.month - 1 - keep_months
+    cutoff = f"{month_index // 12:04d}-{month_index % 12 + 1:02d}-01"
+    rows = db.get_connection().execute('''
+        SELECT DISTINCT substr(transaction_date, 1, 7) FROM transactions
+        WHERE transaction_date < ?
+        ORDER BY 1
+    ''', (cutoff,)).fetchall()
+    return [row[0] for row in rows]
+
+
+def check_closed_month(month, today=None):
+    """ValueError bila month bukan 'YYYY-MM' atau belum tutup (penjualan bulan berjalan masih masuk)"""
+    try:
+        if not re.fullmatch(r"\d{4}-\d{2}", month):
+            raise ValueError
+        first_day = datetime.strptime(month, "%Y-%m").date()
+    except ValueError:
+        raise ValueError(f"Format bulan harus YYYY-MM: {month}") from None
+    today = today or utc_today()
+    if first_day >= today.replace(day=1):
+        raise ValueError(f"Bulan {month} belum tutup; hanya bulan sebelum {today:%Y-%m} yang bisa diarsipkan")
+
+
+def archive_month(db, month, today=None):
+    """Pindahkan transaksi bulan 'YYYY-MM' ke file arsipnya; mengembalikan jumlah transaksi yang dipindah"""
+    check_closed_month(month, today)
+    relative_path = archive_path(db.db_path, month)
+    path = os.path.join(os.path.dirname(os.path.abspath(db.db_path)), relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return db.archive_month(month, path, relative_path)
+
+
+def compact(db):
+    """VACUUM database utama setelah pengarsipan agar ukuran file ikut mengecil"""
+    conn = db.get_connection()
+    conn.execute("VACUUM")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
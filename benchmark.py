@@ -0,0 +1,978 @@
+#!/usr/bin/env python3
+"""
+Benchmark headless dan pemeriksaan query plan untuk lapisan data Cafe POS
+
+Contoh:
+    python benchmark.py checkout --sales 500 --lines 12
+    python benchmark.py plan
+    python benchmark.py menu --sizes 50 500 2000
+    python benchmark.py cart --lines 200
+    python benchmark.py receipts --receipts 200
+    python benchmark.py suite --years 0.25 1 3 --json hasil.json
+    python benchmark.py compare base.json hasil.json
+    python benchmark.py tills --tills 3 --sales 500
+    python benchmark.py server --clients 3 --requests 2000 --pipeline 8
+    python benchmark.py crash --rounds 20
+    python benchmark.py archive --years 2
+"""
+
+import argparse
+from collections import deque
+from datetime import date, datetime, timedelta
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from cart import Cart, CartItem
+from database import Database
+from money import TAX_PERCENT, format_rupiah, tax_for
+from sale_journal import SaleJournal, encode_record, new_sale_key
+from synthetic_history import TRAFFIC_SHAPES, generate_history, seed_menu
+
+
+def make_temp_database(pragmas=None):
+    """Buat Database baru di folder sementara, kembalikan (db, folder)"""
+    folder = tempfile.mkdtemp(prefix="cafe_pos_bench_")
+    db = Database(os.path.join(folder, "bench.db"), pragmas=pragmas)
+    return db, folder
+
+
+def drop_temp_database(db, folder):
+    db.close()
+    shutil.rmtree(folder, ignore_errors=True)
+
+
+def sample_sale(menu_items, lines):
+    """Header dan item transaksi contoh dengan jumlah baris tertentu"""
+    items = []
+    for i in range(lines):
+        menu_item = menu_items[i % len(menu_items)]
+        quantity = 1 + i % 3
+        items.append({
+            'menu_item_id': menu_item[0],
+            'quantity': quantity,
+            'unit_price': menu_item[2],
+            'total_price': menu_item[2] * quantity
+        })
+    subtotal = sum(item['total_price'] for item in items)
+    tax = tax_for(subtotal)
+    header = {
+        'total_amount': subtotal,
+        'tax_amount': tax,
+        'discount_amount': 0,
+        'final_amount': subtotal + tax,
+        'payment_method': 'Cash',
+        'customer_name': '',
+        'cashier_name': 'Kasir'
+    }
+    return header, items
+
+
+def checkout_per_line(db, header, items):
+    """Jalur lama: satu commit untuk header dan satu commit per item"""
+    transaction_id = db.create_transaction(**header)
+    for item in items:
+        db.add_transaction_item(transaction_id=transaction_id, **item)
+    return transaction_id
+
+
+def checkout_batched(db, header, items):
+    return db.record_sale(header, items)
+
+
+def checkout_journal(journal, header, items):
+    """Jalur SaleWriter dengan jurnal: checkout hanya menunggu append + fsync jurnal"""
+    journal.append(dict(header, sale_key=new_sale_key()), items)
+
+
+def bench_checkout(args):
+    """Bandingkan checkout per-baris, record_sale dan append jurnal"""
+    results = {}
+    for name, func, commits_per_sale in (
+        ("per-line", checkout_per_line, 1 + args.lines),
+        ("record_sale", checkout_batched, 1),
+        ("journal", checkout_journal, 1),
+    ):
+        db, folder = make_temp_database({'synchronous': args.synchronous})
+        target = db
+        try:
+            header, items = sample_sale(db.get_menu_items(), args.lines)
+            if name == "journal":
+                target = SaleJournal(os.path.join(folder, "sale_journal.bin"),
+                                     sync=args.synchronous.upper() != "OFF")
+            start = time.perf_counter()
+            for _ in range(args.sales):
+                func(target, header, items)
+            elapsed = time.perf_counter() - start
+        finally:
+            if target is not db:
+                target.close()
+            drop_temp_database(db, folder)
+        results[name] = elapsed
+        print(f"{name:>12}: {args.sales / elapsed:10.1f} sales/s  "
+              f"{args.sales * commits_per_sale / elapsed:10.1f} commits/s  "
+              f"({elapsed * 1000 / args.sales:.3f} ms/sale)")
+    print(f"speedup: {results['per-line'] / results['record_sale']:.1f}x, "
+          f"jurnal vs record_sale {results['record_sale'] / results['journal']:.1f}x")
+
+
+def capture_sql(db, func, *args):
+    """Jalankan method Database dan kembalikan SQL (parameter sudah terisi) yang dieksekusi"""
+    statements = []
+    conn = db.get_connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        func(*args)
+    finally:
+        conn.set_trace_callback(None)
+    return [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+
+
+def full_scans(conn, sql):
+    """Baris EXPLAIN QUERY PLAN yang melakukan full scan pada tabel transaksi"""
+    plan = conn.execute("EXPLAIN QUERY PLAN " + sql).fetchall()
+    return [row[3] for row in plan
+            if row[3].startswith("SCAN")
+            and any(table in row[3].split() for table in ("transactions", "t", "transaction_items", "ti"))]
+
+
+def bench_plan(args):
+    """Pastikan query laporan memakai index, bukan full table scan"""
+    db, folder = make_temp_database()
+    try:
+        header, items = sample_sale(db.get_menu_items(), 3)
+        for _ in range(args.sales):
+            db.record_sale(header, items)
+        db.get_connection().execute("ANALYZE")
+        today = time.strftime("%Y-%m-%d")
+        checks = {
+            "get_transactions": (db.get_transactions, today, today),
+            "get_daily_sales": (db.get_daily_sales, today),
+            "get_popular_items": (db.get_popular_items, today, today),
+            "get_transaction_items": (db.get_transaction_items, 1),
+            "load_transaction": (db.load_transaction, 1),
+            "load_transactions": (db.load_transactions, list(range(1, 50))),
+        }
+        failures = 0
+        for name, (func, *func_args) in checks.items():
+            for sql in capture_sql(db, func, *func_args):
+                scans = full_scans(db.get_connection(), sql)
+                print(f"{'FAIL' if scans else 'ok':>4}  {name}" + (f": {'; '.join(scans)}" if scans else ""))
+                failures += bool(scans)
+    finally:
+        drop_temp_database(db, folder)
+    if failures:
+        sys.exit(1)
+
+
+def legacy_switch(window, category_id):
+    """Cara lama: hancurkan semua tile lalu buat ulang untuk kategori terpilih"""
+    layout = window.menu_layout
+    for i in reversed(range(layout.count())):
+        widget = layout.itemAt(i).widget()
+        layout.removeWidget(widget)
+        widget.deleteLater()
+    for index, item in enumerate(window.catalog.get_items(category_id)):
+        layout.addWidget(window.create_menu_item_widget(item), index // 3, index % 3)
+
+
+def bench_menu(args):
+    """Latensi pindah kategori: tile yang dipakai ulang vs dibangun ulang"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # Jangan sentuh jurnal till yang asli: SaleWriter akan me-replay entrinya
+    # ke database benchmark lalu menghapusnya dari jurnal
+    os.environ["CAFE_POS_SALE_JOURNAL"] = "off"
+    from PySide6.QtWidgets import QApplication
+    from main_window import MainWindow
+
+    app = QApplication.instance() or QApplication([])
+    for size in args.sizes:
+        line = f"{size:>6} item"
+        for name in ("pool", "rebuild"):
+            db, folder = make_temp_database()
+            seed_menu(db, size)
+            window = MainWindow(db)
+            window.show()
+            app.processEvents()
+            categories = [None] + [category[0] for category in window.catalog.get_categories()]
+            switch = window.load_menu_items if name == "pool" else (
+                lambda category_id, window=window: legacy_switch(window, category_id))
+
+            timings = []
+            for i in range(args.switches):
+                start = time.perf_counter()
+                switch(categories[(i + 1) % len(categories)])
+                app.processEvents()
+                timings.append((time.perf_counter() - start) * 1000)
+            window.close()
+            drop_temp_database(db, folder)
+
+            timings.sort()
+            line += (f"  {name}: median {statistics.median(timings):7.2f} ms"
+                     f" p95 {timings[int(len(timings) * 0.95) - 1]:7.2f} ms")
+        print(line)
+
+
+def legacy_cart_session(menu_items, operations):
+    """Cara lama: list CartItem, cari baris secara linear, total dihitung ulang dengan sum() (float)"""
+    cart_items = []
+    for menu_item in operations:
+        for cart_item in cart_items:
+            if cart_item.id == menu_item[0]:
+                cart_item.quantity += 1
+                cart_item.total = cart_item.price * cart_item.quantity
+                break
+        else:
+            cart_items.append(CartItem(menu_item))
+        subtotal = sum(item.total for item in cart_items)
+        tax = subtotal * TAX_PERCENT / 100
+    return subtotal + tax
+
+
+def cart_session(menu_items, operations):
+    cart = Cart()
+    for menu_item in operations:
+        cart.add(menu_item)
+        total = cart.total
+    return total
+
+
+def bench_cart(args):
+    """Tambah item ke keranjang besar: Cart vs list + sum()"""
+    menu_items = [(i, f"Menu {i}", 10000 + i, 1, "", 1, "") for i in range(args.lines)]
+    # Setiap menu ditambahkan beberapa kali, seperti kasir menekan tombol berulang
+    operations = [menu_items[i % args.lines] for i in range(args.lines * args.repeat)]
+    results = {}
+    for name, func in (("list+sum", legacy_cart_session), ("Cart", cart_session)):
+        start = time.perf_counter()
+        total = func(menu_items, operations)
+        elapsed = time.perf_counter() - start
+        results[name] = (elapsed, total)
+        print(f"{name:>9}: {len(operations) / elapsed:12.0f} add/s  total {format_rupiah(total)}")
+    print(f"speedup: {results['list+sum'][0] / results['Cart'][0]:.1f}x")
+
+
+def bench_receipts(args):
+    """Struk PDF per detik: style dibuat per struk vs style yang di-cache"""
+    from receipt_printer import ReceiptPrinter
+
+    db, folder = make_temp_database()
+    try:
+        header, items = sample_sale(db.get_menu_items(), args.lines)
+        transaction_ids = [db.record_sale(header, items) for _ in range(args.receipts)]
+        receipts_dir = os.path.join(folder, "receipts")
+        variants = (
+            # Printer baru per struk = biaya lama getSampleStyleSheet() + style per panggilan
+            ("per-call", lambda: ReceiptPrinter(db, receipts_dir)),
+            ("cached", None),
+        )
+        results = {}
+        printer = ReceiptPrinter(db, receipts_dir)
+        for name, make_printer in variants:
+            start = time.perf_counter()
+            for transaction_id in transaction_ids:
+                (make_printer() if make_printer else printer).generate_receipt(transaction_id)
+            elapsed = time.perf_counter() - start
+            results[name] = elapsed
+            print(f"{name:>10}: {len(transaction_ids) / elapsed:8.1f} receipts/s  "
+                  f"({elapsed * 1000 / len(transaction_ids):.2f} ms/receipt)")
+        print(f"speedup cached: {results['per-call'] / results['cached']:.2f}x")
+
+        # Backend thermal: render ke buffer di memori, tanpa I/O file
+        from text_receipt import TextReceiptPrinter
+        transaction = db.load_transaction(transaction_ids[0])
+        for name, escpos in (("text", False), ("escpos", True)):
+            text_printer = TextReceiptPrinter(db, receipts_dir, escpos=escpos)
+            start = time.perf_counter()
+            for _ in transaction_ids:
+                text_printer.write(transaction, io.BytesIO())
+            elapsed = time.perf_counter() - start
+            print(f"{name:>10}: {len(transaction_ids) / elapsed:8.0f} receipts/s  "
+                  f"({elapsed * 1000000 / len(transaction_ids):.1f} us/receipt, render saja)")
+    finally:
+        drop_temp_database(db, folder)
+
+
+def till_process(db_path, pragmas, attempts, sale, sales, batch, think_ms, seed, ready, start_event, results):
+    """Satu till (proses terpisah) yang melakukan checkout berulang ke database bersama"""
+    try:
+        db = Database(db_path, pragmas=pragmas)
+    except sqlite3.Error as e:
+        ready.put(f"gagal membuka database: {e}")
+        return
+    db.WRITE_ATTEMPTS = attempts
+    lock_waits = []
+    db.lock_wait_hook = lock_waits.append
+    header, items = sale
+    rng = random.Random(seed)
+    latencies = []
+    saved = failed = 0
+    ready.put(None)
+    start_event.wait()
+    for done in range(0, sales, batch):
+        count = min(batch, sales - done)
+        start = time.perf_counter()
+        try:
+            if count == 1:
+                db.record_sale(header, items)
+            else:
+                db.record_sales([(header, items)] * count)
+            saved += count
+        except sqlite3.OperationalError:
+            failed += count
+        latencies.append(time.perf_counter() - start)
+        if think_ms:
+            time.sleep(rng.uniform(0, 2 * think_ms) / 1000)
+    db.close()
+    results.put((saved, failed, latencies, lock_waits))
+
+
+def percentiles(values, points=(50, 95, 99)):
+    """Persentil (ms) dari daftar detik, plus nilai maksimum"""
+    if not values:
+        return "-"
+    values = sorted(values)
+    parts = [f"p{point} {values[min(len(values) - 1, int(len(values) * point / 100))] * 1000:8.2f}"
+             for point in points]
+    return "  ".join(parts) + f"  max {values[-1] * 1000:8.2f} ms"
+
+
+def bench_tills(args):
+    """N till (proses) checkout bersamaan ke satu file database"""
+    folder = tempfile.mkdtemp(prefix="cafe_pos_tills_")
+    db_path = os.path.join(folder, "tills.db")
+    pragmas = {'journal_mode': args.journal_mode, 'synchronous': args.synchronous,
+               'busy_timeout': args.busy_timeout}
+    try:
+        # Skema dan menu dibuat sekali sebelum till mulai
+        db = Database(db_path, pragmas=pragmas)
+        sale = sample_sale(db.get_menu_items(), 3)
+        db.close()
+
+        context = multiprocessing.get_context("spawn")
+        ready = context.Queue()
+        start_event = context.Event()
+        results = context.Queue()
+        processes = [
+            context.Process(target=till_process, args=(
+                db_path, pragmas, args.attempts, sale, args.sales, args.batch, args.think_ms,
+                args.seed + till, ready, start_event, results))
+            for till in range(args.tills)
+        ]
+        for process in processes:
+            process.start()
+        # Semua till sudah membuka database sebelum mulai serentak
+        errors = [error for error in (ready.get() for _ in processes) if error]
+        start_event.set()
+        if errors:
+            for process in processes:
+                process.join()
+            sys.exit(f"{len(errors)} till gagal mulai: {errors[0]}")
+        start = time.perf_counter()
+        outcomes = [results.get() for _ in processes]
+        elapsed = time.perf_counter() - start
+        for process in processes:
+            process.join()
+
+        saved = sum(outcome[0] for outcome in outcomes)
+        failed = sum(outcome[1] for outcome in outcomes)
+        latencies = [value for outcome in outcomes for value in outcome[2]]
+        lock_waits = [value for outcome in outcomes for value in outcome[3]]
+        print(f"{args.tills} till x {args.sales} penjualan, batch {args.batch}, "
+              f"journal {args.journal_mode}, busy_timeout {args.busy_timeout} ms, {args.attempts} percobaan")
+        print(f"  tersimpan {saved}, gagal {failed}, {elapsed:.2f} s")
+        print(f"  throughput: {saved / elapsed:10.1f} sales/s  {len(latencies) / elapsed:10.1f} commit/s (termasuk yang gagal)")
+        print(f"  latensi commit: {percentiles(latencies)}")
+        print(f"  tunggu lock   : {percentiles(lock_waits)}")
+
+        conn = sqlite3.connect(db_path)
+        stored, rolled_up = conn.execute(
+            "SELECT COUNT(*), (SELECT SUM(transaction_count) FROM daily_sales_summary) FROM transactions"
+        ).fetchone()
+        conn.close()
+        consistent = stored == saved and rolled_up == saved
+        print(f"  {'ok' if consistent else 'TIDAK KONSISTEN'}: {stored} baris transaksi, rollup {rolled_up}")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    if failed or not consistent:
+        sys.exit(1)
+
+
+def server_client_process(address, requests, pipeline, write_ratio, sale, seed, ready, start_event, results):
+    """Satu till yang memakai pos_server dengan maksimal `pipeline` request menunggu jawaban"""
+    from pos_client import RemoteDatabase
+
+    db = RemoteDatabase(address)
+    rng = random.Random(seed)
+    today = date.today().isoformat()
+    reads = [
+        ("get_daily_sales", (today,)),
+        ("get_transactions_page", (today, today, None, 50)),
+        ("get_menu_items", ()),
+        ("get_popular_items", (today, today, 10)),
+        ("load_transaction", (1,)),
+    ]
+    latencies = {"sale": [], "read": []}
+    errors = []
+
+    def done(future, kind, started):
+        if future.exception():
+            errors.append(str(future.exception()))
+        else:
+            latencies[kind].append(time.perf_counter() - started)
+
+    ready.put(None)
+    start_event.wait()
+    in_flight = deque()
+    sales = 0
+    for _ in range(requests):
+        if len(in_flight) >= pipeline:
+            in_flight.popleft().exception()
+        if rng.random() < write_ratio:
+            kind, method, call_args = "sale", "record_sale", sale
+            sales += 1
+        else:
+            kind = "read"
+            method, call_args = rng.choice(reads)
+        future = db.submit(method, *call_args)
+        future.add_done_callback(lambda f, kind=kind, started=time.perf_counter(): done(f, kind, started))
+        in_flight.append(future)
+    for future in in_flight:
+        future.exception()
+    db.close()
+    results.put((sales, latencies, errors))
+
+
+def bench_server(args):
+    """Uji beban pos_server.py lokal: N till client dengan request pipelined"""
+    from pos_client import RemoteDatabase
+
+    folder = tempfile.mkdtemp(prefix="cafe_pos_server_")
+    db_path = os.path.join(folder, "server.db")
+    server = None
+    try:
+        db = Database(db_path)
+        sale = sample_sale(db.get_menu_items(), 3)
+        db.record_sale(*sale)
+        db.close()
+
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "pos_server.py"),
+             "--db", db_path, "--port", "0", "--poll-interval", "0.1"],
+            stdout=subprocess.PIPE, text=True)
+        address = server.stdout.readline().strip().rsplit(" ", 1)[-1]
+
+        context = multiprocessing.get_context("spawn")
+        ready = context.Queue()
+        start_event = context.Event()
+        results = context.Queue()
+        processes = [
+            context.Process(target=server_client_process, args=(
+                address, args.requests, args.pipeline, args.write_ratio, sale, args.seed + client,
+                ready, start_event, results))
+            for client in range(args.clients)
+        ]
+        for process in processes:
+            process.start()
+        for _ in processes:
+            ready.get()
+        start = time.perf_counter()
+        start_event.set()
+        outcomes = [results.get() for _ in processes]
+        elapsed = time.perf_counter() - start
+        for process in processes:
+            process.join()
+
+        sales = sum(outcome[0] for outcome in outcomes)
+        errors = [error for outcome in outcomes for error in outcome[2]]
+        total = args.clients * args.requests
+        print(f"{args.clients} client x {args.requests} request, pipeline {args.pipeline}, "
+              f"{args.write_ratio:.0%} checkout, server {address}")
+        print(f"  {elapsed:.2f} s, {total / elapsed:10.1f} request/s, {sales / elapsed:8.1f} sales/s, "
+              f"{len(errors)} error" + (f" ({errors[0]})" if errors else ""))
+        for kind in ("sale", "read"):
+            print(f"  latensi {kind:>4}: {percentiles([v for o in outcomes for v in o[1][kind]])}")
+
+        # Waktu sampai perubahan menu sampai ke client
+        client = RemoteDatabase(address)
+        notified = threading.Event()
+        client.add_catalog_listener(notified.set)
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute("UPDATE menu_items SET price = price WHERE id = 1")
+        changed = time.perf_counter()
+        pushed = notified.wait(5)
+        print("  notifikasi katalog: " + (f"{(time.perf_counter() - changed) * 1000:.0f} ms"
+                                          if pushed else "tidak diterima"))
+        client.close()
+
+        stored = conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        conn.close()
+        consistent = stored == sales + 1
+        print(f"  {'ok' if consistent else 'TIDAK KONSISTEN'}: {stored - 1} penjualan tersimpan")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        shutil.rmtree(folder, ignore_errors=True)
+    if errors or not consistent or not pushed:
+        sys.exit(1)
+
+
+def crash_till_process(db_path, journal_path, acked_path, sale, batch, think_ms, seed, ready):
+    """Till dengan SaleWriter + jurnal yang checkout terus sampai di-kill parent.
+
+    Setiap sale_key yang submit()-nya sudah kembali (sudah di jurnal) ditulis
+    ke acked_path; penjualan itu wajib ada di database setelah recovery.
+    """
+    from PySide6.QtCore import QCoreApplication
+    from sale_writer import SaleWriter
+
+    # Event loop Qt tidak dijalankan; app hanya perlu hidup selama writer berjalan
+    app = QCoreApplication([])
+    db = Database(db_path)
+    journal = SaleJournal(journal_path)
+    pending = [header['sale_key'] for header, _ in journal.pending_entries()]
+    # Entri jurnal yang sudah ter-commit sebelum kill (kill di antara commit dan
+    # pembersihan jurnal): replay harus melewatinya, bukan menyimpan ulang
+    committed = sum(db.get_connection().execute(
+        "SELECT COUNT(*) FROM transactions WHERE sale_key = ?", (key,)).fetchone()[0] for key in pending)
+    writer = SaleWriter(db, app, max_batch=batch, journal=journal)
+    writer.start()
+    ready.put((len(pending), committed, journal.truncated_bytes))
+    header, items = sale
+    rng = random.Random(seed)
+    with open(acked_path, "a") as acked:
+        while True:
+            key = new_sale_key()
+            writer.submit(dict(header, sale_key=key), items)
+            acked.write(key + "\n")
+            acked.flush()
+            if think_ms:
+                time.sleep(rng.uniform(0, 2 * think_ms) / 1000)
+
+
+def recover_journal(db_path, journal_path, receipts_dir):
+    """Recovery terakhir tanpa kill: SaleWriter menyimpan sisa jurnal lalu berhenti.
+
+    Struk diantrekan dari sinyal saved seperti di MainWindow; mengembalikan
+    (entri jurnal, entri tersisa, id transaksi yang disimpan, {id: file struk}).
+    """
+    from PySide6.QtCore import Qt
+    from receipt_queue import ReceiptQueue
+    from sale_writer import SaleWriter
+    from text_receipt import TextReceiptPrinter
+
+    db = Database(db_path)
+    journal = SaleJournal(journal_path)
+    pending = len(journal)
+    receipt_queue = ReceiptQueue(TextReceiptPrinter(db, receipts_dir))
+    receipts = {}
+    receipt_queue.rendered.connect(lambda transaction_id, path, _: receipts.__setitem__(transaction_id, path),
+                                   Qt.DirectConnection)
+    saved = []
+    writer = SaleWriter(db, journal=journal)
+    writer.saved.connect(lambda _, transaction_id: (saved.append(transaction_id),
+                                                    receipt_queue.submit(transaction_id)),
+                         Qt.DirectConnection)
+    receipt_queue.start()
+    writer.start()
+    writer.stop()
+    receipt_queue.stop()
+    left = len(journal)
+    journal.close()
+    db.close()
+    return pending, left, saved, receipts
+
+
+def bench_crash(args):
+    """Kill till (SIGKILL) berulang kali di tengah flush jurnal, lalu cek tidak ada penjualan hilang/ganda"""
+    folder = tempfile.mkdtemp(prefix="cafe_pos_crash_")
+    db_path = os.path.join(folder, "crash.db")
+    journal_path = os.path.join(folder, "sale_journal.bin")
+    acked_path = os.path.join(folder, "acked.txt")
+    rng = random.Random(args.seed)
+    try:
+        db = Database(db_path)
+        sale = sample_sale(db.get_menu_items(), 3)
+        db.close()
+        context = multiprocessing.get_context("spawn")
+        print(f"{args.rounds} putaran, kill setelah {args.min_ms:g}-{args.max_ms:g} ms, batch {args.batch}"
+              + (", ditambah record terpotong" if args.torn else ""))
+        replayed = committed_before = torn_bytes = 0
+        for round_number in range(args.rounds):
+            ready = context.Queue()
+            process = context.Process(target=crash_till_process, args=(
+                db_path, journal_path, acked_path, sale, args.batch, args.think_ms,
+                args.seed + round_number, ready))
+            process.start()
+            pending, committed, truncated = ready.get(timeout=60)
+            replayed += pending
+            committed_before += committed
+            torn_bytes += truncated
+            time.sleep(rng.uniform(args.min_ms, args.max_ms) / 1000)
+            process.kill()
+            process.join()
+            if args.torn:
+                # Listrik padam di tengah append: sebagian record terakhir tertulis
+                record = encode_record(*sale)
+                with open(journal_path, "ab") as f:
+                    f.write(record[:rng.randrange(1, len(record))])
+            print(f"  putaran {round_number + 1:3}: jurnal saat start {pending:5} entri "
+                  f"({committed} sudah ter-commit), {truncated} byte terpotong dibuang")
+        pending, left, recovered, receipts = recover_journal(
+            db_path, journal_path, os.path.join(folder, "receipts"))
+        print(f"  recovery akhir: {pending} entri jurnal disimpan, {left} tersisa")
+        without_receipt = [transaction_id for transaction_id in recovered
+                           if not os.path.exists(receipts.get(transaction_id, ""))]
+        print(f"  total: {replayed} entri di-replay, {committed_before} di antaranya sudah ter-commit, "
+              f"{torn_bytes} byte record terpotong dibuang")
+
+        with open(acked_path) as f:
+            acked = set(f.read().split())
+        conn = sqlite3.connect(db_path)
+        stored, distinct = conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT sale_key) FROM transactions WHERE sale_key IS NOT NULL").fetchone()
+        keys = {row[0] for row in conn.execute("SELECT sale_key FROM transactions WHERE sale_key IS NOT NULL")}
+        rolled_up = conn.execute("SELECT SUM(transaction_count) FROM daily_sales_summary").fetchone()[0] or 0
+        total = conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        item_quantity, rolled_up_quantity = conn.execute(
+            "SELECT (SELECT COALESCE(SUM(quantity), 0) FROM transaction_items),"
+            " (SELECT COALESCE(SUM(quantity), 0) FROM item_daily_sales)").fetchone()
+        integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        conn.close()
+        lost = acked - keys
+        checks = [
+            (not lost, f"{len(acked)} penjualan di-ack, {len(lost)} hilang"),
+            (stored == distinct, f"{stored} transaksi, {stored - distinct} ganda"),
+            (rolled_up == total and item_quantity == rolled_up_quantity,
+             f"rollup {rolled_up} transaksi / {rolled_up_quantity} item, tabel {total} / {item_quantity}"),
+            (left == 0, f"jurnal tersisa {left} entri"),
+            (len(recovered) == pending and not without_receipt,
+             f"{len(recovered)} transaksi hasil recovery, {len(without_receipt)} tanpa struk"),
+            (integrity == "ok", f"integrity_check {integrity}"),
+        ]
+        for passed, message in checks:
+            print(f"  {'ok' if passed else 'GAGAL'}: {message}")
+        # Penjualan yang tersimpan tetapi belum di-ack: kill tepat setelah append jurnal
+        print(f"  {len(keys - acked)} penjualan tersimpan tanpa ack (kill sebelum checkout kembali)")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    if not all(passed for passed, _ in checks):
+        sys.exit(1)
+
+
+# Riwayat sintetis selalu berakhir di tanggal ini agar hasil antar versi sebanding
+SUITE_END_DATE = date(2024, 12, 31)
+
+
+def time_calls(func, calls):
+    """Jalankan func untuk setiap tuple argumen; kembalikan waktu per panggilan (ms)"""
+    # Satu panggilan pemanasan (cache statement dan halaman SQLite) tidak ikut diukur
+    func(*calls[0])
+    timings = []
+    for call_args in calls:
+        start = time.perf_counter()
+        func(*call_args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(timings):
+    timings = sorted(timings)
+    return {
+        "runs": len(timings),
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[max(0, int(len(timings) * 0.95) - 1)], 3),
+        "min_ms": round(timings[0], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+def suite_operations(db, folder, days, runs, rng):
+    """(nama, func, daftar argumen) untuk setiap operasi yang diukur; checkout terakhir karena menulis"""
+    from receipt_printer import ReceiptPrinter
+
+    def iso(day):
+        return day.isoformat()
+
+    sample_days = [rng.choice(days) for _ in range(runs)]
+    max_id = db.get_connection().execute("SELECT MAX(id) FROM transactions").fetchone()[0]
+    printer = ReceiptPrinter(db, os.path.join(folder, "receipts"))
+    header, items = sample_sale(db.get_menu_items(), 3)
+    return [
+        ("get_daily_sales", db.get_daily_sales, [(iso(day),) for day in sample_days]),
+        ("get_transactions_day", db.get_transactions, [(iso(day), iso(day)) for day in sample_days]),
+        ("get_transactions_week", db.get_transactions,
+         [(iso(day), iso(day + timedelta(days=6))) for day in sample_days]),
+        ("get_popular_items_month", db.get_popular_items,
+         [(iso(day), iso(day + timedelta(days=29))) for day in sample_days]),
+        ("get_popular_items_all", db.get_popular_items, [(iso(days[0]), iso(days[-1]))] * runs),
+        ("load_transaction", db.load_transaction, [(rng.randint(1, max_id),) for _ in range(runs)]),
+        ("daily_report_pdf", printer.generate_daily_report, [(iso(day),) for day in sample_days[:5]]),
+        ("checkout", db.record_sale, [(header, items)] * runs),
+    ]
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def bench_suite(args):
+    """Ukur operasi lapisan data pada riwayat sintetis beberapa ukuran; hasil bisa ditulis ke JSON"""
+    # Bila JSON ditulis ke stdout, tabel ringkas dicetak ke stderr
+    log = sys.stderr if args.json == "-" else sys.stdout
+    params = {
+        "sales_per_day": args.sales_per_day, "lines": [args.min_lines, args.max_lines],
+        "menu_size": args.menu_size, "shape": args.shape, "seed": args.seed, "runs": args.runs,
+    }
+    sizes = []
+    results = []
+    for years in args.years:
+        db, folder = make_temp_database()
+        try:
+            start = time.perf_counter()
+            transaction_count, line_count = generate_history(
+                db, years, args.sales_per_day, (args.min_lines, args.max_lines), args.menu_size,
+                args.shape, args.seed, end_date=SUITE_END_DATE)
+            size = {
+                "years": years,
+                "transactions": transaction_count,
+                "lines": line_count,
+                "db_bytes": os.path.getsize(db.db_path),
+                "generate_s": round(time.perf_counter() - start, 2),
+            }
+            sizes.append(size)
+            print(f"{years:g} tahun: {transaction_count} transaksi, {line_count} item, "
+                  f"{size['db_bytes'] / 1048576:.1f} MB (dibuat {size['generate_s']} s)", file=log)
+
+            first_day = SUITE_END_DATE - timedelta(days=max(1, round(years * 365)) - 1)
+            days = [first_day + timedelta(days=i) for i in range((SUITE_END_DATE - first_day).days + 1)]
+            rng = random.Random(args.seed)
+            for name, func, calls in suite_operations(db, folder, days, args.runs, rng):
+                summary = summarize(time_calls(func, calls))
+                results.append({"years": years, "operation": name, **summary})
+                print(f"  {name:>24}: median {summary['median_ms']:9.3f} ms  "
+                      f"p95 {summary['p95_ms']:9.3f} ms  ({summary['runs']}x)", file=log)
+        finally:
+            drop_temp_database(db, folder)
+
+    if args.json:
+        document = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "params": params,
+            "sizes": sizes,
+            "results": results,
+        }
+        if args.json == "-":
+            json.dump(document, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w", encoding="utf-8") as stream:
+                json.dump(document, stream, indent=2)
+            print(f"Hasil ditulis ke {args.json}")
+
+
+def archive_operations(db, runs, rng):
+    """(nama, func, daftar argumen) yang dibandingkan sebelum dan sesudah pengarsipan"""
+    def iso(day):
+        return day.isoformat()
+
+    recent = [SUITE_END_DATE - timedelta(days=rng.randrange(14)) for _ in range(runs)]
+    old = [SUITE_END_DATE - timedelta(days=rng.randrange(60, 300)) for _ in range(runs)]
+    max_id = db.get_connection().execute("SELECT MAX(id) FROM transactions").fetchone()[0]
+    return [
+        ("page_recent", db.get_transactions_page, [(iso(day), iso(SUITE_END_DATE)) for day in recent]),
+        ("transactions_recent_week", db.get_transactions,
+         [(iso(day - timedelta(days=6)), iso(day)) for day in recent]),
+        ("transactions_old_week", db.get_transactions,
+         [(iso(day - timedelta(days=6)), iso(day)) for day in old]),
+        ("lines_old_quarter", lambda start, end: sum(1 for _ in db.iter_transaction_lines(start, end)),
+         [(iso(day - timedelta(days=90)), iso(day)) for day in old]),
+        ("load_old_transaction", db.load_transaction, [(rng.randint(1, max_id // 2),) for _ in range(runs)]),
+        ("checkout", db.record_sale, [sample_sale(db.get_menu_items(), 3)] * runs),
+    ]
+
+
+def bench_archive(args):
+    """Query riwayat sebelum/sesudah bulan tutup dipindah ke arsip bulanan"""
+    import archive
+
+    folder = tempfile.mkdtemp(prefix="cafe_pos_archive_")
+    db = Database(os.path.join(folder, "cafe_pos.db"))
+    try:
+        generate_history(db, args.years, args.sales_per_day, end_date=SUITE_END_DATE, seed=args.seed)
+        full_range = ("2000-01-01", SUITE_END_DATE.isoformat())
+        expected = (db.get_transactions(*full_range), db.get_popular_items(*full_range))
+        results = {}
+        for phase in ("live", "archived"):
+            if phase == "archived":
+                size = os.path.getsize(db.db_path)
+                start = time.perf_counter()
+                months = archive.archivable_months(db, args.keep_months, today=SUITE_END_DATE)
+                for month in months:
+                    archive.archive_month(db, month, today=SUITE_END_DATE)
+                archive.compact(db)
+                print(f"{len(months)} bulan diarsipkan ({time.perf_counter() - start:.2f} s), database utama "
+                      f"{size / 1024 / 1024:.1f} MB -> {os.path.getsize(db.db_path) / 1024 / 1024:.1f} MB")
+                # Koneksi baru: page cache dingin seperti till yang baru dibuka
+                db.close()
+                db = Database(db.db_path)
+            for name, func, calls in archive_operations(db, args.runs, random.Random(args.seed)):
+                results.setdefault(name, {})[phase] = summarize(time_calls(func, calls))["median_ms"]
+        for name, medians in results.items():
+            print(f"{name:>26}: {medians['live']:9.3f} -> {medians['archived']:9.3f} ms")
+        # Urutan transaksi dengan waktu yang sama tidak ditentukan, jadi dibandingkan setelah diurutkan.
+        # Checkout di atas memakai tanggal hari ini, di luar full_range
+        actual = (db.get_transactions(*full_range), db.get_popular_items(*full_range))
+        consistent = sorted(actual[0]) == sorted(expected[0]) and actual[1] == expected[1]
+        print(f"  {'ok' if consistent else 'TIDAK KONSISTEN'}: {len(expected[0])} transaksi sama sebelum/sesudah")
+    finally:
+        drop_temp_database(db, folder)
+    if not consistent:
+        sys.exit(1)
+
+
+def bench_compare(args):
+    """Bandingkan median dua file hasil suite; exit 1 bila ada operasi yang melambat"""
+    def load(path):
+        with open(path, encoding="utf-8") as stream:
+            document = json.load(stream)
+        return document, {(r["years"], r["operation"]): r for r in document["results"]}
+
+    base_doc, base = load(args.base)
+    new_doc, new = load(args.new)
+    if base_doc["params"] != new_doc["params"]:
+        print("Peringatan: parameter suite berbeda, hasil mungkin tidak sebanding")
+    print(f"base {base_doc.get('git') or '?'} ({base_doc['created']})  "
+          f"vs  baru {new_doc.get('git') or '?'} ({new_doc['created']})")
+    regressions = 0
+    for key in sorted(base.keys() & new.keys()):
+        ratio = new[key]["median_ms"] / base[key]["median_ms"] if base[key]["median_ms"] else 1.0
+        # Operasi mikrodetik sangat berisik; selisih kecil tidak dihitung regresi
+        slower = (ratio > args.threshold
+                  and new[key]["median_ms"] - base[key]["median_ms"] > args.min_delta_ms)
+        regressions += slower
+        print(f"{key[0]:>6g} th {key[1]:>24}: {base[key]['median_ms']:9.3f} -> "
+              f"{new[key]['median_ms']:9.3f} ms  {ratio:5.2f}x" + ("  LEBIH LAMBAT" if slower else ""))
+    if regressions:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Cafe POS")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    checkout = subparsers.add_parser("checkout", help="commit checkout per detik")
+    checkout.add_argument("--sales", type=int, default=300)
+    checkout.add_argument("--lines", type=int, default=12)
+    checkout.add_argument("--synchronous", default="FULL",
+                          help="PRAGMA synchronous (FULL mensimulasikan fsync per commit)")
+    checkout.set_defaults(func=bench_checkout)
+
+    plan = subparsers.add_parser("plan", help="cek EXPLAIN QUERY PLAN query laporan")
+    plan.add_argument("--sales", type=int, default=200)
+    plan.set_defaults(func=bench_plan)
+
+    menu = subparsers.add_parser("menu", help="latensi pindah kategori menu (butuh PySide6)")
+    menu.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 2000])
+    menu.add_argument("--switches", type=int, default=22)
+    menu.set_defaults(func=bench_menu)
+
+    cart = subparsers.add_parser("cart", help="operasi keranjang per detik (tanpa Qt)")
+    cart.add_argument("--lines", type=int, default=200)
+    cart.add_argument("--repeat", type=int, default=5)
+    cart.set_defaults(func=bench_cart)
+
+    receipts = subparsers.add_parser("receipts", help="struk PDF/teks/ESC-POS per detik (butuh reportlab)")
+    receipts.add_argument("--receipts", type=int, default=200)
+    receipts.add_argument("--lines", type=int, default=5)
+    receipts.set_defaults(func=bench_receipts)
+
+    suite = subparsers.add_parser("suite", help="operasi lapisan data pada riwayat sintetis (butuh reportlab)")
+    suite.add_argument("--years", type=float, nargs="+", default=[0.25, 1])
+    suite.add_argument("--sales-per-day", type=int, default=150)
+    suite.add_argument("--min-lines", type=int, default=1)
+    suite.add_argument("--max-lines", type=int, default=4)
+    suite.add_argument("--menu-size", type=int, default=None,
+                       help="ganti menu dengan N item sintetis (default: menu bawaan)")
+    suite.add_argument("--shape", choices=sorted(TRAFFIC_SHAPES), default="cafe")
+    suite.add_argument("--seed", type=int, default=42)
+    suite.add_argument("--runs", type=int, default=30, help="panggilan per operasi")
+    suite.add_argument("--json", help="tulis hasil ke file JSON ('-' untuk stdout)")
+    suite.set_defaults(func=bench_suite)
+
+    compare = subparsers.add_parser("compare", help="bandingkan dua file JSON hasil suite")
+    compare.add_argument("base")
+    compare.add_argument("new")
+    compare.add_argument("--threshold", type=float, default=1.25,
+                         help="rasio median yang dianggap regresi")
+    compare.add_argument("--min-delta-ms", type=float, default=0.5,
+                         help="selisih median minimum (ms) yang dianggap regresi")
+    compare.set_defaults(func=bench_compare)
+
+    tills = subparsers.add_parser("tills", help="stress test beberapa till (proses) menulis bersamaan")
+    tills.add_argument("--tills", type=int, default=3)
+    tills.add_argument("--sales", type=int, default=300, help="penjualan per till")
+    tills.add_argument("--batch", type=int, default=1, help="penjualan per commit (record_sales)")
+    tills.add_argument("--think-ms", type=float, default=0, help="rata-rata jeda antar checkout")
+    tills.add_argument("--journal-mode", default="WAL")
+    tills.add_argument("--synchronous", default="NORMAL")
+    tills.add_argument("--busy-timeout", type=int, default=Database.DEFAULT_PRAGMAS['busy_timeout'])
+    tills.add_argument("--attempts", type=int, default=Database.WRITE_ATTEMPTS,
+                       help="percobaan tulis maksimal (1 = tanpa retry)")
+    tills.add_argument("--seed", type=int, default=42)
+    tills.set_defaults(func=bench_tills)
+
+    server = subparsers.add_parser("server", help="uji beban pos_server.py lokal dengan beberapa client")
+    server.add_argument("--clients", type=int, default=3)
+    server.add_argument("--requests", type=int, default=2000, help="request per client")
+    server.add_argument("--pipeline", type=int, default=8, help="request yang boleh menunggu jawaban")
+    server.add_argument("--write-ratio", type=float, default=0.3, help="porsi request yang berupa checkout")
+    server.add_argument("--seed", type=int, default=42)
+    server.set_defaults(func=bench_server)
+
+    crash = subparsers.add_parser("crash", help="kill till di tengah flush jurnal, cek recovery (butuh PySide6)")
+    crash.add_argument("--rounds", type=int, default=20)
+    crash.add_argument("--min-ms", type=float, default=100, help="jeda minimum sebelum kill")
+    crash.add_argument("--max-ms", type=float, default=600, help="jeda maksimum sebelum kill")
+    crash.add_argument("--batch", type=int, default=20, help="max_batch SaleWriter")
+    crash.add_argument("--think-ms", type=float, default=0, help="rata-rata jeda antar checkout")
+    crash.add_argument("--torn", action="store_true",
+                       help="tambahkan record terpotong ke jurnal setelah setiap kill")
+    crash.add_argument("--seed", type=int, default=42)
+    crash.set_defaults(func=bench_crash)
+
+    archive_parser = subparsers.add_parser("archive", help="query riwayat sebelum/sesudah arsip bulanan")
+    archive_parser.add_argument("--years", type=float, default=2)
+    archive_parser.add_argument("--sales-per-day", type=int, default=150)
+    archive_parser.add_argument("--keep-months", type=int, default=1)
+    archive_parser.add_argument("--runs", type=int, default=30, help="panggilan per operasi")
+    archive_parser.add_argument("--seed", type=int, default=42)
+    archive_parser.set_defaults(func=bench_archive)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+from money import tax_for
+
+
+class CartItem:
+    __slots__ = ('id', 'name', 'price', 'category', 'quantity', 'notes', 'total')
+
+    def __init__(self, menu_item, quantity=1, notes=""):
+        self.id = menu_item[0]
+        self.name = menu_item[1]
+        self.price = menu_item[2]
+        # Baris get_menu_items: m.* (7 kolom) lalu category_name
+        self.category = menu_item[7] if len(menu_item) > 7 else ""
+        self.quantity = quantity
+        self.notes = notes
+        self.total = self.price * quantity
+
+
+class Cart:
+    """Keranjang belanja tanpa ketergantungan Qt.
+
+    Baris disimpan sesuai urutan penambahan dan diindeks per id menu, sehingga
+    mencari item yang sudah ada adalah O(1). Subtotal (int rupiah) diperbarui
+    secara inkremental pada setiap add/set_quantity/remove; pajak mengikuti
+    kebijakan di money.
+    """
+
+    def __init__(self):
+        self.subtotal = 0
+        self._lines = []
+        self._rows = {}
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __iter__(self):
+        return iter(self._lines)
+
+    def __getitem__(self, row):
+        return self._lines[row]
+
+    @property
+    def tax(self):
+        return tax_for(self.subtotal)
+
+    @property
+    def total(self):
+        return self.subtotal + self.tax
+
+    def row_of(self, menu_item_id):
+        """Indeks baris untuk id menu, None jika belum ada di keranjang"""
+        return self._rows.get(menu_item_id)
+
+    def add(self, menu_item, quantity=1):
+        """Tambah menu ke keranjang. Mengembalikan indeks baris yang berubah/baru."""
+        row = self._rows.get(menu_item[0])
+        if row is not None:
+            self.set_quantity(row, self._lines[row].quantity + quantity)
+            return row
+        cart_item = CartItem(menu_item, quantity)
+        row = len(self._lines)
+        self._lines.append(cart_item)
+        self._rows[cart_item.id] = row
+        self.subtotal += cart_item.total
+        return row
+
+    def set_quantity(self, row, quantity):
+        cart_item = self._lines[row]
+        new_total = cart_item.price * quantity
+        self.subtotal += new_total - cart_item.total
+        cart_item.quantity = quantity
+        cart_item.total = new_total
+
+    def remove(self, row, count=1):
+        removed = self._lines[row:row + count]
+        del self._lines[row:row + count]
+        for cart_item in removed:
+            self.subtotal -= cart_item.total
+            del self._rows[cart_item.id]
+        # Hanya baris setelah yang dihapus yang bergeser indeksnya
+        for index in range(row, len(self._lines)):
+            self._rows[self._lines[index].id] = index
+        if not self._lines:
+            self.subtotal = 0
+
+    def clear(self):
+        self._lines.clear()
+        self._rows.clear()
+        self.subtotal = 0
+
+    def sale_items(self):
+        """Baris keranjang dalam format item untuk Database.record_sale"""
+        return [{
+            'menu_item_id': cart_item.id,
+            'quantity': cart_item.quantity,
+            'unit_price': cart_item.price,
+            'total_price': cart_item.total,
+            'item_name': cart_item.name,
+            'category_name': cart_item.category or None
+        } for cart_item in self._lines]
@@ -0,0 +1,149 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QRectF
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtWidgets import QStyledItemDelegate, QSpinBox
+
+from money import format_rupiah
+
+
+class CartTableModel(QAbstractTableModel):
+    """Model keranjang di atas objek Cart.
+
+    Setiap perubahan hanya memancarkan sinyal untuk baris yang terpengaruh
+    (dataChanged/rowsInserted/rowsRemoved), bukan membangun ulang tabel.
+    """
+
+    HEADERS = ["Item", "Harga", "Qty", "Total", "Delete"]
+    QTY_COLUMN = 2
+    TOTAL_COLUMN = 3
+    DELETE_COLUMN = 4
+
+    def __init__(self, cart, parent=None):
+        super().__init__(parent)
+        self.cart = cart
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.cart)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cart_item = self.cart[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return cart_item.name
+            if column == 1:
+                return format_rupiah(cart_item.price)
+            if column == self.QTY_COLUMN:
+                return cart_item.quantity
+            if column == self.TOTAL_COLUMN:
+                return format_rupiah(cart_item.total)
+            return None
+        if role == Qt.EditRole and column == self.QTY_COLUMN:
+            return cart_item.quantity
+        if role == Qt.TextAlignmentRole:
+            if column in (1, self.TOTAL_COLUMN):
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            if column == self.QTY_COLUMN:
+                return int(Qt.AlignCenter)
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.QTY_COLUMN:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid() or index.column() != self.QTY_COLUMN:
+            return False
+        self.set_quantity(index.row(), int(value))
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or row + count > len(self.cart):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        self.cart.remove(row, count)
+        self.endRemoveRows()
+        return True
+
+    def add_menu_item(self, menu_item):
+        """Tambah menu; baris yang sudah ada cukup dinaikkan qty-nya"""
+        row = self.cart.row_of(menu_item[0])
+        if row is not None:
+            self.set_quantity(row, self.cart[row].quantity + 1)
+            return
+        row = len(self.cart)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.cart.add(menu_item)
+        self.endInsertRows()
+
+    def set_quantity(self, row, quantity):
+        if quantity == self.cart[row].quantity:
+            return
+        self.cart.set_quantity(row, quantity)
+        self.dataChanged.emit(self.index(row, self.QTY_COLUMN), self.index(row, self.TOTAL_COLUMN))
+
+    def clear(self):
+        self.beginResetModel()
+        self.cart.clear()
+        self.endResetModel()
+
+
+class QuantityDelegate(QStyledItemDelegate):
+    """Editor QSpinBox untuk kolom Qty"""
+
+    def createEditor(self, parent, option, index):
+        editor = QSpinBox(parent)
+        editor.setMinimum(1)
+        editor.setMaximum(999)
+        editor.setFrame(False)
+        # Total diperbarui langsung saat nilai spinbox berubah
+        editor.valueChanged.connect(lambda value: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setValue(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+
+class RemoveButtonDelegate(QStyledItemDelegate):
+    """Menggambar tombol hapus dan menghapus baris saat diklik, tanpa widget per baris"""
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = QRectF(option.rect).adjusted(6, 4, -6, -4)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#e74c3c"))
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setPen(QColor("white"))
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        painter.drawText(rect, Qt.AlignCenter, "×")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            model.removeRow(index.row())
+            return True
+        return False
@@ -0,0 +1,82 @@
+"""
+Pengaturan per till yang dibaca dari environment variable
+
+    CAFE_POS_RECEIPT         pdf (default) | text | escpos
+    CAFE_POS_PAPER_WIDTH     lebar kertas thermal dalam mm: 58 (default) atau 80
+    CAFE_POS_PRINTER_DEVICE  device/pipe printer, mis. /dev/usb/lp0 (opsional)
+    CAFE_POS_JOURNAL_MODE    WAL (default) atau DELETE bila database di network share
+    CAFE_POS_BUSY_TIMEOUT    ms menunggu lock tulis till lain (default 5000)
+    CAFE_POS_SERVER          host:port atau unix:/path pos_server.py; bila diisi,
+                             till memakai server alih-alih file database lokal
+    CAFE_POS_SERVER_TOKEN    token server (bila server dijalankan dengan --token)
+    CAFE_POS_SALE_JOURNAL    file jurnal penjualan lokal (default sale_journal.bin),
+                             satu file per till; "off" = checkout langsung
+                             menunggu commit database
+"""
+
+import os
+
+RECEIPT_BACKENDS = ("pdf", "text", "escpos")
+
+
+def receipt_backend():
+    backend = os.environ.get("CAFE_POS_RECEIPT", "pdf").strip().lower()
+    if backend not in RECEIPT_BACKENDS:
+        raise ValueError(f"CAFE_POS_RECEIPT tidak dikenal: {backend} "
+                         f"(pilihan: {', '.join(RECEIPT_BACKENDS)})")
+    return backend
+
+
+def database_pragmas():
+    """PRAGMA koneksi untuk till ini (override Database.DEFAULT_PRAGMAS).
+
+    WAL butuh shared memory, jadi hanya aman bila semua till berjalan di
+    komputer yang sama dengan file database. Untuk file di network share
+    gunakan DELETE (rollback journal).
+    """
+    pragmas = {}
+    journal_mode = os.environ.get("CAFE_POS_JOURNAL_MODE", "").strip().upper()
+    if journal_mode:
+        if journal_mode not in ("WAL", "DELETE", "TRUNCATE"):
+            raise ValueError(f"CAFE_POS_JOURNAL_MODE tidak dikenal: {journal_mode}")
+        pragmas['journal_mode'] = journal_mode
+    if os.environ.get("CAFE_POS_BUSY_TIMEOUT"):
+        pragmas['busy_timeout'] = int(os.environ["CAFE_POS_BUSY_TIMEOUT"])
+    return pragmas
+
+
+def create_database():
+    """Database till ini: client pos_server bila CAFE_POS_SERVER diisi, selain itu file lokal"""
+    address = os.environ.get("CAFE_POS_SERVER", "").strip()
+    if address:
+        from pos_client import RemoteDatabase
+        return RemoteDatabase(address, token=os.environ.get("CAFE_POS_SERVER_TOKEN") or None)
+
+    from database import Database
+    return Database(pragmas=database_pragmas())
+
+
+def create_sale_journal():
+    """Jurnal penjualan lokal till ini, atau None bila dimatikan"""
+    path = os.environ.get("CAFE_POS_SALE_JOURNAL", "sale_journal.bin").strip()
+    if path.lower() == "off":
+        return None
+
+    from sale_journal import SaleJournal
+    return SaleJournal(path)
+
+
+def create_receipt_printer(database, backend=None):
+    """Buat printer struk sesuai backend till ini"""
+    backend = backend or receipt_backend()
+    if backend == "pdf":
+        from receipt_printer import ReceiptPrinter
+        return ReceiptPrinter(database)
+
+    from text_receipt import TextReceiptPrinter
+    return TextReceiptPrinter(
+        database,
+        paper_width=int(os.environ.get("CAFE_POS_PAPER_WIDTH", "58")),
+        escpos=backend == "escpos",
+        device=os.environ.get("CAFE_POS_PRINTER_DEVICE") or None
+    )
@@ -1,272 +1,826 @@
-import sqlite3
-import os
-from datetime import datetime
-
-class Database:
-    def __init__(self):
-        self.db_path = "cafe_pos.db"
-        self.init_database()
-    
-    def get_connection(self):
-        return sqlite3.connect(self.db_path)
-    
-    def init_database(self):
-        """Inisialisasi database dan tabel"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Tabel kategori
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS categories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Tabel menu
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS menu_items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                price REAL NOT NULL,
-                category_id INTEGER,
-                description TEXT,
-                is_available BOOLEAN DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES categories (id)
-            )
-        ''')
-        
-        # Tabel transaksi
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                total_amount REAL NOT NULL,
-                tax_amount REAL DEFAULT 0,
-                discount_amount REAL DEFAULT 0,
-                final_amount REAL NOT NULL,
-                payment_method TEXT DEFAULT 'Cash',
-                customer_name TEXT,
-                cashier_name TEXT
-            )
-        ''')
-        
-        # Tabel detail transaksi
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transaction_items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                transaction_id INTEGER,
-                menu_item_id INTEGER,
-                quantity INTEGER NOT NULL,
-                unit_price REAL NOT NULL,
-                total_price REAL NOT NULL,
-                notes TEXT,
-                FOREIGN KEY (transaction_id) REFERENCES transactions (id),
-                FOREIGN KEY (menu_item_id) REFERENCES menu_items (id)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        
-        # Insert data awal jika belum ada
-        self.insert_initial_data()
-    
-    def insert_initial_data(self):
-        """Insert data kategori dan menu awal"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Cek apakah sudah ada data
-        cursor.execute("SELECT COUNT(*) FROM categories")
-        if cursor.fetchone()[0] == 0:
-            # Insert kategori
-            categories = [
-                ('Kopi',),
-                ('Makanan Ringan',),
-                ('Non-Kopi',)
-            ]
-            cursor.executemany("INSERT INTO categories (name) VALUES (?)", categories)
-            
-            # Insert menu items
-            menu_items = [
-                # Kopi (category_id = 1)
-                ('Espresso', 15000, 1, 'Kopi hitam pekat'),
-                ('Americano', 18000, 1, 'Espresso dengan air panas'),
-                ('Cappuccino', 22000, 1, 'Espresso dengan susu dan foam'),
-                ('Latte', 25000, 1, 'Espresso dengan susu steamed'),
-                ('Mocha', 28000, 1, 'Latte dengan cokelat'),
-                
-                # Makanan Ringan (category_id = 2)
-                ('Croissant', 15000, 2, 'Pastry mentega berlapis'),
-                ('Sandwich Club', 35000, 2, 'Sandwich dengan ayam dan sayuran'),
-                ('Muffin Blueberry', 18000, 2, 'Muffin dengan blueberry segar'),
-                ('Cookies Choco Chip', 12000, 2, 'Kue kering cokelat chip'),
-                ('Cake Slice Red Velvet', 25000, 2, 'Potongan kue red velvet'),
-                
-                # Non-Kopi (category_id = 3)
-                ('Teh Tarik', 12000, 3, 'Teh dengan susu'),
-                ('Chocolate Ice', 20000, 3, 'Minuman cokelat dingin'),
-                ('Lemon Tea', 15000, 3, 'Teh dengan lemon segar'),
-                ('Milkshake Vanilla', 25000, 3, 'Milkshake rasa vanilla'),
-                ('Fresh Orange Juice', 18000, 3, 'Jus jeruk segar')
-            ]
-            cursor.executemany(
-                "INSERT INTO menu_items (name, price, category_id, description) VALUES (?, ?, ?, ?)", 
-                menu_items
-            )
-            
-            conn.commit()
-        
-        conn.close()
-    
-    # CRUD Operations untuk Categories
-    def get_categories(self):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM categories ORDER BY name")
-        categories = cursor.fetchall()
-        conn.close()
-        return categories
-    
-    # CRUD Operations untuk Menu Items
-    def get_menu_items(self, category_id=None):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        if category_id:
-            cursor.execute('''
-                SELECT m.*, c.name as category_name 
-                FROM menu_items m 
-                JOIN categories c ON m.category_id = c.id 
-                WHERE m.category_id = ? AND m.is_available = 1
-                ORDER BY m.name
-            ''', (category_id,))
-        else:
-            cursor.execute('''
-                SELECT m.*, c.name as category_name 
-                FROM menu_items m 
-                JOIN categories c ON m.category_id = c.id 
-                WHERE m.is_available = 1
-                ORDER BY c.name, m.name
-            ''')
-        items = cursor.fetchall()
-        conn.close()
-        return items
-    
-    def get_menu_item_by_id(self, item_id):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT m.*, c.name as category_name 
-            FROM menu_items m 
-            JOIN categories c ON m.category_id = c.id 
-            WHERE m.id = ?
-        ''', (item_id,))
-        item = cursor.fetchone()
-        conn.close()
-        return item
-    
-    # CRUD Operations untuk Transactions
-    def create_transaction(self, total_amount, tax_amount, discount_amount, final_amount, 
-                          payment_method='Cash', customer_name='', cashier_name=''):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO transactions (total_amount, tax_amount, discount_amount, final_amount, 
-                                    payment_method, customer_name, cashier_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (total_amount, tax_amount, discount_amount, final_amount, payment_method, customer_name, cashier_name))
-        transaction_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return transaction_id
-    
-    def add_transaction_item(self, transaction_id, menu_item_id, quantity, unit_price, total_price, notes=''):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO transaction_items (transaction_id, menu_item_id, quantity, unit_price, total_price, notes)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (transaction_id, menu_item_id, quantity, unit_price, total_price, notes))
-        conn.commit()
-        conn.close()
-    
-    def get_transactions(self, start_date=None, end_date=None):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        query = "SELECT * FROM transactions"
-        params = []
-        
-        if start_date and end_date:
-            query += " WHERE DATE(transaction_date) BETWEEN ? AND ?"
-            params = [start_date, end_date]
-        
-        query += " ORDER BY transaction_date DESC"
-        
-        cursor.execute(query, params)
-        transactions = cursor.fetchall()
-        conn.close()
-        return transactions
-    
-    def get_transaction_items(self, transaction_id):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT ti.*, m.name as item_name, m.description 
-            FROM transaction_items ti 
-            JOIN menu_items m ON ti.menu_item_id = m.id 
-            WHERE ti.transaction_id = ?
-        ''', (transaction_id,))
-        items = cursor.fetchall()
-        conn.close()
-        return items
-    
-    def get_daily_sales(self, date):
-        """Mendapatkan total penjualan harian"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT 
-                COUNT(*) as transaction_count,
-                SUM(final_amount) as total_sales,
-                AVG(final_amount) as avg_transaction
-            FROM transactions 
-            WHERE DATE(transaction_date) = ?
-        ''', (date,))
-        result = cursor.fetchone()
-        conn.close()
-        return result
-    
-    def get_popular_items(self, start_date=None, end_date=None, limit=10):
-        """Mendapatkan item terpopuler"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        query = '''
-            SELECT 
-                m.name,
-                m.price,
-                SUM(ti.quantity) as total_quantity,
-                SUM(ti.total_price) as total_revenue
-            FROM transaction_items ti
-            JOIN menu_items m ON ti.menu_item_id = m.id
-            JOIN transactions t ON ti.transaction_id = t.id
-        '''
-        params = []
-        
-        if start_date and end_date:
-            query += " WHERE DATE(t.transaction_date) BETWEEN ? AND ?"
-            params = [start_date, end_date]
-        
-        query += '''
-            GROUP BY m.id, m.name, m.price
-            ORDER BY total_quantity DESC
-            LIMIT ?
-        '''
-        params.append(limit)
-        
-        cursor.execute(query, params)
-        items = cursor.fetchall()
-        conn.close()
-        return items
\ No newline at end of file
+import sqlite3
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+
+import migrations
+from records import TransactionLine, TransactionRecord
+
+# Kolom header dan baris item sesuai urutan field TransactionRecord/TransactionLine
+TRANSACTION_COLUMNS = '''
+    t.id, t.transaction_date, t.total_amount, t.tax_amount, t.discount_amount,
+    t.final_amount, t.payment_method, t.customer_name, t.cashier_name
+'''
+LINE_COLUMNS = '''
+    ti.id, ti.menu_item_id, ti.quantity, ti.unit_price, ti.total_price, ti.notes,
+    COALESCE(ti.item_name, ''), ti.category_name
+'''
+# Nama item dan kategori disimpan sebagai snapshot saat penjualan; jika pemanggil
+# tidak mengirimnya, diambil dari menu saat ini
+INSERT_LINE_SQL = '''
+    INSERT INTO transaction_items (transaction_id, menu_item_id, quantity, unit_price, total_price,
+                                   notes, item_name, category_name)
+    VALUES (?, ?, ?, ?, ?, ?,
+            COALESCE(?, (SELECT name FROM menu_items WHERE id = ?)),
+            COALESCE(?, (SELECT c.name FROM menu_items m JOIN categories c ON m.category_id = c.id
+                         WHERE m.id = ?)))
+'''
+# Batas aman jumlah parameter '?' per query SQLite
+MAX_QUERY_PARAMS = 500
+# Jumlah baris per fetchmany() untuk method iter_*
+FETCH_CHUNK_SIZE = 500
+# SQLite default hanya mengizinkan 10 database ter-ATTACH per koneksi; arsip
+# bulanan (archive.py) di-query per segmen berisi paling banyak ARCHIVES_PER_QUERY
+MAX_ATTACHED = 10
+ARCHIVES_PER_QUERY = 5
+# Tabel yang dipindah ke arsip bulanan, urut sesuai penyalinan (header dulu, lalu item)
+ARCHIVED_TABLES = ("transactions", "transaction_items")
+# Index yang dipakai query laporan (lihat migrations._v2_report_indexes)
+ARCHIVE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS archive_target.idx_transactions_date ON transactions (transaction_date)",
+    "CREATE INDEX IF NOT EXISTS archive_target.idx_transaction_items_transaction"
+    " ON transaction_items (transaction_id)",
+)
+
+
+def is_busy_error(error):
+    """True untuk 'database is locked' / SQLITE_BUSY yang layak dicoba ulang"""
+    message = str(error).lower()
+    return isinstance(error, sqlite3.OperationalError) and ("locked" in message or "busy" in message)
+
+
+def date_range_bounds(start_date, end_date):
+    """Ubah rentang tanggal inklusif 'YYYY-MM-DD' menjadi batas setengah terbuka.
+
+    transaction_date >= start AND transaction_date < end bisa memakai index,
+    berbeda dengan DATE(transaction_date) BETWEEN ? AND ?.
+    """
+    end = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
+    return start_date, end.strftime('%Y-%m-%d')
+
+
+def month_bounds(month):
+    """'YYYY-MM' -> ('YYYY-MM-01', tanggal 1 bulan berikutnya), batas setengah terbuka"""
+    year, number = map(int, month.split('-'))
+    year, number = (year + 1, 1) if number == 12 else (year, number + 1)
+    return f"{month}-01", f"{year:04d}-{number:02d}-01"
+
+
+def _create_archive_table(cursor, table):
+    """Buat tabel di arsip dengan definisi yang sama seperti di database utama
+    (id tetap INTEGER PRIMARY KEY sehingga urutan dan pencarian per id memakai rowid)"""
+    cursor.execute("SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    create_sql = re.sub(r'^CREATE TABLE\s+("?\w+"?)', f"CREATE TABLE IF NOT EXISTS archive_target.{table}",
+                        cursor.fetchone()[0])
+    cursor.execute(create_sql)
+
+
+def _archive_columns(cursor, table):
+    cursor.execute(f"PRAGMA archive_target.table_info({table})")
+    return ", ".join(row[1] for row in cursor.fetchall())
+
+
+class Database:
+    # PRAGMA default untuk setiap koneksi, bisa di-override lewat konstruktor
+    DEFAULT_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -8000,        # ~8 MB page cache
+        'mmap_size': 64 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        # Tunggu lock tulis till lain hingga 5 detik sebelum SQLite menyerah
+        'busy_timeout': 5000,
+    }
+    # Transaksi tulis yang tetap gagal karena lock diulang dengan backoff eksponensial
+    WRITE_ATTEMPTS = 5
+    RETRY_DELAY = 0.05
+    MAX_RETRY_DELAY = 1.0
+
+    def __init__(self, db_path="cafe_pos.db", pragmas=None):
+        self.db_path = db_path
+        self.pragmas = dict(self.DEFAULT_PRAGMAS)
+        if pragmas:
+            self.pragmas.update(pragmas)
+        self._local = threading.local()
+        self._connections = {}
+        self._lock = threading.Lock()
+        # Naik setiap close(); koneksi thread dari generasi lama dibuka ulang
+        self._generation = 0
+        # Opsional: dipanggil dengan lama menunggu lock tulis (detik) per transaksi tulis
+        self.lock_wait_hook = None
+        self.init_database()
+    
+    def get_connection(self):
+        """Koneksi persisten milik thread pemanggil (dibuat saat pertama dipakai).
+
+        Koneksi tidak boleh di-close oleh pemanggil; gunakan
+        release_connection() atau close().
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._generation:
+            # Koneksi lama (jika ada) sudah ditutup oleh close()
+            conn = self._open_connection()
+            self._local.conn = conn
+            self._local.generation = self._generation
+            # Arsip yang ter-ATTACH di koneksi ini: {nama schema: path}
+            self._local.attached = {}
+            with self._lock:
+                self._connections[threading.get_ident()] = conn
+        return conn
+
+    def _open_connection(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for name, value in self.pragmas.items():
+            if value is not None:
+                conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    def release_connection(self):
+        """Tutup koneksi milik thread saat ini (dipanggil sebelum thread selesai)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            self._connections.pop(threading.get_ident(), None)
+        conn.close()
+
+    def close(self):
+        """Tutup semua koneksi yang masih terbuka (saat aplikasi ditutup)"""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._generation += 1
+        self._local.conn = None
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+    
+    def init_database(self):
+        """Inisialisasi database dan jalankan migrasi skema yang tertunda"""
+        conn = self.get_connection()
+        migrations.migrate(conn)
+        
+        # Insert data awal jika belum ada
+        self.insert_initial_data()
+    
+    def insert_initial_data(self):
+        """Insert data kategori dan menu awal"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        # Cek apakah sudah ada data
+        cursor.execute("SELECT COUNT(*) FROM categories")
+        if cursor.fetchone()[0] == 0:
+            # Insert kategori
+            categories = [
+                ('Kopi',),
+                ('Makanan Ringan',),
+                ('Non-Kopi',)
+            ]
+            cursor.executemany("INSERT INTO categories (name) VALUES (?)", categories)
+            
+            # Insert menu items
+            menu_items = [
+                # Kopi (category_id = 1)
+                ('Espresso', 15000, 1, 'Kopi hitam pekat'),
+                ('Americano', 18000, 1, 'Espresso dengan air panas'),
+                ('Cappuccino', 22000, 1, 'Espresso dengan susu dan foam'),
+                ('Latte', 25000, 1, 'Espresso dengan susu steamed'),
+                ('Mocha', 28000, 1, 'Latte dengan cokelat'),
+                
+                # Makanan Ringan (category_id = 2)
+                ('Croissant', 15000, 2, 'Pastry mentega berlapis'),
+                ('Sandwich Club', 35000, 2, 'Sandwich dengan ayam dan sayuran'),
+                ('Muffin Blueberry', 18000, 2, 'Muffin dengan blueberry segar'),
+                ('Cookies Choco Chip', 12000, 2, 'Kue kering cokelat chip'),
+                ('Cake Slice Red Velvet', 25000, 2, 'Potongan kue red velvet'),
+                
+                # Non-Kopi (category_id = 3)
+                ('Teh Tarik', 12000, 3, 'Teh dengan susu'),
+                ('Chocolate Ice', 20000, 3, 'Minuman cokelat dingin'),
+                ('Lemon Tea', 15000, 3, 'Teh dengan lemon segar'),
+                ('Milkshake Vanilla', 25000, 3, 'Milkshake rasa vanilla'),
+                ('Fresh Orange Juice', 18000, 3, 'Jus jeruk segar')
+            ]
+            cursor.executemany(
+                "INSERT INTO menu_items (name, price, category_id, description) VALUES (?, ?, ?, ?)", 
+                menu_items
+            )
+            
+            conn.commit()
+    
+    # CRUD Operations untuk Categories
+    def get_categories(self):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM categories ORDER BY name")
+        categories = cursor.fetchall()
+        return categories
+    
+    # CRUD Operations untuk Menu Items
+    def get_menu_items(self, category_id=None, include_unavailable=False):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        query = '''
+            SELECT m.*, c.name as category_name 
+            FROM menu_items m 
+            JOIN categories c ON m.category_id = c.id 
+        '''
+        conditions = []
+        params = []
+        if category_id:
+            conditions.append("m.category_id = ?")
+            params.append(category_id)
+        if not include_unavailable:
+            conditions.append("m.is_available = 1")
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY m.name" if category_id else " ORDER BY c.name, m.name"
+        cursor.execute(query, params)
+        items = cursor.fetchall()
+        return items
+    
+    def get_menu_item_by_id(self, item_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT m.*, c.name as category_name 
+            FROM menu_items m 
+            JOIN categories c ON m.category_id = c.id 
+            WHERE m.id = ?
+        ''', (item_id,))
+        item = cursor.fetchone()
+        return item
+
+    def get_catalog_version(self):
+        """Nomor versi katalog; berubah setiap ada perubahan menu_items/categories"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT version FROM catalog_version")
+        return cursor.fetchone()[0]
+
+    # Arsip bulanan (archive.py)
+    def get_archived_months(self):
+        """(bulan, path file arsip, id terkecil, id terbesar) per bulan yang sudah diarsipkan"""
+        folder = os.path.dirname(os.path.abspath(self.db_path))
+        rows = self.get_connection().execute(
+            "SELECT month, path, min_id, max_id FROM main.archived_months ORDER BY month").fetchall()
+        return [(month, os.path.join(folder, path), min_id, max_id) for month, path, min_id, max_id in rows]
+
+    def _attach_archives(self, archives):
+        """ATTACH arsip (list (bulan, path)) ke koneksi thread ini, kembalikan nama schema-nya.
+
+        Arsip yang sudah ter-ATTACH dipakai ulang. Bila batas ATTACH tercapai,
+        arsip yang tidak dibutuhkan query ini dilepas lebih dulu. Selama ada
+        cursor yang masih terbuka, SQLite tidak bisa melepas arsip, jadi satu
+        thread sebaiknya tidak menjalankan beberapa iter_* lintas banyak bulan
+        arsip bersamaan.
+        """
+        conn = self.get_connection()
+        attached = self._local.attached
+        schemas = ["archive_" + month.replace('-', '_') for month, _ in archives]
+        for schema, (month, path) in zip(schemas, archives):
+            if attached.get(schema) == path:
+                continue
+            if not os.path.exists(path):
+                # ATTACH akan diam-diam membuat database kosong
+                raise sqlite3.OperationalError(f"File arsip {month} tidak ditemukan: {path}")
+            if schema in attached:
+                conn.execute(f"DETACH DATABASE {schema}")
+                del attached[schema]
+            for unused in [name for name in attached if name not in schemas]:
+                if len(attached) < MAX_ATTACHED:
+                    break
+                try:
+                    conn.execute(f"DETACH DATABASE {unused}")
+                except sqlite3.OperationalError:
+                    # Masih dibaca generator iter_* lain di thread ini
+                    continue
+                del attached[unused]
+            conn.execute(f"ATTACH DATABASE ? AS {schema}", (path,))
+            attached[schema] = path
+        return schemas
+
+    def _detach_archives(self):
+        """Lepas arsip yang ter-ATTACH untuk query baca.
+
+        BEGIN IMMEDIATE mengunci semua database yang ter-ATTACH, jadi arsip
+        dilepas sebelum transaksi tulis (termasuk saat archive.py menulis arsip).
+        """
+        conn = self.get_connection()
+        attached = self._local.attached
+        for schema in list(attached):
+            try:
+                conn.execute(f"DETACH DATABASE {schema}")
+            except sqlite3.OperationalError:
+                continue
+            del attached[schema]
+
+    def _date_segments(self, start, end):
+        """Bagi rentang [start, end) (None = tanpa batas) menjadi segmen urut waktu.
+
+        Segmen = (awal, akhir, arsip) dengan arsip = list (bulan, path) yang
+        tersentuh rentang, paling banyak ARCHIVES_PER_QUERY per segmen. Rentang
+        yang hanya berisi bulan aktif menjadi satu segmen tanpa arsip.
+        """
+        archives = []
+        for month, path, _, _ in self.get_archived_months():
+            month_start, month_end = month_bounds(month)
+            if (end is None or month_start < end) and (start is None or month_end > start):
+                archives.append((month, path))
+        segments = []
+        for first in range(0, len(archives), ARCHIVES_PER_QUERY):
+            group = archives[first:first + ARCHIVES_PER_QUERY]
+            is_last = first + ARCHIVES_PER_QUERY >= len(archives)
+            segment_start = segments[-1][1] if segments else start
+            segments.append((segment_start, end if is_last else month_bounds(group[-1][0])[1], group))
+        return segments or [(start, end, [])]
+
+    def _id_schemas(self, transaction_ids):
+        """Kelompok schema yang mungkin berisi transaction_ids: 'main' lalu arsip
+        yang rentang id-nya cocok, paling banyak ARCHIVES_PER_QUERY per kelompok"""
+        archives = [(month, path) for month, path, min_id, max_id in self.get_archived_months()
+                    if min_id is not None and any(min_id <= i <= max_id for i in transaction_ids)]
+        groups = [archives[first:first + ARCHIVES_PER_QUERY]
+                  for first in range(0, len(archives), ARCHIVES_PER_QUERY)] or [[]]
+        for index, group in enumerate(groups):
+            yield (["main"] if index == 0 else []) + self._attach_archives(group)
+
+    @staticmethod
+    def _date_where(start, end):
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("t.transaction_date >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("t.transaction_date < ?")
+            params.append(end)
+        return " AND ".join(conditions) or "1", params
+
+    @staticmethod
+    def _union_query(template, schemas, where, params):
+        """template ({db} = schema, {where} = kondisi) untuk setiap schema, digabung UNION ALL"""
+        parts = [template.format(db=schema, where=where) for schema in schemas]
+        return " UNION ALL ".join(parts), list(params) * len(parts)
+
+    def _iter_segments(self, template, start, end, order_by, newest_first, chunk_size):
+        """Baris template dari database utama dan arsip rentang [start, end), segmen demi segmen"""
+        segments = self._date_segments(start, end)
+        if newest_first:
+            segments.reverse()
+        for segment_start, segment_end, archives in segments:
+            where, params = self._date_where(segment_start, segment_end)
+            query, params = self._union_query(template, ["main"] + self._attach_archives(archives), where, params)
+            yield from self._iter_query(query + order_by, params, chunk_size)
+
+    def add_catalog_listener(self, callback):
+        """Database lokal tidak mengirim notifikasi (lihat pos_client.RemoteDatabase);
+        perubahan katalog tetap terlihat lewat get_catalog_version()"""
+    
+    def _write(self, work):
+        """Jalankan work(cursor) dalam satu transaksi tulis dan kembalikan hasilnya.
+
+        BEGIN IMMEDIATE mengambil lock tulis di awal, sehingga dua till tidak
+        saling menunggu saat upgrade lock baca ke tulis. Bila lock tetap tidak
+        didapat setelah busy_timeout, seluruh transaksi diulang dengan backoff
+        (maksimal WRITE_ATTEMPTS kali) sebelum error diteruskan ke pemanggil.
+        """
+        conn = self.get_connection()
+        if self._local.attached:
+            self._detach_archives()
+        delay = self.RETRY_DELAY
+        started = time.perf_counter()
+        for attempt in range(1, self.WRITE_ATTEMPTS + 1):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                waited = time.perf_counter() - started
+                with conn:
+                    result = work(conn.cursor())
+                break
+            except sqlite3.OperationalError as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                if not is_busy_error(e) or attempt == self.WRITE_ATTEMPTS:
+                    raise
+                # Jitter agar till yang bentrok tidak mencoba ulang bersamaan
+                time.sleep(delay * random.uniform(0.5, 1.5))
+                delay = min(delay * 2, self.MAX_RETRY_DELAY)
+        if self.lock_wait_hook is not None:
+            self.lock_wait_hook(waited)
+        return result
+
+    # CRUD Operations untuk Transactions
+    def create_transaction(self, total_amount, tax_amount, discount_amount, final_amount, 
+                          payment_method='Cash', customer_name='', cashier_name=''):
+        def work(cursor):
+            cursor.execute('''
+                INSERT INTO transactions (total_amount, tax_amount, discount_amount, final_amount, 
+                                        payment_method, customer_name, cashier_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (total_amount, tax_amount, discount_amount, final_amount, payment_method, customer_name, cashier_name))
+            transaction_id = cursor.lastrowid
+            self._add_to_daily_summary(cursor, transaction_id)
+            return transaction_id
+        return self._write(work)
+    
+    def add_transaction_item(self, transaction_id, menu_item_id, quantity, unit_price, total_price, notes='',
+                             item_name=None, category_name=None):
+        def work(cursor):
+            cursor.execute(INSERT_LINE_SQL, (transaction_id, menu_item_id, quantity, unit_price, total_price, notes,
+                                             item_name, menu_item_id, category_name, menu_item_id))
+            self._add_to_item_summary(cursor, "ti.id = ?", cursor.lastrowid)
+        self._write(work)
+
+    def record_sale(self, header, items):
+        """Simpan header transaksi dan semua item dalam satu transaksi SQLite.
+
+        header: dict dengan key seperti argumen create_transaction, ditambah
+        opsional transaction_date ('YYYY-MM-DD HH:MM:SS' UTC, default sekarang)
+        dan sale_key (kunci idempotensi; sale_key yang sudah ada tidak disimpan
+        ulang, id transaksinya yang dikembalikan).
+        items: list dict (menu_item_id, quantity, unit_price, total_price, notes,
+        item_name, category_name); nama yang tidak dikirim diambil dari menu.
+        Mengembalikan id transaksi; bila gagal tidak ada data yang tersimpan.
+        """
+        return self._write(lambda cursor: self._insert_sale(cursor, header, items))
+
+    def record_sales(self, sales):
+        """Simpan beberapa penjualan (list (header, items)) dalam satu commit.
+
+        Mengembalikan list id transaksi sesuai urutan; bila satu gagal, tidak
+        ada yang tersimpan.
+        """
+        return self._write(lambda cursor: [self._insert_sale(cursor, header, items)
+                                           for header, items in sales])
+
+    def _insert_sale(self, cursor, header, items):
+        # Penjualan dengan sale_key yang sudah tersimpan (replay jurnal setelah
+        # crash) tidak disimpan ulang; id transaksi yang lama dikembalikan
+        sale_key = header.get('sale_key')
+        if sale_key is not None:
+            cursor.execute("SELECT id FROM transactions WHERE sale_key = ?", (sale_key,))
+            row = cursor.fetchone()
+            if row:
+                return row[0]
+        cursor.execute('''
+            INSERT INTO transactions (transaction_date, total_amount, tax_amount, discount_amount,
+                                    final_amount, payment_method, customer_name, cashier_name, sale_key)
+            VALUES (COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (header.get('transaction_date'), header['total_amount'], header.get('tax_amount', 0),
+              header.get('discount_amount', 0), header['final_amount'], header.get('payment_method', 'Cash'),
+              header.get('customer_name', ''), header.get('cashier_name', ''), sale_key))
+        transaction_id = cursor.lastrowid
+        self._add_to_daily_summary(cursor, transaction_id)
+        cursor.executemany(INSERT_LINE_SQL, [
+            (transaction_id, item['menu_item_id'], item['quantity'], item['unit_price'],
+             item['total_price'], item.get('notes', ''), item.get('item_name'), item['menu_item_id'],
+             item.get('category_name'), item['menu_item_id']) for item in items])
+        self._add_to_item_summary(cursor, "ti.transaction_id = ?", transaction_id)
+        return transaction_id
+
+    def _add_to_daily_summary(self, cursor, transaction_id):
+        """Tambahkan transaksi ke daily_sales_summary (di dalam transaksi SQLite pemanggil)"""
+        cursor.execute('''
+            INSERT INTO daily_sales_summary (sale_date, payment_method, transaction_count, total_sales)
+            SELECT DATE(transaction_date), COALESCE(payment_method, ''), 1, final_amount
+            FROM transactions WHERE id = ?
+            ON CONFLICT (sale_date, payment_method) DO UPDATE SET
+                transaction_count = transaction_count + excluded.transaction_count,
+                total_sales = total_sales + excluded.total_sales
+        ''', (transaction_id,))
+
+    def _add_to_item_summary(self, cursor, condition, param):
+        """Tambahkan baris transaction_items yang cocok dengan condition ke item_daily_sales"""
+        cursor.execute(f'''
+            INSERT INTO item_daily_sales (sale_date, menu_item_id, quantity, revenue, item_name, unit_price)
+            SELECT DATE(t.transaction_date), ti.menu_item_id, ti.quantity, ti.total_price,
+                   ti.item_name, ti.unit_price
+            FROM transaction_items ti
+            JOIN transactions t ON ti.transaction_id = t.id
+            WHERE {condition}
+            ORDER BY ti.id
+            ON CONFLICT (sale_date, menu_item_id) DO UPDATE SET
+                quantity = quantity + excluded.quantity,
+                revenue = revenue + excluded.revenue,
+                item_name = excluded.item_name,
+                unit_price = excluded.unit_price
+        ''', (param,))
+
+    def rebuild_sales_summaries(self):
+        """Bangun ulang tabel rollup penjualan dari riwayat transaksi (termasuk arsip)"""
+        archives = [path for _, path, _, _ in self.get_archived_months()]
+
+        def work(cursor):
+            migrations.rebuild_daily_sales_summary(cursor)
+            migrations.rebuild_item_daily_sales(cursor)
+            for path in archives:
+                self._add_archive_to_summaries(cursor, path)
+        self._write(work)
+
+    def _add_archive_to_summaries(self, cursor, path):
+        """Tambahkan transaksi satu file arsip ke rollup.
+
+        Arsip dibaca lewat koneksi terpisah karena ATTACH tidak bisa dilakukan
+        di dalam transaksi tulis.
+        """
+        archive = sqlite3.connect(path)
+        try:
+            daily = archive.execute('''
+                SELECT DATE(transaction_date), COALESCE(payment_method, ''), COUNT(*), SUM(final_amount)
+                FROM transactions
+                GROUP BY DATE(transaction_date), COALESCE(payment_method, '')
+            ''').fetchall()
+            items = archive.execute('''
+                SELECT sale_date, menu_item_id, quantity, revenue, item_name, unit_price
+                FROM (
+                    SELECT DATE(t.transaction_date) AS sale_date, ti.menu_item_id AS menu_item_id,
+                           SUM(ti.quantity) AS quantity, SUM(ti.total_price) AS revenue,
+                           MAX(ti.id), ti.item_name AS item_name, ti.unit_price AS unit_price
+                    FROM transaction_items ti
+                    JOIN transactions t ON ti.transaction_id = t.id
+                    GROUP BY DATE(t.transaction_date), ti.menu_item_id
+                )
+            ''').fetchall()
+        finally:
+            archive.close()
+        cursor.executemany('''
+            INSERT INTO daily_sales_summary (sale_date, payment_method, transaction_count, total_sales)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (sale_date, payment_method) DO UPDATE SET
+                transaction_count = transaction_count + excluded.transaction_count,
+                total_sales = total_sales + excluded.total_sales
+        ''', daily)
+        # Baris di database utama lebih baru dari arsip, jadi snapshot nama/harganya dipertahankan
+        cursor.executemany('''
+            INSERT INTO item_daily_sales (sale_date, menu_item_id, quantity, revenue, item_name, unit_price)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (sale_date, menu_item_id) DO UPDATE SET
+                quantity = quantity + excluded.quantity,
+                revenue = revenue + excluded.revenue
+        ''', items)
+
+    def archive_month(self, month, path, relative_path):
+        """Pindahkan transaksi bulan 'YYYY-MM' ke file arsip path (dibuat bila belum ada).
+
+        Dipanggil lewat archive.archive_month(), yang menentukan lokasi file
+        dan memastikan bulannya sudah tutup. relative_path dicatat di
+        archived_months. Mengembalikan jumlah transaksi yang dipindah.
+        """
+        start, end = month_bounds(month)
+        conn = self.get_connection()
+        # archive_target butuh satu slot ATTACH; arsip yang ter-ATTACH untuk query baca dilepas dulu
+        self._detach_archives()
+        conn.execute("ATTACH DATABASE ? AS archive_target", (path,))
+        try:
+            # File arsip berdiri sendiri (tanpa -wal) dan commit-nya langsung di-fsync
+            conn.execute("PRAGMA archive_target.journal_mode = DELETE")
+            conn.execute("PRAGMA archive_target.synchronous = FULL")
+
+            def copy(cursor):
+                for table in ARCHIVED_TABLES:
+                    _create_archive_table(cursor, table)
+                for statement in ARCHIVE_INDEXES:
+                    cursor.execute(statement)
+                columns = _archive_columns(cursor, "transactions")
+                cursor.execute(f'''
+                    INSERT OR IGNORE INTO archive_target.transactions ({columns})
+                    SELECT {columns} FROM main.transactions
+                    WHERE transaction_date >= ? AND transaction_date < ?
+                ''', (start, end))
+                columns = _archive_columns(cursor, "transaction_items")
+                cursor.execute(f'''
+                    INSERT OR IGNORE INTO archive_target.transaction_items ({columns})
+                    SELECT {columns} FROM main.transaction_items
+                    WHERE transaction_id IN (
+                        SELECT id FROM main.transactions WHERE transaction_date >= ? AND transaction_date < ?)
+                ''', (start, end))
+
+            def move(cursor):
+                # Hanya transaksi yang sudah ada di arsip yang dihapus dari database utama
+                cursor.execute('''
+                    DELETE FROM main.transaction_items
+                    WHERE transaction_id IN (SELECT id FROM archive_target.transactions)
+                ''')
+                cursor.execute("DELETE FROM main.transactions WHERE id IN (SELECT id FROM archive_target.transactions)")
+                moved = cursor.rowcount
+                # WHERE 1: tanpa WHERE, SQLite membaca ON CONFLICT sebagai bagian dari SELECT
+                cursor.execute('''
+                    INSERT INTO main.archived_months (month, path, transaction_count, min_id, max_id)
+                    SELECT ?, ?, COUNT(*), MIN(id), MAX(id) FROM archive_target.transactions WHERE 1
+                    ON CONFLICT (month) DO UPDATE SET
+                        path = excluded.path,
+                        transaction_count = excluded.transaction_count,
+                        min_id = excluded.min_id,
+                        max_id = excluded.max_id,
+                        archived_at = CURRENT_TIMESTAMP
+                ''', (month, relative_path))
+                return moved
+
+            self._write(copy)
+            return self._write(move)
+        finally:
+            conn.execute("DETACH DATABASE archive_target")
+
+    def _iter_query(self, query, params, chunk_size):
+        """Jalankan query dan hasilkan barisnya per chunk, tanpa fetchall()"""
+        cursor = self.get_connection().cursor()
+        try:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def get_transactions(self, start_date=None, end_date=None):
+        return list(self.iter_transactions(start_date, end_date))
+
+    def iter_transactions(self, start_date=None, end_date=None, newest_first=True,
+                          chunk_size=FETCH_CHUNK_SIZE):
+        """Seperti get_transactions, tetapi baris dihasilkan bertahap dari cursor.
+
+        Bulan yang sudah diarsipkan dibaca dari file arsipnya (ATTACH hanya
+        arsip yang tersentuh rentang).
+        """
+        # Kolom eksplisit: sale_key hanya untuk penulisan, bukan bagian baris laporan
+        template = f"SELECT {TRANSACTION_COLUMNS} FROM {{db}}.transactions t WHERE {{where}}"
+        start, end = date_range_bounds(start_date, end_date) if start_date and end_date else (None, None)
+        order_by = " ORDER BY transaction_date DESC" if newest_first else " ORDER BY transaction_date, id"
+        return self._iter_segments(template, start, end, order_by, newest_first, chunk_size)
+
+    def iter_transaction_lines(self, start_date=None, end_date=None, chunk_size=FETCH_CHUNK_SIZE):
+        """Baris item transaksi (urut waktu) diawali id dan tanggal transaksinya.
+
+        Kolom: transaction_id, transaction_date, lalu kolom TransactionLine.
+        """
+        template = f'''
+            SELECT t.id, t.transaction_date, {LINE_COLUMNS}
+            FROM {{db}}.transactions t
+            JOIN {{db}}.transaction_items ti ON ti.transaction_id = t.id
+            WHERE {{where}}
+        '''
+        start, end = date_range_bounds(start_date, end_date) if start_date and end_date else (None, None)
+        # Posisi kolom: tanggal, id transaksi, id item
+        return self._iter_segments(template, start, end, " ORDER BY 2, 1, 3", False, chunk_size)
+
+    def get_transactions_page(self, start_date, end_date, after=None, limit=200):
+        """Satu halaman riwayat transaksi (terbaru dulu) dengan keyset pagination.
+
+        after: (transaction_date, id) baris terakhir halaman sebelumnya.
+        Biaya tiap halaman tetap, tidak bergantung pada posisi halaman.
+        """
+        conn = self.get_connection()
+        start, end = date_range_bounds(start_date, end_date)
+        template = f"SELECT {TRANSACTION_COLUMNS} FROM {{db}}.transactions t WHERE {{where}}"
+        after_params = []
+        if after is not None:
+            # Batas atas <= tanggal terakhir agar index langsung mulai dari posisi halaman
+            template += " AND t.transaction_date <= ? AND (t.transaction_date, t.id) < (?, ?)"
+            after_params = [after[0], after[0], after[1]]
+        rows = []
+        for segment_start, segment_end, archives in reversed(self._date_segments(start, end)):
+            if after is not None and segment_start is not None and segment_start > after[0]:
+                continue
+            where, params = self._date_where(segment_start, segment_end)
+            query, params = self._union_query(template, ["main"] + self._attach_archives(archives),
+                                              where, params + after_params)
+            query += " ORDER BY transaction_date DESC, id DESC LIMIT ?"
+            rows += conn.execute(query, params + [limit - len(rows)]).fetchall()
+            if len(rows) >= limit:
+                break
+        return rows
+    
+    def get_transaction_items(self, transaction_id):
+        """Baris item transaksi sebagai list TransactionLine"""
+        conn = self.get_connection()
+        template = f"SELECT {LINE_COLUMNS} FROM {{db}}.transaction_items ti WHERE {{where}}"
+        lines = []
+        for schemas in self._id_schemas([transaction_id]):
+            query, params = self._union_query(template, schemas, "ti.transaction_id = ?", [transaction_id])
+            lines += [TransactionLine._make(row) for row in conn.execute(query + " ORDER BY 1", params)]
+        return lines
+
+    def _load_transactions(self, where, transaction_ids):
+        """Header + item dalam satu query; satu TransactionRecord per transaksi"""
+        conn = self.get_connection()
+        template = f'''
+            SELECT {TRANSACTION_COLUMNS}, {LINE_COLUMNS}
+            FROM {{db}}.transactions t
+            LEFT JOIN {{db}}.transaction_items ti ON ti.transaction_id = t.id
+            WHERE {{where}}
+        '''
+        records = []
+        for schemas in self._id_schemas(transaction_ids):
+            query, params = self._union_query(template, schemas, where, transaction_ids)
+            # Posisi kolom: t.id, lalu ti.id (kolom pertama setelah header)
+            cursor = conn.execute(f"{query} ORDER BY 1, {TransactionRecord.HEADER_FIELDS + 1}", params)
+            records += [TransactionRecord.from_rows(list(rows)) for _, rows in groupby(cursor, key=itemgetter(0))]
+        return records
+
+    def load_transaction(self, transaction_id):
+        """TransactionRecord lengkap dengan item, None jika tidak ada"""
+        records = self._load_transactions("t.id = ?", (transaction_id,))
+        return records[0] if records else None
+
+    def load_transactions(self, transaction_ids):
+        """Banyak transaksi sekaligus (cetak ulang, export, drill-down).
+
+        Hasil mengikuti urutan transaction_ids; id yang tidak ada dilewati.
+        """
+        transaction_ids = list(transaction_ids)
+        by_id = {}
+        for start in range(0, len(transaction_ids), MAX_QUERY_PARAMS):
+            chunk = transaction_ids[start:start + MAX_QUERY_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            for record in self._load_transactions(f"t.id IN ({placeholders})", chunk):
+                by_id[record.id] = record
+        return [by_id[transaction_id] for transaction_id in transaction_ids if transaction_id in by_id]
+    
+    def get_daily_sales(self, date):
+        """Mendapatkan total penjualan harian (dari rollup daily_sales_summary)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT
+                COALESCE(SUM(transaction_count), 0) as transaction_count,
+                SUM(total_sales) as total_sales,
+                CAST(ROUND(1.0 * SUM(total_sales) / SUM(transaction_count)) AS INTEGER) as avg_transaction
+            FROM daily_sales_summary
+            WHERE sale_date = ?
+        ''', (date,))
+        result = cursor.fetchone()
+        return result
+
+    def get_sales_by_day(self, start_date, end_date):
+        """(tanggal, jumlah transaksi, total penjualan) per hari dalam rentang, dari rollup"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT sale_date, SUM(transaction_count), SUM(total_sales)
+            FROM daily_sales_summary
+            WHERE sale_date BETWEEN ? AND ?
+            GROUP BY sale_date
+            ORDER BY sale_date
+        ''', (start_date, end_date))
+        return cursor.fetchall()
+
+    def get_sales_by_payment_method(self, start_date, end_date):
+        """(metode bayar, jumlah transaksi, total penjualan) dalam rentang, dari rollup"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT payment_method, SUM(transaction_count), SUM(total_sales)
+            FROM daily_sales_summary
+            WHERE sale_date BETWEEN ? AND ?
+            GROUP BY payment_method
+            ORDER BY SUM(total_sales) DESC
+        ''', (start_date, end_date))
+        return cursor.fetchall()
+    
+    def get_popular_items(self, start_date=None, end_date=None, limit=10):
+        """Mendapatkan item terpopuler (dari rollup item_daily_sales).
+
+        limit=None mengembalikan semua item.
+        """
+        return list(self.iter_popular_items(start_date, end_date, limit))
+
+    def iter_popular_items(self, start_date=None, end_date=None, limit=10, chunk_size=FETCH_CHUNK_SIZE):
+        """Seperti get_popular_items, tetapi baris dihasilkan bertahap dari cursor"""
+        # Nama dan harga dari snapshot hari terakhir item terjual (tanpa JOIN ke menu_items)
+        query = '''
+            SELECT item_name, unit_price, total_quantity, total_revenue
+            FROM (
+                SELECT
+                    s.item_name,
+                    s.unit_price,
+                    SUM(s.quantity) as total_quantity,
+                    SUM(s.revenue) as total_revenue,
+                    MAX(s.sale_date)
+                FROM item_daily_sales s
+        '''
+        params = []
+        
+        if start_date and end_date:
+            query += " WHERE s.sale_date BETWEEN ? AND ?"
+            params = [start_date, end_date]
+        
+        query += '''
+                GROUP BY s.menu_item_id
+            )
+            ORDER BY total_quantity DESC
+        '''
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        return self._iter_query(query, params, chunk_size)
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Export transaksi dan item transaksi ke CSV / JSON Lines secara streaming
+
+Baris dibaca dari cursor per chunk (Database.iter_*) dan langsung ditulis
+ke stream, sehingga pemakaian memori tetap datar berapa pun panjang
+rentang tanggalnya.
+"""
+
+import csv
+import json
+
+TRANSACTION_FIELDS = [
+    "id", "transaction_date", "total_amount", "tax_amount", "discount_amount",
+    "final_amount", "payment_method", "customer_name", "cashier_name"
+]
+LINE_FIELDS = [
+    "transaction_id", "transaction_date", "line_id", "menu_item_id", "quantity",
+    "unit_price", "total_price", "notes", "item_name", "category_name"
+]
+
+EXPORT_KINDS = ("transactions", "items")
+EXPORT_FORMATS = ("csv", "jsonl")
+
+
+def export_rows(kind, db, start_date=None, end_date=None):
+    """(nama kolom, iterator baris) untuk jenis export"""
+    if kind == "transactions":
+        rows = db.iter_transactions(start_date, end_date, newest_first=False)
+        return TRANSACTION_FIELDS, rows
+    if kind == "items":
+        return LINE_FIELDS, db.iter_transaction_lines(start_date, end_date)
+    raise ValueError(f"Jenis export tidak dikenal: {kind}")
+
+
+def write_csv(stream, fields, rows):
+    writer = csv.writer(stream)
+    writer.writerow(fields)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(stream, fields, rows):
+    count = 0
+    for row in rows:
+        stream.write(json.dumps(dict(zip(fields, row)), ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def export(db, stream, kind="transactions", fmt="csv", start_date=None, end_date=None):
+    """Tulis transaksi/item ke stream teks; mengembalikan jumlah baris data.
+
+    start_date/end_date 'YYYY-MM-DD' inklusif; None berarti semua data.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format export tidak dikenal: {fmt}")
+    fields, rows = export_rows(kind, db, start_date, end_date)
+    try:
+        if fmt == "csv":
+            return write_csv(stream, fields, rows)
+        return write_jsonl(stream, fields, rows)
+    finally:
+        # Tutup cursor segera, juga bila penulisan ke stream gagal di tengah jalan
+        rows.close()
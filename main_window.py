@@ -1,336 +1,419 @@
-from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QPushButton, QLabel, QTableWidget, QTableWidgetItem,
-                             QComboBox, QSpinBox, QTextEdit, QLineEdit, QFrame,
-                             QMessageBox, QTabWidget, QScrollArea, QGridLayout,
-                             QGroupBox, QFormLayout, QDateEdit, QHeaderView)
-from PySide6.QtCore import Qt, QDate
-from datetime import datetime
-from database import Database
-from receipt_printer import ReceiptPrinter
-from style import MAIN_STYLE
-
-class CartItem:
-    def __init__(self, menu_item, quantity=1, notes=""):
-        self.id = menu_item[0]
-        self.name = menu_item[1]
-        self.price = menu_item[2]
-        self.category = menu_item[6] if len(menu_item) > 6 else ""
-        self.quantity = quantity
-        self.notes = notes
-        self.total = self.price * quantity
-
-
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.db = Database()
-        self.receipt_printer = ReceiptPrinter(self.db)
-        self.cart_items = []
-        self.current_category = None
-
-        self.setWindowTitle("Maron Cafe POS System")
-        self.setGeometry(100, 100, 1200, 800)
-        self.setMinimumSize(1000, 700)
-
-        # Semua style sheet di sini
-        self.setStyleSheet(MAIN_STYLE)
-
-        self.init_ui()
-        self.load_categories()
-
-    def init_ui(self):
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QHBoxLayout(central_widget)
-        main_layout.setSpacing(10)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        main_layout.addWidget(self.create_menu_panel(), 2)
-        main_layout.addWidget(self.create_cart_panel(), 1)
-
-    def create_menu_panel(self):
-        menu_widget = QWidget()
-        menu_widget.setObjectName("leftPanel")
-        
-        menu_layout = QVBoxLayout(menu_widget)
-        title_label = QLabel("Menu")
-        title_label.setObjectName("titleLabel")
-        menu_layout.addWidget(title_label)
-
-        self.category_layout = QHBoxLayout()
-        menu_layout.addLayout(self.category_layout)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.menu_widget = QWidget()
-        self.menu_layout = QGridLayout(self.menu_widget)
-        self.menu_layout.setSpacing(10)
-        scroll_area.setWidget(self.menu_widget)
-        menu_layout.addWidget(scroll_area)
-        return menu_widget
-
-    def create_cart_panel(self):
-        cart_widget = QWidget()
-        cart_widget.setObjectName("rightPanel")
-        cart_layout = QVBoxLayout(cart_widget)
-        cart_title = QLabel("Keranjang")
-        cart_title.setObjectName("titleLabel")
-        cart_layout.addWidget(cart_title)
-
-        customer_group = QGroupBox("Informasi Pelanggan")
-        customer_layout = QFormLayout(customer_group)
-        self.customer_name_input = QLineEdit()
-        self.customer_name_input.setPlaceholderText("Nama pelanggan (opsional)")
-        customer_layout.addRow("Nama:", self.customer_name_input)
-        cart_layout.addWidget(customer_group)
-
-        self.cart_table = QTableWidget()
-        self.cart_table.setColumnCount(5)
-        self.cart_table.setHorizontalHeaderLabels(["Item", "Harga", "Qty", "Total", "Delete"])
-        self.cart_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.cart_table.setColumnWidth(0, 10)
-        self.cart_table.setColumnWidth(1, 80)
-        self.cart_table.setColumnWidth(2, 70)
-        self.cart_table.setColumnWidth(3, 100)
-        self.cart_table.setColumnWidth(4, 50)
-        cart_layout.addWidget(self.cart_table)
-
-        total_group = QGroupBox("Total")
-        total_layout = QFormLayout(total_group)
-        self.subtotal_label = QLabel("Rp 0")
-        self.tax_label = QLabel("Rp 0")
-        self.total_label = QLabel("Rp 0")
-        self.total_label.setObjectName("totalLabel")
-        total_layout.addRow("Subtotal:", self.subtotal_label)
-        total_layout.addRow("Pajak (12%):", self.tax_label)
-        total_layout.addRow("Total:", self.total_label)
-        cart_layout.addWidget(total_group)
-
-        payment_group = QGroupBox("Metode Pembayaran")
-        payment_layout = QFormLayout(payment_group)
-        self.payment_combo = QComboBox()
-        self.payment_combo.addItems(["Cash", "Credit Card", "Debit Card", "E-Wallet"])
-        payment_layout.addRow("Metode:", self.payment_combo)
-        cart_layout.addWidget(payment_group)
-
-        self.checkout_btn = QPushButton("Checkout")
-        cart_layout.addWidget(self.checkout_btn)
-
-        self.clear_cart_btn = QPushButton("Kosongkan Keranjang")
-        cart_layout.addWidget(self.clear_cart_btn)
-
-        self.reports_btn = QPushButton("Laporan")
-        cart_layout.addWidget(self.reports_btn)
-
-        self.checkout_btn.clicked.connect(self.checkout)
-        self.clear_cart_btn.clicked.connect(self.clear_cart)
-        self.reports_btn.clicked.connect(self.show_reports)
-
-        return cart_widget
-
-    def load_categories(self):
-        for i in reversed(range(self.category_layout.count())):
-            self.category_layout.itemAt(i).widget().setParent(None)
-
-        all_btn = QPushButton("Semua")
-        all_btn.setObjectName("categoryBtn")
-        all_btn.setCheckable(True)
-        all_btn.setChecked(True)
-        all_btn.clicked.connect(lambda: self.load_menu_items(None))
-        self.category_layout.addWidget(all_btn)
-
-        categories = self.db.get_categories()
-        for category in categories:
-            btn = QPushButton(category[1])
-            btn.setObjectName("categoryBtn")
-            btn.setCheckable(True)
-            btn.clicked.connect(lambda checked, cat_id=category[0]: self.load_menu_items(cat_id))
-            self.category_layout.addWidget(btn)
-
-        self.load_menu_items(None)
-
-    def load_menu_items(self, category_id):
-        self.current_category = category_id
-
-        for i in range(self.category_layout.count()):
-            btn = self.category_layout.itemAt(i).widget()
-            if isinstance(btn, QPushButton):
-                if category_id is None and i == 0:
-                    btn.setChecked(True)
-                elif category_id is not None and i > 0:
-                    categories = self.db.get_categories()
-                    if i-1 < len(categories) and categories[i-1][0] == category_id:
-                        btn.setChecked(True)
-                    else:
-                        btn.setChecked(False)
-                else:
-                    btn.setChecked(False)
-
-        for i in reversed(range(self.menu_layout.count())):
-            self.menu_layout.itemAt(i).widget().setParent(None)
-
-        menu_items = self.db.get_menu_items(category_id)
-
-        row, col = 0, 0
-        max_cols = 3
-
-        for item in menu_items:
-            item_widget = self.create_menu_item_widget(item)
-            self.menu_layout.addWidget(item_widget, row, col)
-
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-
-    def create_menu_item_widget(self, item):
-        item_widget = QWidget()
-        item_widget.setObjectName("menuItem")
-        item_widget.setFixedSize(200, 150)
-
-        layout = QVBoxLayout(item_widget)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(6)
-
-        name_label = QLabel(item[1])
-        name_label.setObjectName("menuItemName")
-        name_label.setWordWrap(True)
-        layout.addWidget(name_label)
-
-        if item[4]:
-            desc_label = QLabel(item[4])
-            desc_label.setObjectName("menuItemDesc")
-            desc_label.setWordWrap(True)
-            layout.addWidget(desc_label)
-
-        price_label = QLabel(f"Rp {item[2]:,.0f}")
-        price_label.setObjectName("menuItemPrice")
-        layout.addWidget(price_label)
-
-        add_btn = QPushButton("Tambah ke Keranjang")
-        add_btn.setObjectName("menuAddBtn")
-        add_btn.setCursor(Qt.PointingHandCursor)
-        add_btn.clicked.connect(lambda: self.add_to_cart(item))
-        layout.addWidget(add_btn)
-
-        return item_widget
-
-    def add_to_cart(self, menu_item):
-        for i, cart_item in enumerate(self.cart_items):
-            if cart_item.id == menu_item[0]:
-                self.cart_items[i].quantity += 1
-                self.cart_items[i].total = self.cart_items[i].price * self.cart_items[i].quantity
-                break
-        else:
-            cart_item = CartItem(menu_item)
-            self.cart_items.append(cart_item)
-
-        self.update_cart_display()
-
-    def update_cart_display(self):
-        self.cart_table.setRowCount(len(self.cart_items))
-        self.cart_table.verticalHeader().setDefaultSectionSize(36)
-
-        for i, cart_item in enumerate(self.cart_items):
-            self.cart_table.setItem(i, 0, QTableWidgetItem(cart_item.name))
-
-            price_item = QTableWidgetItem(f"Rp {cart_item.price:,.0f}")
-            price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.cart_table.setItem(i, 1, price_item)
-
-            qty_spin = QSpinBox()
-            qty_spin.setMinimum(1)
-            qty_spin.setValue(cart_item.quantity)
-            qty_spin.setFixedWidth(50)
-            qty_spin.valueChanged.connect(lambda value, idx=i: self.update_cart_quantity(idx, value))
-            self.cart_table.setCellWidget(i, 2, qty_spin)
-
-            total_item = QTableWidgetItem(f"Rp {cart_item.total:,.0f}")
-            total_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.cart_table.setItem(i, 3, total_item)
-
-            remove_btn = QPushButton("×")
-            remove_btn.setObjectName("removeBtn")
-            remove_btn.setCursor(Qt.PointingHandCursor)
-            remove_btn.clicked.connect(lambda checked, idx=i: self.remove_from_cart(idx))
-            self.cart_table.setCellWidget(i, 4, remove_btn)
-
-        self.update_totals()
-
-    def update_cart_quantity(self, index, quantity):
-        if index < len(self.cart_items):
-            self.cart_items[index].quantity = quantity
-            self.cart_items[index].total = self.cart_items[index].price * quantity
-            self.update_cart_display()
-
-    def remove_from_cart(self, index):
-        if index < len(self.cart_items):
-            del self.cart_items[index]
-            self.update_cart_display()
-
-    def update_totals(self):
-        subtotal = sum(item.total for item in self.cart_items)
-        tax = subtotal * 0.12
-        total = subtotal + tax
-
-        self.subtotal_label.setText(f"Rp {subtotal:,.0f}")
-        self.tax_label.setText(f"Rp {tax:,.0f}")
-        self.total_label.setText(f"Rp {total:,.0f}")
-
-    def clear_cart(self):
-        reply = QMessageBox.question(self, 'Konfirmasi', 
-                                   'Apakah Anda yakin ingin mengosongkan keranjang?',
-                                   QMessageBox.Yes | QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
-            self.cart_items.clear()
-            self.update_cart_display()
-
-    def checkout(self):
-        if not self.cart_items:
-            QMessageBox.warning(self, "Peringatan", "Keranjang kosong!")
-            return
-
-        subtotal = sum(item.total for item in self.cart_items)
-        tax = subtotal * 0.10
-        total = subtotal + tax
-
-        customer_name = self.customer_name_input.text()
-        payment_method = self.payment_combo.currentText()
-
-        transaction_id = self.db.create_transaction(
-            total_amount=subtotal,
-            tax_amount=tax,
-            discount_amount=0,
-            final_amount=total,
-            payment_method=payment_method,
-            customer_name=customer_name,
-            cashier_name="Kasir"
-        )
-
-        for cart_item in self.cart_items:
-            self.db.add_transaction_item(
-                transaction_id=transaction_id,
-                menu_item_id=cart_item.id,
-                quantity=cart_item.quantity,
-                unit_price=cart_item.price,
-                total_price=cart_item.total
-            )
-
-        try:
-            receipt_path = self.receipt_printer.generate_receipt(transaction_id)
-            QMessageBox.information(self, "Sukses", 
-                                  f"Transaksi berhasil!\nStruk tersimpan di: {receipt_path}")
-        except Exception as e:
-            QMessageBox.warning(self, "Peringatan", 
-                              f"Transaksi berhasil, tetapi gagal mencetak struk: {str(e)}")
-
-        self.cart_items.clear()
-        self.customer_name_input.clear()
-        self.update_cart_display()
-
-    def show_reports(self):
-        from reports_window import ReportsWindow
-        self.reports_window = ReportsWindow(self.db)
-        self.reports_window.show()
+from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                             QPushButton, QLabel, QTableView, QAbstractItemView,
+                             QComboBox, QTextEdit, QLineEdit, QFrame,
+                             QMessageBox, QTabWidget, QScrollArea, QGridLayout,
+                             QGroupBox, QFormLayout, QDateEdit, QHeaderView)
+from PySide6.QtCore import Qt, QDate, Signal
+from datetime import datetime
+from cart import Cart
+from cart_model import CartTableModel, QuantityDelegate, RemoveButtonDelegate
+from config import create_database, create_receipt_printer, create_sale_journal
+from menu_catalog import MenuCatalog
+from money import TAX_LABEL, format_rupiah
+from receipt_queue import ReceiptQueue
+from sale_writer import SaleWriter
+from style import MAIN_STYLE
+
+class MainWindow(QMainWindow):
+    # Menu diubah di tempat lain (notifikasi dari pos_server)
+    catalog_changed = Signal()
+
+    def __init__(self, database=None):
+        super().__init__()
+        self.db = database or create_database()
+        self.catalog = MenuCatalog(self.db)
+        # Listener dipanggil di thread socket; sinyal memindahkannya ke thread UI
+        self.catalog_changed.connect(self.on_catalog_changed)
+        self.db.add_catalog_listener(self.catalog_changed.emit)
+        # Backend struk (PDF/teks/ESC-POS) dipilih per till lewat config
+        self.receipt_printer = create_receipt_printer(self.db)
+        # Struk dirender di thread terpisah agar checkout langsung selesai
+        self.receipt_queue = ReceiptQueue(self.receipt_printer, self)
+        self.receipt_queue.rendered.connect(self.on_receipt_rendered)
+        self.receipt_queue.failed.connect(self.on_receipt_failed)
+        self.receipt_queue.start()
+        # Penjualan dicatat di jurnal lokal lalu disimpan oleh satu writer di
+        # thread terpisah; commit dan retry saat database dikunci till lain
+        # tidak membekukan UI
+        self.sale_journal = create_sale_journal()
+        self.sale_writer = SaleWriter(self.db, self, journal=self.sale_journal)
+        # Struk diantrekan langsung dari thread writer agar tidak ada yang
+        # tertinggal saat aplikasi ditutup
+        self.sale_writer.saved.connect(self.queue_receipt, Qt.DirectConnection)
+        self.sale_writer.saved.connect(self.on_sale_saved)
+        self.sale_writer.failed.connect(self.on_sale_failed)
+        self.sale_writer.delayed.connect(self.on_sale_delayed)
+        self.sale_writer.recovered.connect(self.on_sales_recovered)
+        self.sale_writer.start()
+        # Penjualan yang belum selesai disimpan: {token: (total, nama pelanggan)}
+        self.pending_sales = {}
+        self.cart = Cart()
+        self.current_category = None
+        self.category_buttons = {}
+        # Tile menu dibuat sekali per item: {item_id: (row menu, widget)}
+        self.menu_tiles = {}
+        self.tiles_version = None
+        self.visible_tile_ids = None
+        self.reports_window = None
+
+        self.setWindowTitle("Maron Cafe POS System")
+        self.setGeometry(100, 100, 1200, 800)
+        self.setMinimumSize(1000, 700)
+
+        # Semua style sheet di sini
+        self.setStyleSheet(MAIN_STYLE)
+
+        self.init_ui()
+        self.load_categories()
+
+    def init_ui(self):
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QHBoxLayout(central_widget)
+        main_layout.setSpacing(10)
+        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.addWidget(self.create_menu_panel(), 2)
+        main_layout.addWidget(self.create_cart_panel(), 1)
+
+    def create_menu_panel(self):
+        menu_widget = QWidget()
+        menu_widget.setObjectName("leftPanel")
+        
+        menu_layout = QVBoxLayout(menu_widget)
+        title_label = QLabel("Menu")
+        title_label.setObjectName("titleLabel")
+        menu_layout.addWidget(title_label)
+
+        self.category_layout = QHBoxLayout()
+        menu_layout.addLayout(self.category_layout)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.menu_widget = QWidget()
+        self.menu_layout = QGridLayout(self.menu_widget)
+        self.menu_layout.setSpacing(10)
+        scroll_area.setWidget(self.menu_widget)
+        menu_layout.addWidget(scroll_area)
+        return menu_widget
+
+    def create_cart_panel(self):
+        cart_widget = QWidget()
+        cart_widget.setObjectName("rightPanel")
+        cart_layout = QVBoxLayout(cart_widget)
+        cart_title = QLabel("Keranjang")
+        cart_title.setObjectName("titleLabel")
+        cart_layout.addWidget(cart_title)
+
+        customer_group = QGroupBox("Informasi Pelanggan")
+        customer_layout = QFormLayout(customer_group)
+        self.customer_name_input = QLineEdit()
+        self.customer_name_input.setPlaceholderText("Nama pelanggan (opsional)")
+        customer_layout.addRow("Nama:", self.customer_name_input)
+        cart_layout.addWidget(customer_group)
+
+        self.cart_model = CartTableModel(self.cart, self)
+        self.cart_model.dataChanged.connect(self.update_totals)
+        self.cart_model.rowsInserted.connect(self.update_totals)
+        self.cart_model.rowsRemoved.connect(self.update_totals)
+        self.cart_model.modelReset.connect(self.update_totals)
+
+        self.cart_table = QTableView()
+        self.cart_table.setModel(self.cart_model)
+        self.cart_table.setItemDelegateForColumn(CartTableModel.QTY_COLUMN, QuantityDelegate(self.cart_table))
+        self.cart_table.setItemDelegateForColumn(CartTableModel.DELETE_COLUMN, RemoveButtonDelegate(self.cart_table))
+        self.cart_table.setEditTriggers(QAbstractItemView.CurrentChanged | QAbstractItemView.SelectedClicked
+                                        | QAbstractItemView.DoubleClicked)
+        self.cart_table.verticalHeader().setDefaultSectionSize(36)
+        self.cart_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.cart_table.setColumnWidth(0, 10)
+        self.cart_table.setColumnWidth(1, 80)
+        self.cart_table.setColumnWidth(2, 70)
+        self.cart_table.setColumnWidth(3, 100)
+        self.cart_table.setColumnWidth(4, 50)
+        cart_layout.addWidget(self.cart_table)
+
+        total_group = QGroupBox("Total")
+        total_layout = QFormLayout(total_group)
+        self.subtotal_label = QLabel("Rp 0")
+        self.tax_label = QLabel("Rp 0")
+        self.total_label = QLabel("Rp 0")
+        self.total_label.setObjectName("totalLabel")
+        total_layout.addRow("Subtotal:", self.subtotal_label)
+        total_layout.addRow(f"{TAX_LABEL}:", self.tax_label)
+        total_layout.addRow("Total:", self.total_label)
+        cart_layout.addWidget(total_group)
+
+        payment_group = QGroupBox("Metode Pembayaran")
+        payment_layout = QFormLayout(payment_group)
+        self.payment_combo = QComboBox()
+        self.payment_combo.addItems(["Cash", "Credit Card", "Debit Card", "E-Wallet"])
+        payment_layout.addRow("Metode:", self.payment_combo)
+        cart_layout.addWidget(payment_group)
+
+        self.checkout_btn = QPushButton("Checkout")
+        cart_layout.addWidget(self.checkout_btn)
+
+        self.clear_cart_btn = QPushButton("Kosongkan Keranjang")
+        cart_layout.addWidget(self.clear_cart_btn)
+
+        self.reports_btn = QPushButton("Laporan")
+        cart_layout.addWidget(self.reports_btn)
+
+        self.checkout_btn.clicked.connect(self.checkout)
+        self.clear_cart_btn.clicked.connect(self.clear_cart)
+        self.reports_btn.clicked.connect(self.show_reports)
+
+        return cart_widget
+
+    def load_categories(self):
+        for i in reversed(range(self.category_layout.count())):
+            self.category_layout.itemAt(i).widget().setParent(None)
+        self.category_buttons = {}
+
+        self.catalog.ensure_fresh()
+
+        all_btn = QPushButton("Semua")
+        all_btn.setObjectName("categoryBtn")
+        all_btn.setCheckable(True)
+        all_btn.setChecked(True)
+        all_btn.clicked.connect(lambda: self.load_menu_items(None))
+        self.category_layout.addWidget(all_btn)
+        self.category_buttons[None] = all_btn
+
+        for category in self.catalog.get_categories():
+            btn = QPushButton(category[1])
+            btn.setObjectName("categoryBtn")
+            btn.setCheckable(True)
+            btn.clicked.connect(lambda checked, cat_id=category[0]: self.load_menu_items(cat_id))
+            self.category_layout.addWidget(btn)
+            self.category_buttons[category[0]] = btn
+
+        self.load_menu_items(None)
+
+    def on_catalog_changed(self):
+        """Muat ulang menu tanpa mengganti kategori yang sedang dipilih"""
+        current = self.current_category
+        self.load_categories()
+        if current in self.category_buttons:
+            self.load_menu_items(current)
+
+    def load_menu_items(self, category_id):
+        self.current_category = category_id
+        if self.catalog.ensure_fresh():
+            # Menu diubah di till lain: tombol kategori ikut dibangun ulang
+            self.on_catalog_changed()
+            return
+
+        for cat_id, btn in self.category_buttons.items():
+            btn.setChecked(cat_id == category_id)
+
+        menu_items = self.catalog.get_items(category_id)
+        if self.tiles_version != self.catalog.version:
+            self.sync_menu_tiles()
+
+        tile_ids = [item[0] for item in menu_items]
+        if tile_ids == self.visible_tile_ids:
+            return
+
+        # Tile tidak dihancurkan: cukup sembunyikan/tampilkan lalu susun ulang grid
+        self.menu_widget.setUpdatesEnabled(False)
+        visible = set(tile_ids)
+        for item_id, (item, tile) in self.menu_tiles.items():
+            self.menu_layout.removeWidget(tile)
+            if item_id not in visible:
+                tile.hide()
+
+        row, col = 0, 0
+        max_cols = 3
+
+        for item_id in tile_ids:
+            tile = self.menu_tiles[item_id][1]
+            self.menu_layout.addWidget(tile, row, col)
+            tile.show()
+
+            col += 1
+            if col >= max_cols:
+                col = 0
+                row += 1
+
+        self.menu_widget.setUpdatesEnabled(True)
+        self.visible_tile_ids = tile_ids
+
+    def sync_menu_tiles(self):
+        """Samakan tile dengan katalog: hanya item baru/berubah yang dibuat ulang"""
+        items = {item[0]: item for item in self.catalog.get_items()}
+        for item_id, (item, tile) in list(self.menu_tiles.items()):
+            if items.get(item_id) != item:
+                self.menu_layout.removeWidget(tile)
+                tile.deleteLater()
+                del self.menu_tiles[item_id]
+
+        for item_id, item in items.items():
+            if item_id not in self.menu_tiles:
+                tile = self.create_menu_item_widget(item)
+                tile.setParent(self.menu_widget)
+                tile.hide()
+                self.menu_tiles[item_id] = (item, tile)
+
+        self.tiles_version = self.catalog.version
+        self.visible_tile_ids = None
+
+    def create_menu_item_widget(self, item):
+        item_widget = QWidget()
+        item_widget.setObjectName("menuItem")
+        item_widget.setFixedSize(200, 150)
+
+        layout = QVBoxLayout(item_widget)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(6)
+
+        name_label = QLabel(item[1])
+        name_label.setObjectName("menuItemName")
+        name_label.setWordWrap(True)
+        layout.addWidget(name_label)
+
+        if item[4]:
+            desc_label = QLabel(item[4])
+            desc_label.setObjectName("menuItemDesc")
+            desc_label.setWordWrap(True)
+            layout.addWidget(desc_label)
+
+        price_label = QLabel(format_rupiah(item[2]))
+        price_label.setObjectName("menuItemPrice")
+        layout.addWidget(price_label)
+
+        add_btn = QPushButton("Tambah ke Keranjang")
+        add_btn.setObjectName("menuAddBtn")
+        add_btn.setCursor(Qt.PointingHandCursor)
+        add_btn.clicked.connect(lambda: self.add_to_cart(item[0]))
+        layout.addWidget(add_btn)
+
+        return item_widget
+
+    def add_to_cart(self, item_id):
+        # Harga dan nama diambil dari katalog terbaru, bukan dari tile yang mungkin basi
+        if self.catalog.ensure_fresh():
+            self.on_catalog_changed()
+        menu_item = self.catalog.get_item(item_id)
+        if menu_item is None or not menu_item[5]:
+            self.statusBar().showMessage("Menu ini sudah tidak tersedia", 5000)
+            return
+        self.cart_model.add_menu_item(menu_item)
+
+    def update_totals(self):
+        subtotal = self.cart.subtotal
+        tax = self.cart.tax
+        total = self.cart.total
+
+        self.subtotal_label.setText(format_rupiah(subtotal))
+        self.tax_label.setText(format_rupiah(tax))
+        self.total_label.setText(format_rupiah(total))
+
+    def clear_cart(self):
+        reply = QMessageBox.question(self, 'Konfirmasi', 
+                                   'Apakah Anda yakin ingin mengosongkan keranjang?',
+                                   QMessageBox.Yes | QMessageBox.No)
+        
+        if reply == QMessageBox.Yes:
+            self.cart_model.clear()
+
+    def checkout(self):
+        if not self.cart:
+            QMessageBox.warning(self, "Peringatan", "Keranjang kosong!")
+            return
+
+        # Nilai yang sama dengan yang ditampilkan di keranjang
+        subtotal = self.cart.subtotal
+        tax = self.cart.tax
+        total = self.cart.total
+
+        customer_name = self.customer_name_input.text()
+        payment_method = self.payment_combo.currentText()
+
+        header = {
+            'total_amount': subtotal,
+            'tax_amount': tax,
+            'discount_amount': 0,
+            'final_amount': total,
+            'payment_method': payment_method,
+            'customer_name': customer_name,
+            'cashier_name': "Kasir"
+        }
+        items = self.cart.sale_items()
+
+        try:
+            token = self.sale_writer.submit(header, items)
+        except OSError as e:
+            # Jurnal tidak bisa ditulis (disk penuh/rusak): keranjang tidak dikosongkan
+            QMessageBox.critical(self, "Error", f"Gagal mencatat transaksi: {e}")
+            return
+        self.pending_sales[token] = (total, customer_name)
+        self.statusBar().showMessage("Menyimpan transaksi...")
+
+        self.cart_model.clear()
+        self.customer_name_input.clear()
+
+    def queue_receipt(self, token, transaction_id):
+        # Dipanggil di thread SaleWriter (DirectConnection); ReceiptQueue.submit thread-safe
+        self.receipt_queue.submit(transaction_id)
+
+    def on_sale_saved(self, token, transaction_id):
+        self.pending_sales.pop(token, None)
+        # Tanpa dialog modal: kasir bisa langsung melayani pesanan berikutnya
+        message = f"Transaksi #{transaction_id} berhasil, struk sedang dicetak"
+        depth = self.receipt_queue.depth
+        if depth > 1:
+            message += f" ({depth} dalam antrean)"
+        self.statusBar().showMessage(message)
+
+    def on_sale_failed(self, token, error_message):
+        total, customer_name = self.pending_sales.pop(token, (0, ""))
+        self.statusBar().clearMessage()
+        customer = f" atas nama {customer_name}" if customer_name else ""
+        QMessageBox.critical(self, "Error",
+                             f"Gagal menyimpan transaksi {format_rupiah(total)}{customer}: {error_message}\n\n"
+                             f"Silakan input ulang transaksi ini.")
+
+    def on_sale_delayed(self, error_message):
+        pending = len(self.sale_journal) if self.sale_journal is not None else 0
+        self.statusBar().showMessage(f"Database belum bisa ditulis, {pending} transaksi aman di jurnal "
+                                     f"dan akan disimpan ulang: {error_message}")
+
+    def on_sales_recovered(self, count):
+        self.statusBar().showMessage(f"{count} transaksi dari sesi sebelumnya berhasil disimpan dari jurnal")
+
+    def on_receipt_rendered(self, transaction_id, receipt_path, seconds):
+        pending = self.receipt_queue.depth
+        average = self.receipt_queue.average_render_time()
+        message = (f"Struk #{transaction_id} tersimpan di: {receipt_path} "
+                   f"({seconds:.2f} dtk, rata-rata {average:.2f} dtk)")
+        if pending:
+            message += f" - {pending} struk lagi dalam antrean"
+        self.statusBar().showMessage(message)
+
+    def on_receipt_failed(self, transaction_id, error_message):
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "Peringatan",
+                          f"Transaksi #{transaction_id} berhasil, tetapi gagal mencetak struk: {error_message}")
+
+    def closeEvent(self, event):
+        # Thread query laporan harus berhenti sebelum koneksi database ditutup
+        if self.reports_window is not None:
+            self.reports_window.close()
+        # Penjualan yang masih antre tetap disimpan, lalu struknya dirender,
+        # sebelum aplikasi ditutup
+        self.sale_writer.stop()
+        if self.sale_journal is not None:
+            self.sale_journal.close()
+        self.receipt_queue.stop()
+        self.db.close()
+        super().closeEvent(event)
+
+    def show_reports(self):
+        from reports_window import ReportsWindow
+        if self.reports_window is not None:
+            self.reports_window.close()
+        self.reports_window = ReportsWindow(self.db)
+        self.reports_window.show()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Perintah pemeliharaan database Cafe POS
+
+Contoh:
+    python maintenance.py rebuild-summaries
+    python maintenance.py export --kind items --format jsonl --start 2023-01-01 --end 2025-12-31 -o items.jsonl
+    python maintenance.py period-report --kind month --date 2025-03-15
+    python maintenance.py --db demo.db generate-history --years 2 --sales-per-day 200
+    python maintenance.py archive --keep-months 1 --vacuum
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+import archive
+import exporter
+from database import Database
+from period_report import PERIOD_KINDS, PeriodReport, period_bounds
+from synthetic_history import TRAFFIC_SHAPES, generate_history
+
+
+def rebuild_summaries(db, args):
+    """Isi ulang tabel rollup penjualan dari riwayat transaksi"""
+    start = time.perf_counter()
+    db.rebuild_sales_summaries()
+    print(f"✓ Tabel rollup penjualan dibangun ulang ({time.perf_counter() - start:.2f} s)")
+
+
+def export(db, args):
+    """Export transaksi/item ke CSV atau JSON Lines (streaming)"""
+    if bool(args.start) != bool(args.end):
+        sys.exit("--start dan --end harus diisi bersamaan")
+    start = time.perf_counter()
+    if args.output == "-":
+        count = exporter.export(db, sys.stdout, args.kind, args.format, args.start, args.end)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as stream:
+            count = exporter.export(db, stream, args.kind, args.format, args.start, args.end)
+    print(f"✓ {count} baris diexport ({time.perf_counter() - start:.2f} s)", file=sys.stderr)
+
+
+def period_report(db, args):
+    """Buat PDF laporan mingguan/bulanan/rentang tanggal"""
+    try:
+        start_day, end_day = period_bounds(args.kind, date.fromisoformat(args.date),
+                                           date.fromisoformat(args.end) if args.end else None)
+    except ValueError as e:
+        sys.exit(str(e))
+    start = time.perf_counter()
+    filepath = PeriodReport(db, args.output_dir).generate(args.kind, start_day.isoformat(), end_day.isoformat())
+    print(f"✓ {filepath} ({time.perf_counter() - start:.2f} s)")
+
+
+def generate(db, args):
+    """Isi database kosong dengan riwayat penjualan sintetis (untuk uji beban/demo)"""
+    conn = db.get_connection()
+    if (conn.execute("SELECT 1 FROM transactions LIMIT 1").fetchone()
+            or conn.execute("SELECT 1 FROM archived_months LIMIT 1").fetchone()):
+        sys.exit("Database sudah berisi transaksi; gunakan file database baru (--db)")
+    start = time.perf_counter()
+    transaction_count, line_count = generate_history(
+        db, args.years, args.sales_per_day, (args.min_lines, args.max_lines), args.menu_size,
+        args.shape, args.seed)
+    print(f"✓ {transaction_count} transaksi, {line_count} item dibuat ({time.perf_counter() - start:.2f} s)")
+
+
+def archive_months(db, args):
+    """Pindahkan bulan yang sudah tutup ke file arsip per bulan"""
+    if args.list:
+        for month, path, _, _ in db.get_archived_months():
+            size = os.path.getsize(path) / 1024 / 1024 if os.path.exists(path) else 0
+            print(f"{month}  {path}  {size:.1f} MB")
+        return
+    months = args.month or archive.archivable_months(db, args.keep_months)
+    try:
+        for month in months:
+            archive.check_closed_month(month)
+    except ValueError as e:
+        sys.exit(str(e))
+    if not months:
+        print("Tidak ada bulan yang perlu diarsipkan")
+    for month in months:
+        start = time.perf_counter()
+        moved = archive.archive_month(db, month)
+        print(f"✓ {month}: {moved} transaksi dipindah ke {archive.archive_path(db.db_path, month)} "
+              f"({time.perf_counter() - start:.2f} s)")
+    if args.vacuum and months:
+        size = os.path.getsize(db.db_path)
+        archive.compact(db)
+        print(f"✓ VACUUM: {size / 1024 / 1024:.1f} MB -> {os.path.getsize(db.db_path) / 1024 / 1024:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pemeliharaan database Cafe POS")
+    parser.add_argument("--db", default="cafe_pos.db", help="path file database")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = subparsers.add_parser("rebuild-summaries",
+                                    help="isi ulang tabel rollup dari riwayat transaksi")
+    rebuild.set_defaults(func=rebuild_summaries)
+
+    export_parser = subparsers.add_parser("export", help="export transaksi/item ke CSV atau JSON Lines")
+    export_parser.add_argument("--kind", choices=exporter.EXPORT_KINDS, default="transactions")
+    export_parser.add_argument("--format", choices=exporter.EXPORT_FORMATS, default="csv")
+    export_parser.add_argument("--start", help="tanggal awal YYYY-MM-DD (inklusif)")
+    export_parser.add_argument("--end", help="tanggal akhir YYYY-MM-DD (inklusif)")
+    export_parser.add_argument("-o", "--output", default="-", help="file tujuan (default: stdout)")
+    export_parser.set_defaults(func=export)
+
+    report_parser = subparsers.add_parser("period-report", help="PDF laporan mingguan/bulanan/rentang")
+    report_parser.add_argument("--kind", choices=PERIOD_KINDS, default="month")
+    report_parser.add_argument("--date", default=date.today().isoformat(),
+                               help="tanggal dalam periode, atau tanggal awal untuk --kind range")
+    report_parser.add_argument("--end", help="tanggal akhir YYYY-MM-DD untuk --kind range")
+    report_parser.add_argument("--output-dir", default="receipts", help="folder tujuan PDF")
+    report_parser.set_defaults(func=period_report)
+
+    history_parser = subparsers.add_parser("generate-history",
+                                           help="isi database kosong dengan riwayat penjualan sintetis")
+    history_parser.add_argument("--years", type=float, default=1.0)
+    history_parser.add_argument("--sales-per-day", type=int, default=150)
+    history_parser.add_argument("--min-lines", type=int, default=1)
+    history_parser.add_argument("--max-lines", type=int, default=4)
+    history_parser.add_argument("--menu-size", type=int, default=None,
+                                help="ganti menu dengan N item sintetis (default: menu bawaan)")
+    history_parser.add_argument("--shape", choices=sorted(TRAFFIC_SHAPES), default="cafe")
+    history_parser.add_argument("--seed", type=int, default=42)
+    history_parser.set_defaults(func=generate)
+
+    archive_parser = subparsers.add_parser("archive", help="pindahkan bulan yang sudah tutup ke file arsip")
+    archive_parser.add_argument("--keep-months", type=int, default=1,
+                                help="bulan tutup terakhir yang tetap di database utama")
+    archive_parser.add_argument("--month", nargs="+", help="arsipkan bulan tertentu (YYYY-MM)")
+    archive_parser.add_argument("--vacuum", action="store_true", help="VACUUM database utama setelahnya")
+    archive_parser.add_argument("--list", action="store_true", help="tampilkan bulan yang sudah diarsipkan")
+    archive_parser.set_defaults(func=archive_months)
+
+    args = parser.parse_args()
+    db = Database(args.db)
+    try:
+        args.func(db, args)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+class MenuCatalog:
+    """Cache kategori dan menu di memori.
+
+    Data dimuat sekali lalu diindeks per id dan per kategori. Cache dianggap
+    basi jika catalog_version di database berubah (dinaikkan oleh trigger
+    pada menu_items/categories); ensure_fresh() memeriksanya sebelum dibaca.
+    """
+
+    def __init__(self, database):
+        self.db = database
+        self._version = None
+        self.categories = []
+        self._available_items = []
+        self._items_by_id = {}
+        self._items_by_category = {}
+
+    def load(self):
+        """Muat ulang seluruh katalog dari database"""
+        version = self.db.get_catalog_version()
+        categories = self.db.get_categories()
+        all_items = self.db.get_menu_items(include_unavailable=True)
+
+        # Urutan sama dengan Database.get_menu_items: kategori lalu nama menu
+        available_items = [item for item in all_items if item[5]]
+        items_by_category = {}
+        for item in available_items:
+            items_by_category.setdefault(item[3], []).append(item)
+
+        self.categories = categories
+        self._available_items = available_items
+        self._items_by_id = {item[0]: item for item in all_items}
+        self._items_by_category = items_by_category
+        self._version = version
+
+    @property
+    def version(self):
+        """catalog_version data yang sedang dimuat (None jika belum/basi)"""
+        return self._version
+
+    def ensure_fresh(self):
+        """Muat ulang bila cache basi. Mengembalikan True jika data dimuat ulang."""
+        if self._version is None or self.db.get_catalog_version() != self._version:
+            self.load()
+            return True
+        return False
+
+    def _ensure_loaded(self):
+        if self._version is None:
+            self.load()
+
+    def get_categories(self):
+        self._ensure_loaded()
+        return self.categories
+
+    def get_items(self, category_id=None):
+        """Menu yang tersedia, sama seperti Database.get_menu_items(category_id)"""
+        self._ensure_loaded()
+        if category_id:
+            return self._items_by_category.get(category_id, [])
+        return self._available_items
+
+    def get_item(self, item_id):
+        """Menu berdasarkan id (termasuk yang tidak tersedia), None jika tidak ada"""
+        self._ensure_loaded()
+        return self._items_by_id.get(item_id)
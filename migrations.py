@@ -0,0 +1,388 @@
+"""
+Migrasi skema cafe_pos.db berbasis PRAGMA user_version
+
+Setiap langkah punya nomor versi berurutan, dijalankan di dalam satu
+transaksi bersama penulisan user_version-nya, dan harus aman dijalankan
+ulang (IF NOT EXISTS / cek kolom) agar database lama tanpa user_version
+tetap bisa dimigrasi.
+"""
+
+import sqlite3
+
+
+def column_exists(cursor, table, column):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return any(row[1] == column for row in cursor.fetchall())
+
+
+def add_column(cursor, table, column, definition):
+    """ALTER TABLE ADD COLUMN yang idempotent"""
+    if not column_exists(cursor, table, column):
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+def _v1_base_tables(cursor):
+    """Tabel dasar aplikasi"""
+    # Tabel kategori
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Tabel menu
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS menu_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            price REAL NOT NULL,
+            category_id INTEGER,
+            description TEXT,
+            is_available BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (category_id) REFERENCES categories (id)
+        )
+    ''')
+
+    # Tabel transaksi
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS transactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            total_amount REAL NOT NULL,
+            tax_amount REAL DEFAULT 0,
+            discount_amount REAL DEFAULT 0,
+            final_amount REAL NOT NULL,
+            payment_method TEXT DEFAULT 'Cash',
+            customer_name TEXT,
+            cashier_name TEXT
+        )
+    ''')
+
+    # Tabel detail transaksi
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS transaction_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            transaction_id INTEGER,
+            menu_item_id INTEGER,
+            quantity INTEGER NOT NULL,
+            unit_price REAL NOT NULL,
+            total_price REAL NOT NULL,
+            notes TEXT,
+            FOREIGN KEY (transaction_id) REFERENCES transactions (id),
+            FOREIGN KEY (menu_item_id) REFERENCES menu_items (id)
+        )
+    ''')
+
+
+def _v2_report_indexes(cursor):
+    """Index sekunder untuk query laporan"""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_transactions_date
+        ON transactions (transaction_date)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_transaction_items_transaction
+        ON transaction_items (transaction_id)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_transaction_items_menu_item
+        ON transaction_items (menu_item_id)
+    ''')
+
+
+def rebuild_daily_sales_summary(cursor):
+    """Isi ulang daily_sales_summary dari seluruh riwayat transaksi"""
+    cursor.execute("DELETE FROM daily_sales_summary")
+    cursor.execute('''
+        INSERT INTO daily_sales_summary (sale_date, payment_method, transaction_count, total_sales)
+        SELECT DATE(transaction_date), COALESCE(payment_method, ''), COUNT(*), SUM(final_amount)
+        FROM transactions
+        GROUP BY DATE(transaction_date), COALESCE(payment_method, '')
+    ''')
+
+
+def _v3_daily_sales_summary(cursor):
+    """Rollup penjualan harian per metode pembayaran"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_sales_summary (
+            sale_date TEXT NOT NULL,
+            payment_method TEXT NOT NULL,
+            transaction_count INTEGER NOT NULL DEFAULT 0,
+            total_sales REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (sale_date, payment_method)
+        ) WITHOUT ROWID
+    ''')
+    rebuild_daily_sales_summary(cursor)
+
+
+def rebuild_item_daily_sales(cursor):
+    """Isi ulang item_daily_sales dari seluruh riwayat item transaksi.
+
+    Sejak v6 nama dan harga per hari diambil dari baris item terakhir hari itu.
+    """
+    cursor.execute("DELETE FROM item_daily_sales")
+    if not column_exists(cursor, "item_daily_sales", "item_name"):
+        # Skema v4/v5: kolom snapshot baru ditambahkan di v6
+        cursor.execute('''
+            INSERT INTO item_daily_sales (sale_date, menu_item_id, quantity, revenue)
+            SELECT DATE(t.transaction_date), ti.menu_item_id, SUM(ti.quantity), SUM(ti.total_price)
+            FROM transaction_items ti
+            JOIN transactions t ON ti.transaction_id = t.id
+            GROUP BY DATE(t.transaction_date), ti.menu_item_id
+        ''')
+        return
+    # MAX(ti.id) membuat kolom item_name/unit_price diambil dari baris terakhir
+    cursor.execute('''
+        INSERT INTO item_daily_sales (sale_date, menu_item_id, quantity, revenue, item_name, unit_price)
+        SELECT sale_date, menu_item_id, quantity, revenue, item_name, unit_price
+        FROM (
+            SELECT DATE(t.transaction_date) AS sale_date, ti.menu_item_id AS menu_item_id,
+                   SUM(ti.quantity) AS quantity, SUM(ti.total_price) AS revenue,
+                   MAX(ti.id), ti.item_name AS item_name, ti.unit_price AS unit_price
+            FROM transaction_items ti
+            JOIN transactions t ON ti.transaction_id = t.id
+            GROUP BY DATE(t.transaction_date), ti.menu_item_id
+        )
+    ''')
+
+
+def _v4_item_daily_sales(cursor):
+    """Rollup penjualan per item per hari"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS item_daily_sales (
+            sale_date TEXT NOT NULL,
+            menu_item_id INTEGER NOT NULL,
+            quantity INTEGER NOT NULL DEFAULT 0,
+            revenue REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (sale_date, menu_item_id)
+        ) WITHOUT ROWID
+    ''')
+    rebuild_item_daily_sales(cursor)
+
+
+def _v5_catalog_version(cursor):
+    """Versi katalog yang dinaikkan trigger setiap menu/kategori berubah"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS catalog_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute("INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 1)")
+    create_catalog_triggers(cursor)
+
+
+def create_catalog_triggers(cursor):
+    """Trigger yang menaikkan catalog_version pada perubahan menu/kategori"""
+    for table in ("menu_items", "categories"):
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_catalog_version
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+                END
+            ''')
+
+
+def _v6_line_item_snapshots(cursor):
+    """Snapshot nama item dan kategori saat penjualan di transaction_items"""
+    add_column(cursor, "transaction_items", "item_name", "TEXT")
+    add_column(cursor, "transaction_items", "category_name", "TEXT")
+    cursor.execute('''
+        UPDATE transaction_items SET
+            item_name = (SELECT m.name FROM menu_items m
+                         WHERE m.id = transaction_items.menu_item_id),
+            category_name = (SELECT c.name FROM menu_items m
+                             JOIN categories c ON m.category_id = c.id
+                             WHERE m.id = transaction_items.menu_item_id)
+        WHERE item_name IS NULL
+    ''')
+    add_column(cursor, "item_daily_sales", "item_name", "TEXT")
+    add_column(cursor, "item_daily_sales", "unit_price", "REAL")
+    rebuild_item_daily_sales(cursor)
+
+
+def rebuild_table(cursor, table, create_sql, select_sql):
+    """Ganti tabel dengan skema baru: buat {table}_new, salin, drop, rename.
+
+    create_sql memakai placeholder {table}; select_sql membaca dari tabel
+    lama dengan urutan kolom sesuai skema baru. Index dan trigger pada tabel
+    lama ikut terhapus dan harus dibuat ulang oleh pemanggil.
+    """
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+    sequence = cursor.fetchone()
+    cursor.execute(create_sql.format(table=f"{table}_new"))
+    cursor.execute(f"INSERT INTO {table}_new {select_sql}")
+    cursor.execute(f"DROP TABLE {table}")
+    cursor.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    if sequence:
+        # AUTOINCREMENT tidak boleh memakai ulang id yang pernah dihapus
+        cursor.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?",
+                       (sequence[0], table))
+
+
+def _v7_integer_rupiah(cursor):
+    """Nominal uang sebagai INTEGER rupiah (sebelumnya REAL)"""
+    rupiah = "CAST(ROUND({}) AS INTEGER)".format
+
+    rebuild_table(cursor, "menu_items", '''
+        CREATE TABLE {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            price INTEGER NOT NULL,
+            category_id INTEGER,
+            description TEXT,
+            is_available BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (category_id) REFERENCES categories (id)
+        )
+    ''', f'''
+        SELECT id, name, {rupiah("price")}, category_id, description, is_available, created_at
+        FROM menu_items
+    ''')
+
+    rebuild_table(cursor, "transactions", '''
+        CREATE TABLE {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            total_amount INTEGER NOT NULL,
+            tax_amount INTEGER DEFAULT 0,
+            discount_amount INTEGER DEFAULT 0,
+            final_amount INTEGER NOT NULL,
+            payment_method TEXT DEFAULT 'Cash',
+            customer_name TEXT,
+            cashier_name TEXT
+        )
+    ''', f'''
+        SELECT id, transaction_date, {rupiah("total_amount")}, {rupiah("tax_amount")},
+               {rupiah("discount_amount")}, {rupiah("final_amount")},
+               payment_method, customer_name, cashier_name
+        FROM transactions
+    ''')
+
+    rebuild_table(cursor, "transaction_items", '''
+        CREATE TABLE {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            transaction_id INTEGER,
+            menu_item_id INTEGER,
+            quantity INTEGER NOT NULL,
+            unit_price INTEGER NOT NULL,
+            total_price INTEGER NOT NULL,
+            notes TEXT,
+            item_name TEXT,
+            category_name TEXT,
+            FOREIGN KEY (transaction_id) REFERENCES transactions (id),
+            FOREIGN KEY (menu_item_id) REFERENCES menu_items (id)
+        )
+    ''', f'''
+        SELECT id, transaction_id, menu_item_id, quantity, {rupiah("unit_price")},
+               {rupiah("total_price")}, notes, item_name, category_name
+        FROM transaction_items
+    ''')
+
+    # Index dan trigger ikut terhapus bersama tabel lama
+    _v2_report_indexes(cursor)
+    create_catalog_triggers(cursor)
+    cursor.execute("UPDATE catalog_version SET version = version + 1 WHERE id = 1")
+
+    # Rollup dibangun ulang dari data yang sudah dibulatkan
+    cursor.execute("DROP TABLE daily_sales_summary")
+    cursor.execute('''
+        CREATE TABLE daily_sales_summary (
+            sale_date TEXT NOT NULL,
+            payment_method TEXT NOT NULL,
+            transaction_count INTEGER NOT NULL DEFAULT 0,
+            total_sales INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (sale_date, payment_method)
+        ) WITHOUT ROWID
+    ''')
+    rebuild_daily_sales_summary(cursor)
+
+    cursor.execute("DROP TABLE item_daily_sales")
+    cursor.execute('''
+        CREATE TABLE item_daily_sales (
+            sale_date TEXT NOT NULL,
+            menu_item_id INTEGER NOT NULL,
+            quantity INTEGER NOT NULL DEFAULT 0,
+            revenue INTEGER NOT NULL DEFAULT 0,
+            item_name TEXT,
+            unit_price INTEGER,
+            PRIMARY KEY (sale_date, menu_item_id)
+        ) WITHOUT ROWID
+    ''')
+    rebuild_item_daily_sales(cursor)
+
+
+def _v8_sale_key(cursor):
+    """Kunci idempotensi dari till (lihat sale_journal.py)"""
+    add_column(cursor, "transactions", "sale_key", "TEXT")
+    # Partial index: transaksi lama dan create_transaction() tidak punya sale_key
+    cursor.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_transactions_sale_key
+        ON transactions (sale_key) WHERE sale_key IS NOT NULL
+    ''')
+
+
+def _v9_archived_months(cursor):
+    """Bulan yang transaksinya sudah dipindah ke file arsip (lihat archive.py)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS archived_months (
+            month TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            transaction_count INTEGER NOT NULL,
+            min_id INTEGER,
+            max_id INTEGER,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+
+# (versi, deskripsi, fungsi) -- tambahkan langkah baru di akhir, jangan ubah yang lama
+MIGRATIONS = [
+    (1, "Tabel dasar", _v1_base_tables),
+    (2, "Index laporan", _v2_report_indexes),
+    (3, "Rollup penjualan harian", _v3_daily_sales_summary),
+    (4, "Rollup penjualan item harian", _v4_item_daily_sales),
+    (5, "Versi katalog menu", _v5_catalog_version),
+    (6, "Snapshot nama item transaksi", _v6_line_item_snapshots),
+    (7, "Nominal rupiah INTEGER", _v7_integer_rupiah),
+    (8, "Kunci idempotensi penjualan", _v8_sale_key),
+    (9, "Daftar arsip bulanan", _v9_archived_months),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """Jalankan semua migrasi yang belum diterapkan, kembalikan versi skema.
+
+    Jika skema sudah terbaru, biayanya hanya satu pembacaan PRAGMA.
+    """
+    if get_version(conn) >= SCHEMA_VERSION:
+        return SCHEMA_VERSION
+
+    for version, description, step in MIGRATIONS:
+        cursor = conn.cursor()
+        # BEGIN IMMEDIATE mengunci penulisan sehingga dua kasir yang start
+        # bersamaan tidak menjalankan langkah yang sama dua kali
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            if get_version(conn) >= version:
+                conn.rollback()
+                continue
+            step(cursor)
+            cursor.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.DatabaseError(
+                f"Migrasi skema v{version} ({description}) gagal: {e}") from e
+    return get_version(conn)
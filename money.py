@@ -0,0 +1,33 @@
+"""
+Uang dalam rupiah bulat (int) dan satu kebijakan pajak/pembulatan
+
+Semua nominal disimpan dan dihitung sebagai int (rupiah tidak memakai
+satuan sen). Pajak dihitung dari subtotal dengan pembulatan setengah ke
+atas, sama untuk tampilan keranjang, checkout, struk dan laporan.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+TAX_PERCENT = 10
+TAX_LABEL = f"Pajak ({TAX_PERCENT}%)"
+
+
+def to_rupiah(value):
+    """Bulatkan nilai (int/float/str/Decimal) ke rupiah, setengah ke atas"""
+    if isinstance(value, int):
+        return value
+    return int(Decimal(str(value)).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def tax_for(subtotal):
+    """Pajak untuk subtotal (int, >= 0) dengan pembulatan setengah ke atas"""
+    return (subtotal * TAX_PERCENT + 50) // 100
+
+
+def format_rupiah(amount):
+    """'Rp 12,345'; None ditampilkan sebagai Rp 0"""
+    if amount is None:
+        return "Rp 0"
+    if not isinstance(amount, int):
+        amount = to_rupiah(amount)
+    return f"Rp {amount:,}"
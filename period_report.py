@@ -0,0 +1,188 @@
+"""
+Laporan penjualan periode (mingguan, bulanan, rentang bebas) dalam PDF
+
+Ringkasan, rincian per hari, per metode bayar dan per item diambil dari
+tabel rollup. Daftar transaksi dibaca bertahap dari cursor
+(Database.iter_transactions) dan langsung digambar ke canvas halaman demi
+halaman, sehingga baris transaksi tidak pernah dikumpulkan di memori.
+"""
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.pdfgen import canvas
+from datetime import datetime, timedelta
+import os
+
+from money import format_rupiah
+
+PERIOD_KINDS = ("week", "month", "range")
+PERIOD_TITLES = {"week": "MINGGUAN", "month": "BULANAN", "range": "PERIODE"}
+
+
+def period_bounds(kind, day, end_day=None):
+    """Tanggal awal dan akhir (date, inklusif) untuk minggu/bulan yang memuat day"""
+    if kind == "week":
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=6)
+    if kind == "month":
+        start = day.replace(day=1)
+        next_month = (start + timedelta(days=32)).replace(day=1)
+        return start, next_month - timedelta(days=1)
+    if kind == "range":
+        if end_day is None or end_day < day:
+            raise ValueError("Rentang tanggal tidak valid")
+        return day, end_day
+    raise ValueError(f"Jenis periode tidak dikenal: {kind}")
+
+
+class PeriodReport:
+    """Menggambar laporan periode langsung ke canvas reportlab"""
+
+    PAGE_WIDTH, PAGE_HEIGHT = A4
+    MARGIN = 1.5*cm
+    ROW_HEIGHT = 13
+    FONT = "Helvetica"
+    FONT_BOLD = "Helvetica-Bold"
+
+    # (judul, lebar kolom dalam cm, rata kanan)
+    TRANSACTION_COLUMNS = [
+        ("ID", 1.6, False), ("Tanggal", 3.0, False), ("Pelanggan", 3.4, False),
+        ("Metode", 2.2, False), ("Subtotal", 2.6, True), ("Pajak", 2.2, True), ("Total", 3.0, True),
+    ]
+
+    def __init__(self, database, receipts_dir="receipts"):
+        self.db = database
+        self.receipts_dir = receipts_dir
+        if not os.path.exists(self.receipts_dir):
+            os.makedirs(self.receipts_dir)
+
+    def generate(self, kind, start_date, end_date):
+        """Buat PDF untuk rentang 'YYYY-MM-DD' (inklusif); mengembalikan path file"""
+        filename = f"{kind}_report_{start_date.replace('-', '')}_{end_date.replace('-', '')}.pdf"
+        filepath = os.path.join(self.receipts_dir, filename)
+
+        self.canvas = canvas.Canvas(filepath, pagesize=A4, pageCompression=1)
+        self.canvas.setTitle(f"Laporan Penjualan {start_date} - {end_date}")
+        self.page_number = 0
+        self.period_text = f"{self._format_date(start_date)} - {self._format_date(end_date)}"
+        self._new_page()
+
+        self._draw_title(PERIOD_TITLES[kind])
+        by_day = self.db.get_sales_by_day(start_date, end_date)
+        self._draw_summary(by_day)
+        self._draw_table("PENJUALAN PER HARI",
+                         [("Tanggal", 6, False), ("Transaksi", 4, True), ("Penjualan", 5, True)],
+                         ((self._format_date(day), str(count), format_rupiah(total))
+                          for day, count, total in by_day))
+        self._draw_table("PER METODE PEMBAYARAN",
+                         [("Metode", 6, False), ("Transaksi", 4, True), ("Penjualan", 5, True)],
+                         ((method or "-", str(count), format_rupiah(total))
+                          for method, count, total in self.db.get_sales_by_payment_method(start_date, end_date)))
+        self._draw_table("PENJUALAN PER ITEM",
+                         [("Item", 8, False), ("Harga", 3, True), ("Terjual", 2, True), ("Pendapatan", 3, True)],
+                         ((name, format_rupiah(price), str(quantity), format_rupiah(revenue))
+                          for name, price, quantity, revenue
+                          in self.db.iter_popular_items(start_date, end_date, limit=None)))
+        self._draw_table("DAFTAR TRANSAKSI", self.TRANSACTION_COLUMNS,
+                         (self._transaction_cells(row)
+                          for row in self.db.iter_transactions(start_date, end_date, newest_first=False)))
+
+        self.canvas.save()
+        self.canvas = None
+        return filepath
+
+    def _format_date(self, value):
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%d/%m/%Y")
+
+    def _transaction_cells(self, row):
+        return (f"#{row[0]}", row[1][:16], (row[7] or "-")[:22], row[6] or "-",
+                format_rupiah(row[2]), format_rupiah(row[3]), format_rupiah(row[5]))
+
+    def _new_page(self):
+        if self.page_number:
+            self.canvas.showPage()
+        self.page_number += 1
+        c = self.canvas
+        c.setFont(self.FONT, 8)
+        c.setFillColor(colors.HexColor('#7f8c8d'))
+        c.drawString(self.MARGIN, self.MARGIN / 2, f"Laporan Penjualan {self.period_text}")
+        c.drawRightString(self.PAGE_WIDTH - self.MARGIN, self.MARGIN / 2, f"Halaman {self.page_number}")
+        c.setFillColor(colors.black)
+        self.y = self.PAGE_HEIGHT - self.MARGIN
+
+    def _ensure_space(self, height):
+        if self.y - height < self.MARGIN:
+            self._new_page()
+            return True
+        return False
+
+    def _draw_title(self, period_title):
+        c = self.canvas
+        c.setFont(self.FONT_BOLD, 18)
+        c.setFillColor(colors.HexColor('#2c3e50'))
+        c.drawCentredString(self.PAGE_WIDTH / 2, self.y - 18, f"LAPORAN PENJUALAN {period_title}")
+        c.setFont(self.FONT, 12)
+        c.setFillColor(colors.black)
+        c.drawCentredString(self.PAGE_WIDTH / 2, self.y - 38, self.period_text)
+        self.y -= 60
+
+    def _draw_summary(self, by_day):
+        transaction_count = sum(count for _, count, _ in by_day)
+        total_sales = sum(total for _, _, total in by_day)
+        average = (total_sales * 2 + transaction_count) // (transaction_count * 2) if transaction_count else 0
+        self._draw_table("RINGKASAN", [("", 8, False), ("", 7, True)], [
+            ("Total Transaksi", str(transaction_count)),
+            ("Total Penjualan", format_rupiah(total_sales)),
+            ("Rata-rata per Transaksi", format_rupiah(average)),
+            ("Hari dengan Penjualan", str(len(by_day))),
+        ], header=False)
+
+    def _draw_table(self, title, columns, rows, header=True):
+        """Gambar judul bagian dan tabel; header kolom diulang di setiap halaman baru"""
+        self._ensure_space(3 * self.ROW_HEIGHT + 12)
+        c = self.canvas
+        c.setFont(self.FONT_BOLD, 12)
+        c.drawString(self.MARGIN, self.y - 12, title)
+        self.y -= 20
+
+        # Posisi x tiap kolom: kiri untuk teks, kanan untuk angka
+        positions = []
+        x = self.MARGIN
+        for _, width, right in columns:
+            positions.append((x + width*cm - 4, True) if right else (x + 2, False))
+            x += width*cm
+        table_right = x
+
+        def draw_header():
+            c.setFillColor(colors.HexColor('#3498db'))
+            c.rect(self.MARGIN, self.y - self.ROW_HEIGHT, table_right - self.MARGIN, self.ROW_HEIGHT,
+                   stroke=0, fill=1)
+            c.setFillColor(colors.white)
+            self._draw_cells([name for name, _, _ in columns], positions, self.FONT_BOLD)
+            c.setFillColor(colors.black)
+
+        if header:
+            draw_header()
+        count = 0
+        for cells in rows:
+            if self._ensure_space(self.ROW_HEIGHT) and header:
+                draw_header()
+            self._draw_cells(cells, positions, self.FONT)
+            count += 1
+        if not count:
+            c.setFont(self.FONT, 9)
+            c.drawString(self.MARGIN + 2, self.y - 10, "Tidak ada data")
+            self.y -= self.ROW_HEIGHT
+        self.y -= 16
+
+    def _draw_cells(self, cells, positions, font):
+        c = self.canvas
+        c.setFont(font, 9)
+        baseline = self.y - 10
+        for text, (x, right) in zip(cells, positions):
+            if right:
+                c.drawRightString(x, baseline, text)
+            else:
+                c.drawString(x, baseline, text)
+        self.y -= self.ROW_HEIGHT
@@ -0,0 +1,376 @@
+"""
+Client untuk pos_server.py dengan interface yang sama seperti Database
+
+RemoteDatabase bisa dipakai MainWindow, ReportsWindow, ReceiptPrinter dan
+exporter tanpa perubahan. Satu socket dipakai bersama oleh semua thread
+(UI, query laporan, antrean struk, writer penjualan); setiap request
+menunggu jawabannya sendiri berdasarkan id, sehingga request dari thread
+berbeda berjalan bersamaan (pipelining). submit() memberi Future untuk
+mengirim banyak request dari satu thread tanpa menunggu.
+"""
+
+from concurrent.futures import Future
+from datetime import datetime
+import itertools
+import json
+import queue
+import socket
+import threading
+
+from pos_server import DEFAULT_PORT, HEADER, MAX_FRAME, encode
+from records import TransactionLine, TransactionRecord
+
+
+class RemoteError(Exception):
+    """Error yang dilaporkan server atau koneksi yang terputus.
+
+    kind berisi nama tipe exception di server (mis. "IntegrityError"), None
+    bila error berasal dari koneksi.
+    """
+
+    def __init__(self, message, kind=None):
+        super().__init__(message)
+        self.kind = kind
+
+
+def parse_address(address):
+    """'host:port', 'host' atau 'unix:/path/socket' -> (family, alamat socket)"""
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:"):]
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "")
+    return socket.AF_INET, (host or "127.0.0.1", int(port or DEFAULT_PORT))
+
+
+def _tuples(rows):
+    return [tuple(row) for row in rows]
+
+
+def _record(row):
+    if row is None:
+        return None
+    items = tuple(TransactionLine._make(line) for line in row[TransactionRecord.HEADER_FIELDS])
+    return TransactionRecord(row[0], datetime.fromisoformat(row[1]),
+                             *row[2:TransactionRecord.HEADER_FIELDS], items)
+
+
+class RemoteDatabase:
+    """Database lewat pos_server.
+
+    Bila koneksi putus (server restart, jaringan), request yang sedang
+    menunggu gagal dengan RemoteError dan request berikutnya membuka koneksi
+    baru. Penjualan lewat SaleWriter + jurnal otomatis dicoba ulang.
+    """
+
+    def __init__(self, address, token=None, timeout=30.0):
+        self.address = address
+        self.token = token
+        self.timeout = timeout
+        self.catalog_version = None
+        self._connect_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._listeners = []
+        self._sock = None
+        # id request -> Future (request biasa) atau queue.Queue (stream iter_*);
+        # dict baru untuk setiap koneksi
+        self._pending = {}
+        # None selama koneksi hidup; berisi alasan bila koneksi putus/belum dibuka
+        self._error = "Belum terhubung"
+        self._closed = False
+        self._ensure_connected()
+
+    # Transport
+    def _ensure_connected(self):
+        """Buka koneksi baru bila koneksi sebelumnya putus"""
+        if self._error is None:
+            return
+        with self._connect_lock:
+            if self._error is None:
+                return
+            if self._closed:
+                raise RemoteError(self._error)
+            try:
+                self._connect()
+            except OSError as e:
+                raise RemoteError(f"Tidak bisa terhubung ke server {self.address}: {e}") from e
+
+    def _connect(self):
+        family, sock_address = parse_address(self.address)
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(sock_address)
+            sock.settimeout(None)
+            if family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            sock.close()
+            raise
+        pending = {}
+        with self._pending_lock:
+            self._sock = sock
+            self._pending = pending
+        threading.Thread(target=self._read_loop, args=(sock, pending), name="pos-client", daemon=True).start()
+
+        # hello harus frame pertama; request lain baru boleh dikirim setelah _error = None
+        hello = Future()
+        with self._pending_lock:
+            request_id = next(self._ids)
+            pending[request_id] = hello
+        try:
+            self._send(sock, {"id": request_id, "method": "hello", "args": [], "kwargs": {"token": self.token}})
+            result = hello.result(self.timeout)
+        except Exception:
+            self._shutdown(sock)
+            raise
+        finally:
+            with self._pending_lock:
+                pending.pop(request_id, None)
+
+        changed = self.catalog_version is not None and result["catalog_version"] != self.catalog_version
+        self.catalog_version = result["catalog_version"]
+        with self._pending_lock:
+            if self._sock is sock and not self._closed:
+                self._error = None
+        if changed:
+            # Menu mungkin berubah selama koneksi putus
+            self._notify_listeners()
+
+    def _send(self, sock, message):
+        frame = encode(message)
+        with self._send_lock:
+            sock.sendall(frame)
+
+    def _register(self, handler):
+        """Daftarkan handler di koneksi aktif; (id request, socket, dict pending)"""
+        self._ensure_connected()
+        with self._pending_lock:
+            if self._error:
+                raise RemoteError(self._error)
+            request_id = next(self._ids)
+            self._pending[request_id] = handler
+            return request_id, self._sock, self._pending
+
+    def _request(self, method, args, kwargs):
+        future = Future()
+        request_id, sock, pending = self._register(future)
+        try:
+            self._send(sock, {"id": request_id, "method": method, "args": args, "kwargs": kwargs})
+        except OSError as e:
+            with self._pending_lock:
+                pending.pop(request_id, None)
+            raise RemoteError(f"Gagal mengirim ke server: {e}") from e
+        return request_id, future, pending
+
+    def submit(self, method, *args, **kwargs):
+        """Kirim request tanpa menunggu; mengembalikan Future berisi hasilnya"""
+        return self._request(method, args, kwargs)[1]
+
+    def _call(self, method, *args, **kwargs):
+        request_id, future, pending = self._request(method, args, kwargs)
+        try:
+            return future.result(self.timeout)
+        finally:
+            # Jawaban yang tidak pernah datang (timeout) tidak boleh menumpuk di pending
+            with self._pending_lock:
+                pending.pop(request_id, None)
+
+    def _iterate(self, method, *args, **kwargs):
+        """Generator baris dari method iter_* server, diterima per chunk"""
+        chunks = queue.Queue()
+        request_id, sock, pending = self._register(chunks)
+        finished = False
+        try:
+            self._send(sock, {"id": request_id, "method": method, "args": args, "kwargs": kwargs})
+            while True:
+                kind, value = chunks.get(timeout=self.timeout)
+                if kind == "chunk":
+                    yield from (tuple(row) for row in value)
+                elif kind == "error":
+                    finished = True
+                    raise RemoteError(value)
+                else:
+                    finished = True
+                    return
+        finally:
+            with self._pending_lock:
+                pending.pop(request_id, None)
+                alive = self._sock is sock and not self._error
+            if not finished and alive:
+                # Pemanggil berhenti lebih awal: hentikan pengiriman di server
+                try:
+                    self._send(sock, {"id": 0, "method": "cancel", "args": [request_id]})
+                except OSError:
+                    pass
+
+    def _read_loop(self, sock, pending):
+        stream = sock.makefile("rb")
+        try:
+            while True:
+                message = self._read_frame(stream)
+                if message is None:
+                    break
+                if "event" in message:
+                    self._on_event(message)
+                    continue
+                request_id = message.get("id")
+                with self._pending_lock:
+                    handler = pending.get(request_id)
+                    if isinstance(handler, Future) or "chunk" not in message:
+                        pending.pop(request_id, None)
+                if handler is None:
+                    continue
+                if isinstance(handler, Future):
+                    if "error" in message:
+                        handler.set_exception(RemoteError(message["error"], message.get("kind")))
+                    else:
+                        handler.set_result(message.get("result"))
+                elif "chunk" in message:
+                    handler.put(("chunk", message["chunk"]))
+                elif "error" in message:
+                    handler.put(("error", message["error"]))
+                else:
+                    handler.put(("done", None))
+        except (OSError, ValueError, RemoteError):
+            pass
+        finally:
+            stream.close()
+            self._fail_pending(sock, pending, "Koneksi ke server terputus")
+
+    @staticmethod
+    def _read_frame(stream):
+        header = stream.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return None
+        (length,) = HEADER.unpack(header)
+        if length > MAX_FRAME:
+            raise RemoteError(f"Frame terlalu besar: {length} byte")
+        body = stream.read(length)
+        if len(body) < length:
+            return None
+        return json.loads(body)
+
+    def _fail_pending(self, sock, pending, error):
+        """Gagalkan semua request milik satu koneksi; koneksi aktif ditandai putus"""
+        with self._pending_lock:
+            if self._sock is sock:
+                self._error = self._error or error
+                self._sock = None
+            handlers = list(pending.values())
+            pending.clear()
+        for handler in handlers:
+            if isinstance(handler, Future):
+                if not handler.done():
+                    handler.set_exception(RemoteError(error))
+            else:
+                handler.put(("error", error))
+
+    @staticmethod
+    def _shutdown(sock):
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+
+    def _on_event(self, message):
+        if message["event"] == "catalog":
+            self.catalog_version = message["version"]
+            self._notify_listeners()
+
+    def _notify_listeners(self):
+        for listener in list(self._listeners):
+            listener()
+
+    # Koneksi (sama seperti Database; tidak ada koneksi SQLite lokal)
+    def get_connection(self):
+        return None
+
+    def release_connection(self):
+        pass
+
+    def close(self):
+        with self._connect_lock, self._pending_lock:
+            self._closed = True
+            self._error = "Koneksi ditutup"
+            sock, pending = self._sock, self._pending
+        if sock is not None:
+            self._fail_pending(sock, pending, "Koneksi ditutup")
+            self._shutdown(sock)
+
+    def add_catalog_listener(self, callback):
+        """callback() dipanggil (di thread pembaca socket) saat server melaporkan perubahan menu"""
+        self._listeners.append(callback)
+
+    # Katalog
+    def get_categories(self):
+        return _tuples(self._call("get_categories"))
+
+    def get_menu_items(self, category_id=None, include_unavailable=False):
+        return _tuples(self._call("get_menu_items", category_id, include_unavailable))
+
+    def get_menu_item_by_id(self, item_id):
+        row = self._call("get_menu_item_by_id", item_id)
+        return tuple(row) if row is not None else None
+
+    def get_catalog_version(self):
+        # Versi terbaru selalu dikirim server, tidak perlu round trip
+        return self.catalog_version
+
+    # Penjualan
+    def create_transaction(self, total_amount, tax_amount, discount_amount, final_amount,
+                           payment_method='Cash', customer_name='', cashier_name=''):
+        return self._call("create_transaction", total_amount, tax_amount, discount_amount, final_amount,
+                          payment_method, customer_name, cashier_name)
+
+    def add_transaction_item(self, transaction_id, menu_item_id, quantity, unit_price, total_price, notes='',
+                             item_name=None, category_name=None):
+        self._call("add_transaction_item", transaction_id, menu_item_id, quantity, unit_price, total_price,
+                   notes, item_name, category_name)
+
+    def record_sale(self, header, items):
+        return self._call("record_sale", header, items)
+
+    def record_sales(self, sales):
+        return self._call("record_sales", sales)
+
+    def rebuild_sales_summaries(self):
+        self._call("rebuild_sales_summaries")
+
+    # Laporan
+    def get_transactions(self, start_date=None, end_date=None):
+        return _tuples(self._call("get_transactions", start_date, end_date))
+
+    def iter_transactions(self, start_date=None, end_date=None, newest_first=True, chunk_size=None):
+        return self._iterate("iter_transactions", start_date, end_date, newest_first)
+
+    def iter_transaction_lines(self, start_date=None, end_date=None, chunk_size=None):
+        return self._iterate("iter_transaction_lines", start_date, end_date)
+
+    def get_transactions_page(self, start_date, end_date, after=None, limit=200):
+        return _tuples(self._call("get_transactions_page", start_date, end_date, after, limit))
+
+    def get_transaction_items(self, transaction_id):
+        return [TransactionLine._make(row) for row in self._call("get_transaction_items", transaction_id)]
+
+    def load_transaction(self, transaction_id):
+        return _record(self._call("load_transaction", transaction_id))
+
+    def load_transactions(self, transaction_ids):
+        return [_record(row) for row in self._call("load_transactions", list(transaction_ids))]
+
+    def get_daily_sales(self, date):
+        return tuple(self._call("get_daily_sales", date))
+
+    def get_sales_by_day(self, start_date, end_date):
+        return _tuples(self._call("get_sales_by_day", start_date, end_date))
+
+    def get_sales_by_payment_method(self, start_date, end_date):
+        return _tuples(self._call("get_sales_by_payment_method", start_date, end_date))
+
+    def get_popular_items(self, start_date=None, end_date=None, limit=10):
+        return _tuples(self._call("get_popular_items", start_date, end_date, limit))
+
+    def iter_popular_items(self, start_date=None, end_date=None, limit=10, chunk_size=None):
+        return self._iterate("iter_popular_items", start_date, end_date, limit)
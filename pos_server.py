@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Server sinkronisasi Cafe POS: satu proses memegang cafe_pos.db, till lain
+memakai pos_client.RemoteDatabase lewat TCP atau Unix socket.
+
+Protokol: setiap frame = panjang 4 byte (big-endian) + JSON UTF-8.
+
+    request : {"id": 7, "method": "record_sale", "args": [...], "kwargs": {...}}
+    response: {"id": 7, "result": ...}  atau  {"id": 7, "error": "pesan", "kind": "ValueError"}
+    stream  : {"id": 7, "chunk": [...]} berulang, diakhiri {"id": 7, "result": null}
+    push    : {"event": "catalog", "version": 12}
+
+Frame pertama dari client harus method "hello" (dengan token bila server
+memakai --token). Request diproses bersamaan dan dijawab sesuai id, jadi
+client boleh mengirim banyak request tanpa menunggu jawaban (pipelining).
+Query baca berjalan di thread pool, penulisan di satu thread writer.
+
+Contoh:
+    python pos_server.py --db cafe_pos.db --host 0.0.0.0 --port 8765 --token rahasia
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import struct
+import sys
+import threading
+
+from database import Database
+
+HEADER = struct.Struct(">I")
+MAX_FRAME = 16 * 1024 * 1024
+DEFAULT_PORT = 8765
+# Baris per frame untuk method iter_*
+STREAM_CHUNK = 500
+# Request yang boleh diproses bersamaan per koneksi sebelum server berhenti membaca
+MAX_IN_FLIGHT = 64
+
+READ_METHODS = {
+    "get_categories", "get_menu_items", "get_menu_item_by_id", "get_catalog_version",
+    "get_transactions", "get_transactions_page", "get_transaction_items",
+    "load_transaction", "load_transactions", "get_daily_sales", "get_sales_by_day",
+    "get_sales_by_payment_method", "get_popular_items",
+}
+WRITE_METHODS = {
+    "record_sale", "record_sales", "create_transaction", "add_transaction_item",
+    "rebuild_sales_summaries",
+}
+STREAM_METHODS = {"iter_transactions", "iter_transaction_lines", "iter_popular_items"}
+
+
+def encode(message):
+    def default(value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"Tidak bisa dikirim: {type(value).__name__}")
+    body = json.dumps(message, default=default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader):
+    """Baca satu frame; None bila koneksi ditutup"""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"Frame terlalu besar: {length} byte")
+    return json.loads(await reader.readexactly(length))
+
+
+class Connection:
+    """Satu client yang terhubung; penulisan frame diserialkan dengan lock"""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.lock = asyncio.Lock()
+        self.streams = {}
+        self.closed = False
+
+    async def send(self, message):
+        if self.closed:
+            return
+        try:
+            async with self.lock:
+                self.writer.write(encode(message))
+                await self.writer.drain()
+        except (ConnectionError, RuntimeError):
+            self.closed = True
+
+
+class PosServer:
+    def __init__(self, database, token=None, poll_interval=1.0, read_workers=4):
+        self.db = database
+        self.token = token
+        self.poll_interval = poll_interval
+        self.readers = ThreadPoolExecutor(read_workers, thread_name_prefix="pos-read")
+        self.writer = ThreadPoolExecutor(1, thread_name_prefix="pos-write")
+        self.connections = set()
+        self.catalog_version = None
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT, path=None, ready=None):
+        """Jalankan server sampai dibatalkan; ready(alamat) dipanggil setelah listen"""
+        if path:
+            server = await asyncio.start_unix_server(self.handle_client, path=path)
+            address = path
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+            address = "%s:%d" % server.sockets[0].getsockname()[:2]
+        loop = asyncio.get_running_loop()
+        self.catalog_version = await loop.run_in_executor(self.readers, self.db.get_catalog_version)
+        watcher = asyncio.create_task(self.watch_catalog())
+        if ready:
+            ready(address)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+            self.readers.shutdown()
+            self.writer.shutdown()
+
+    async def watch_catalog(self):
+        """Kirim notifikasi ke semua client saat catalog_version berubah"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            version = await loop.run_in_executor(self.readers, self.db.get_catalog_version)
+            if version != self.catalog_version:
+                self.catalog_version = version
+                for connection in list(self.connections):
+                    await connection.send({"event": "catalog", "version": version})
+
+    async def handle_client(self, reader, writer):
+        connection = Connection(writer)
+        slots = asyncio.Semaphore(MAX_IN_FLIGHT)
+        tasks = set()
+        try:
+            hello = await read_frame(reader)
+            if not hello or hello.get("method") != "hello":
+                return
+            if self.token and hello.get("kwargs", {}).get("token") != self.token:
+                await connection.send({"id": hello.get("id"), "error": "Token tidak valid"})
+                return
+            await connection.send({"id": hello.get("id"), "result": {"catalog_version": self.catalog_version}})
+            self.connections.add(connection)
+
+            while not connection.closed:
+                message = await read_frame(reader)
+                if message is None:
+                    break
+                await slots.acquire()
+                task = asyncio.create_task(self.dispatch(connection, message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(lambda _: slots.release())
+        except (ConnectionError, ValueError, json.JSONDecodeError):
+            pass
+        finally:
+            self.connections.discard(connection)
+            connection.closed = True
+            for cancelled in connection.streams.values():
+                cancelled.set()
+            for task in list(tasks):
+                task.cancel()
+            writer.close()
+
+    async def dispatch(self, connection, message):
+        request_id = message.get("id")
+        method = message.get("method")
+        args = message.get("args", [])
+        kwargs = message.get("kwargs", {})
+        loop = asyncio.get_running_loop()
+        try:
+            if method == "cancel":
+                cancelled = connection.streams.get(args[0])
+                if cancelled:
+                    cancelled.set()
+                result = None
+            elif method in STREAM_METHODS:
+                await self.stream(connection, request_id, getattr(self.db, method), args, kwargs)
+                result = None
+            elif method in READ_METHODS:
+                result = await loop.run_in_executor(
+                    self.readers, lambda: getattr(self.db, method)(*args, **kwargs))
+            elif method in WRITE_METHODS:
+                result = await loop.run_in_executor(
+                    self.writer, lambda: getattr(self.db, method)(*args, **kwargs))
+            else:
+                raise ValueError(f"Method tidak dikenal: {method}")
+        except Exception as e:
+            # kind: nama tipe exception, agar client bisa membedakan data ditolak vs database sibuk
+            await connection.send({"id": request_id, "error": str(e), "kind": type(e).__name__})
+        else:
+            await connection.send({"id": request_id, "result": result})
+
+    async def stream(self, connection, request_id, func, args, kwargs):
+        """Kirim hasil generator iter_* per chunk tanpa mengumpulkan semua baris"""
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue(maxsize=4)
+        cancelled = threading.Event()
+        connection.streams[request_id] = cancelled
+
+        def put(chunk):
+            asyncio.run_coroutine_threadsafe(chunks.put(chunk), loop).result()
+
+        def produce():
+            rows = func(*args, **kwargs)
+            try:
+                chunk = []
+                for row in rows:
+                    chunk.append(row)
+                    if len(chunk) == STREAM_CHUNK:
+                        if cancelled.is_set():
+                            return
+                        put(chunk)
+                        chunk = []
+                if chunk and not cancelled.is_set():
+                    put(chunk)
+            finally:
+                rows.close()
+                put(None)
+
+        producer = loop.run_in_executor(self.readers, produce)
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+                await connection.send({"id": request_id, "chunk": chunk})
+                if connection.closed:
+                    cancelled.set()
+        finally:
+            connection.streams.pop(request_id, None)
+            # Pastikan producer tidak tertahan pada antrean penuh
+            cancelled.set()
+            while not producer.done():
+                try:
+                    chunks.get_nowait()
+                except asyncio.QueueEmpty:
+                    await asyncio.sleep(0.01)
+        await producer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server sinkronisasi Cafe POS")
+    parser.add_argument("--db", default="cafe_pos.db", help="path file database")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0 = port bebas")
+    parser.add_argument("--unix", help="path Unix socket (menggantikan --host/--port)")
+    parser.add_argument("--token", help="token yang wajib dikirim client")
+    parser.add_argument("--poll-interval", type=float, default=1.0,
+                        help="detik antar pemeriksaan perubahan katalog")
+    args = parser.parse_args()
+
+    db = Database(args.db)
+    server = PosServer(db, token=args.token, poll_interval=args.poll_interval)
+
+    def ready(address):
+        print(f"Server Cafe POS siap di {address}", flush=True)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
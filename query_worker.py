@@ -0,0 +1,82 @@
+from PySide6.QtCore import QThread, Signal
+import queue
+import threading
+
+
+class QueryWorker(QThread):
+    """Thread database khusus untuk query laporan.
+
+    Query dikirim dengan submit(key, func, *args) dan hasilnya dikirim lewat
+    sinyal result_ready(key, request_id, result). Thread ini memakai koneksi
+    SQLite sendiri (koneksi per-thread dari Database). Request baru dengan key
+    yang sama membuat request lama basi: yang masih antre dilewati dan yang
+    sedang berjalan dihentikan dengan Connection.interrupt().
+    """
+
+    result_ready = Signal(str, int, object)
+    failed = Signal(str, int, str)
+
+    def __init__(self, database, parent=None):
+        super().__init__(parent)
+        self.db = database
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._latest = {}
+        self._running = None
+        self._conn = None
+        self._next_id = 0
+
+    def submit(self, key, func, *args):
+        """Antrekan func(*args); mengembalikan id request"""
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            self._latest[key] = request_id
+            if self._running is not None and self._running[0] == key and self._conn is not None:
+                self._conn.interrupt()
+        self._jobs.put((key, request_id, func, args))
+        return request_id
+
+    def is_current(self, key, request_id):
+        with self._lock:
+            return self._latest.get(key) == request_id
+
+    def stop(self):
+        """Hentikan thread setelah query yang sedang berjalan dibatalkan"""
+        if not self.isRunning():
+            return
+        with self._lock:
+            self._latest.clear()
+            if self._running is not None and self._conn is not None:
+                self._conn.interrupt()
+        self._jobs.put(None)
+        self.wait()
+
+    def run(self):
+        self._conn = self.db.get_connection()
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                key, request_id, func, args = job
+                with self._lock:
+                    if self._latest.get(key) != request_id:
+                        continue
+                    self._running = (key, request_id)
+                try:
+                    result = func(*args)
+                except Exception as e:
+                    # Query yang di-interrupt karena basi tidak perlu dilaporkan
+                    if self.is_current(key, request_id):
+                        self.failed.emit(key, request_id, str(e))
+                else:
+                    if self.is_current(key, request_id):
+                        self.result_ready.emit(key, request_id, result)
+                finally:
+                    with self._lock:
+                        self._running = None
+        finally:
+            with self._lock:
+                self._conn = None
+            self.db.release_connection()
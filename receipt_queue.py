@@ -0,0 +1,78 @@
+from PySide6.QtCore import QThread, Signal
+from collections import deque
+import queue
+import threading
+import time
+
+
+class ReceiptQueue(QThread):
+    """Antrean cetak struk yang dirender di thread latar belakang.
+
+    Checkout cukup memanggil submit(transaction_id) lalu langsung kembali ke
+    kasir. Struk dirender satu per satu sesuai urutan masuk; hasilnya dikirim
+    lewat sinyal rendered(transaction_id, filepath, detik) atau
+    failed(transaction_id, pesan). Thread ini memakai koneksi SQLite sendiri
+    (koneksi per-thread dari Database).
+    """
+
+    rendered = Signal(int, str, float)
+    failed = Signal(int, str)
+
+    def __init__(self, receipt_printer, parent=None, history=100):
+        super().__init__(parent)
+        self.receipt_printer = receipt_printer
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._depth = 0
+        # Waktu render per job: (transaction_id, detik), yang terbaru di akhir
+        self.render_times = deque(maxlen=history)
+
+    @property
+    def depth(self):
+        """Jumlah struk yang masih antre atau sedang dirender"""
+        with self._lock:
+            return self._depth
+
+    def submit(self, transaction_id):
+        """Antrekan struk untuk transaksi; mengembalikan kedalaman antrean"""
+        with self._lock:
+            self._depth += 1
+            depth = self._depth
+        self._jobs.put(transaction_id)
+        return depth
+
+    def average_render_time(self):
+        """Rata-rata waktu render dari job terakhir (detik), None jika belum ada"""
+        times = list(self.render_times)
+        if not times:
+            return None
+        return sum(seconds for _, seconds in times) / len(times)
+
+    def stop(self):
+        """Render semua struk yang masih antre lalu hentikan thread"""
+        if not self.isRunning():
+            return
+        self._jobs.put(None)
+        self.wait()
+
+    def run(self):
+        try:
+            while True:
+                transaction_id = self._jobs.get()
+                if transaction_id is None:
+                    break
+                started = time.perf_counter()
+                try:
+                    filepath = self.receipt_printer.generate_receipt(transaction_id)
+                except Exception as e:
+                    with self._lock:
+                        self._depth -= 1
+                    self.failed.emit(transaction_id, str(e))
+                else:
+                    seconds = time.perf_counter() - started
+                    self.render_times.append((transaction_id, seconds))
+                    with self._lock:
+                        self._depth -= 1
+                    self.rendered.emit(transaction_id, filepath, seconds)
+        finally:
+            self.receipt_printer.db.release_connection()
@@ -0,0 +1,30 @@
+from collections import namedtuple
+from datetime import datetime
+
+
+class TransactionLine(namedtuple('TransactionLine', [
+        'id', 'menu_item_id', 'quantity', 'unit_price', 'total_price', 'notes',
+        'item_name', 'category_name'])):
+    """Satu baris item transaksi"""
+    __slots__ = ()
+
+
+class TransactionRecord(namedtuple('TransactionRecord', [
+        'id', 'transaction_date', 'total_amount', 'tax_amount', 'discount_amount',
+        'final_amount', 'payment_method', 'customer_name', 'cashier_name', 'items'])):
+    """Header transaksi beserta baris itemnya (tuple TransactionLine)"""
+    __slots__ = ()
+
+    HEADER_FIELDS = 9
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Buat record dari baris hasil JOIN header + item milik satu transaksi.
+
+        Kolom 0-8 adalah header, sisanya kolom TransactionLine. Transaksi tanpa
+        item menghasilkan satu baris dengan kolom item NULL (LEFT JOIN).
+        """
+        head = rows[0]
+        split = cls.HEADER_FIELDS
+        items = tuple(TransactionLine._make(row[split:]) for row in rows if row[split] is not None)
+        return cls(head[0], datetime.fromisoformat(head[1]), *head[2:split], items)
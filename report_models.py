@@ -0,0 +1,115 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from datetime import datetime
+
+from money import format_rupiah
+
+
+class TransactionHistoryModel(QAbstractTableModel):
+    """Riwayat transaksi yang diambil per halaman saat view menggulir.
+
+    Halaman diambil dengan keyset pagination (Database.get_transactions_page)
+    lewat canFetchMore/fetchMore, dan teks sel diformat saat data() dipanggil
+    sehingga hanya baris yang terlihat yang diproses. Jika diberi QueryWorker,
+    halaman diambil di thread worker dan disisipkan saat hasilnya tiba.
+    """
+
+    HEADERS = ["ID", "Tanggal", "Pelanggan", "Total", "Pajak", "Final", "Metode Bayar"]
+    PAGE_SIZE = 200
+    QUERY_KEY = "history"
+
+    def __init__(self, database, worker=None, parent=None):
+        super().__init__(parent)
+        self.db = database
+        self.worker = worker
+        self.start_date = None
+        self.end_date = None
+        self._rows = []
+        self._has_more = False
+        self._pending = None
+        if worker is not None:
+            worker.result_ready.connect(self._on_page_loaded)
+            worker.failed.connect(self._on_page_failed)
+
+    def set_date_range(self, start_date, end_date):
+        """Ganti filter tanggal; halaman pertama diambil saat view memintanya"""
+        self.beginResetModel()
+        self.start_date = start_date
+        self.end_date = end_date
+        self._rows = []
+        self._has_more = True
+        self._pending = None
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and self._pending is None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        after = (self._rows[-1][1], self._rows[-1][0]) if self._rows else None
+        args = (self.start_date, self.end_date, after, self.PAGE_SIZE)
+        if self.worker is None:
+            self._append_page(self.db.get_transactions_page(*args))
+        else:
+            # Request baru dengan key yang sama membatalkan halaman dari filter lama
+            self._pending = self.worker.submit(self.QUERY_KEY, self.db.get_transactions_page, *args)
+
+    def _on_page_loaded(self, key, request_id, page):
+        if key != self.QUERY_KEY or request_id != self._pending:
+            return
+        self._pending = None
+        self._append_page(page)
+
+    def _on_page_failed(self, key, request_id, message):
+        if key == self.QUERY_KEY and request_id == self._pending:
+            self._pending = None
+            self._has_more = False
+
+    def _append_page(self, page):
+        self._has_more = len(page) == self.PAGE_SIZE
+        if not page:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            transaction = self._rows[index.row()]
+            if column == 0:
+                return str(transaction[0])
+            if column == 1:
+                # Date (safely parse, fallback if needed)
+                try:
+                    return datetime.fromisoformat(transaction[1]).strftime("%d/%m/%Y %H:%M")
+                except Exception:
+                    return str(transaction[1])
+            if column == 2:
+                return transaction[7] or "-"
+            if column == 3:
+                return format_rupiah(transaction[2])
+            if column == 4:
+                return format_rupiah(transaction[3])
+            if column == 5:
+                return format_rupiah(transaction[5])
+            if column == 6:
+                return transaction[6] or "-"
+        elif role == Qt.TextAlignmentRole and column in (3, 4, 5):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
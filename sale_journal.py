@@ -0,0 +1,185 @@
+"""
+Jurnal penjualan lokal: file append-only yang ditulis saat checkout
+
+Setiap penjualan ditambahkan ke file sebagai satu record lalu di-fsync,
+sehingga checkout cukup menunggu satu append kecil, bukan commit SQLite.
+SaleWriter memindahkan isi jurnal ke database di latar belakang dan
+menghapus entri yang sudah tersimpan.
+
+Format record: panjang payload (4 byte) + CRC32 payload (4 byte), keduanya
+big-endian, diikuti payload JSON {"header": {...}, "items": [...]}.
+Record terakhir yang terpotong (listrik padam di tengah append) terdeteksi
+lewat panjang/CRC dan dibuang saat jurnal dibuka; record sebelumnya utuh
+karena sudah di-fsync sebelum checkout selesai.
+
+Setiap header membawa sale_key unik dari till (new_sale_key()), sehingga
+entri yang dikirim ulang setelah crash tidak menggandakan transaksi
+(lihat Database._insert_sale).
+
+Satu jurnal hanya untuk satu till: selama dibuka, file <jurnal>.lock dikunci
+eksklusif (flock/msvcrt) dan till kedua yang membuka path yang sama ditolak.
+"""
+
+import json
+import os
+import struct
+import threading
+import uuid
+import zlib
+
+RECORD_HEADER = struct.Struct(">II")
+# Record lebih besar dari ini dianggap rusak, bukan penjualan
+MAX_RECORD = 4 * 1024 * 1024
+
+
+class JournalLockedError(Exception):
+    """Jurnal sedang dibuka proses (till) lain"""
+
+
+def _lock_exclusive(f):
+    """Kunci file tanpa menunggu; OSError bila sudah dikunci proses lain"""
+    if os.name == "nt":
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def new_sale_key():
+    """Kunci idempotensi penjualan yang dibuat till saat checkout"""
+    return uuid.uuid4().hex
+
+
+def encode_record(header, items):
+    payload = json.dumps({"header": header, "items": items}, separators=(",", ":"),
+                         ensure_ascii=False).encode("utf-8")
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _fsync_directory(path):
+    """fsync folder agar pembuatan/penggantian file ikut tahan listrik padam (POSIX)"""
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def scan(path):
+    """Baca semua record utuh; mengembalikan (list (header, items), offset akhir record utuh)"""
+    entries = []
+    offset = 0
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return entries, 0
+    while offset + RECORD_HEADER.size <= len(data):
+        length, checksum = RECORD_HEADER.unpack_from(data, offset)
+        start = offset + RECORD_HEADER.size
+        payload = data[start:start + length]
+        if length > MAX_RECORD or len(payload) < length or zlib.crc32(payload) != checksum:
+            break
+        try:
+            record = json.loads(payload)
+        except ValueError:
+            break
+        entries.append((record["header"], record["items"]))
+        offset = start + length
+    return entries, offset
+
+
+class SaleJournal:
+    """Jurnal penjualan yang belum tersimpan di database (aman dipakai banyak thread)"""
+
+    def __init__(self, path, sync=True):
+        self.path = path
+        self.sync = sync
+        self._lock = threading.Lock()
+        # Lock di file terpisah karena remove() mengganti file jurnal dengan os.replace
+        self._lock_file = open(path + ".lock", "ab")
+        try:
+            _lock_exclusive(self._lock_file)
+        except OSError as e:
+            self._lock_file.close()
+            raise JournalLockedError(
+                f"Jurnal {path} sedang dipakai till lain; beri setiap till file jurnal sendiri "
+                f"lewat CAFE_POS_SALE_JOURNAL") from e
+        existed = os.path.exists(path)
+        entries, offset = scan(path)
+        self.truncated_bytes = (os.path.getsize(path) - offset) if existed else 0
+        # sale_key -> (header, items), urut sesuai checkout
+        self._pending = {header["sale_key"]: (header, items) for header, items in entries}
+        self._file = open(path, "ab")
+        if self.truncated_bytes:
+            self._file.truncate(offset)
+            self._sync()
+        if not existed:
+            _fsync_directory(path)
+
+    def _sync(self):
+        self._file.flush()
+        if self.sync:
+            # fdatasync cukup: yang penting isi dan panjang file, bukan mtime
+            getattr(os, "fdatasync", os.fsync)(self._file.fileno())
+
+    def append(self, header, items):
+        """Tulis penjualan ke jurnal; setelah kembali, penjualan tahan crash"""
+        record = encode_record(header, items)
+        with self._lock:
+            self._file.write(record)
+            self._sync()
+            self._pending[header["sale_key"]] = (header, items)
+
+    def pending_entries(self):
+        """Penjualan yang belum tersimpan di database, urut sesuai checkout"""
+        with self._lock:
+            return list(self._pending.values())
+
+    def is_pending(self, sale_key):
+        with self._lock:
+            return sale_key in self._pending
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pending)
+
+    def remove(self, sale_keys):
+        """Buang entri yang sudah di-commit ke database (atau ditolak database).
+
+        Bila jurnal kosong file cukup dipotong; bila masih ada entri (checkout
+        yang masuk selama flush), sisanya ditulis ke file baru lalu
+        menggantikan jurnal secara atomik dengan os.replace.
+        """
+        with self._lock:
+            for sale_key in sale_keys:
+                self._pending.pop(sale_key, None)
+            if not self._pending:
+                self._file.truncate(0)
+                self._sync()
+                return
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "wb") as f:
+                for header, items in self._pending.values():
+                    f.write(encode_record(header, items))
+                f.flush()
+                if self.sync:
+                    os.fsync(f.fileno())
+            # Windows tidak bisa mengganti file yang masih terbuka
+            self._file.close()
+            try:
+                os.replace(temp_path, self.path)
+            finally:
+                self._file = open(self.path, "ab")
+            if self.sync:
+                _fsync_directory(self.path)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+            # Menutup file melepas lock
+            self._lock_file.close()
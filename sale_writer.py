@@ -0,0 +1,190 @@
+from PySide6.QtCore import QThread, Signal
+from datetime import datetime, timezone
+import itertools
+import queue
+import sqlite3
+import threading
+
+from pos_client import RemoteError
+from sale_journal import new_sale_key
+
+
+class SaleWriter(QThread):
+    """Satu-satunya penulis penjualan dari UI, berjalan di thread latar belakang.
+
+    checkout memanggil submit(header, items) dan langsung kembali; penjualan
+    disimpan berurutan. Penjualan yang menumpuk selama commit sebelumnya
+    disimpan bersama dalam satu commit (maksimal max_batch). Hasilnya dikirim
+    lewat sinyal saved(token, transaction_id) atau failed(token, pesan).
+    Retry saat database dikunci till lain ditangani Database._write().
+
+    Dengan journal (sale_journal.SaleJournal), submit() baru kembali setelah
+    penjualan tercatat di jurnal lokal. Penjualan yang belum masuk database
+    tidak hilang: bila database tidak bisa ditulis, penyimpanan diulang
+    (sinyal delayed) dan saat aplikasi dibuka lagi sisa jurnal disimpan lebih
+    dulu (sinyal saved per penjualan agar struknya tetap dicetak, lalu
+    recovered). sale_key di setiap header mencegah penjualan tersimpan dua
+    kali. Penjualan yang ditolak database (juga lewat pos_server) atau terus
+    gagal karena error lain dibuang dari jurnal dan dilaporkan lewat failed.
+    """
+
+    saved = Signal(int, int)
+    failed = Signal(int, str)
+    delayed = Signal(str)
+    recovered = Signal(int)
+
+    # Error karena isi penjualan, bukan karena database sedang tidak bisa ditulis;
+    # penjualan seperti ini ditolak (failed) alih-alih diulang terus
+    REJECTED_ERRORS = (sqlite3.IntegrityError, KeyError, TypeError, ValueError)
+    # Database/server sedang tidak bisa ditulis (lock, disk, jaringan): penjualan
+    # menunggu di jurnal tanpa batas percobaan
+    UNAVAILABLE_ERRORS = (OSError, sqlite3.OperationalError)
+    # Error lain ditolak setelah sekian percobaan agar satu penjualan tidak
+    # menahan penjualan berikutnya selamanya
+    MAX_ATTEMPTS = 5
+    RETRY_DELAY = 1.0
+    MAX_RETRY_DELAY = 30.0
+
+    def __init__(self, database, parent=None, max_batch=20, journal=None):
+        super().__init__(parent)
+        self.db = database
+        self.max_batch = max_batch
+        self.journal = journal
+        self._jobs = queue.Queue()
+        self._tokens = itertools.count(1)
+        self._stop_requested = threading.Event()
+        # sale_key -> jumlah percobaan yang gagal karena error yang tidak dikenal
+        self._attempts = {}
+        # Sisa jurnal dari sesi sebelumnya; token sendiri agar saved (dan cetak struk) tetap dikirim
+        self._recovered = [(next(self._tokens), header, items)
+                           for header, items in journal.pending_entries()] if journal else []
+
+    def submit(self, header, items):
+        """Antrekan penjualan; mengembalikan token untuk mencocokkan sinyal saved/failed"""
+        header = dict(header)
+        header.setdefault('sale_key', new_sale_key())
+        # Waktu checkout, bukan waktu commit (bisa jauh lebih lambat bila database tertunda)
+        header.setdefault('transaction_date', datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'))
+        if self.journal is not None:
+            self.journal.append(header, items)
+        token = next(self._tokens)
+        self._jobs.put((token, header, items))
+        return token
+
+    def stop(self):
+        """Simpan semua penjualan yang masih antre lalu hentikan thread.
+
+        Bila database sedang tidak bisa ditulis, penjualan yang tersisa tetap
+        di jurnal dan disimpan saat aplikasi dibuka lagi.
+        """
+        if not self.isRunning():
+            return
+        self._stop_requested.set()
+        self._jobs.put(None)
+        self.wait()
+
+    def _next_batch(self):
+        """Job berikutnya ditambah job lain yang sudah antre; (batch, berhenti?)"""
+        job = self._jobs.get()
+        if job is None:
+            return [], True
+        batch = [job]
+        while len(batch) < self.max_batch:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                return batch, True
+            batch.append(job)
+        return batch, False
+
+    def _save(self, batch):
+        """Simpan batch; dengan jurnal diulang sampai berhasil.
+
+        Mengembalikan False bila thread dihentikan sebelum batch tersimpan.
+        """
+        if self.journal is None:
+            self._write_batch(batch)
+            return True
+        delay = self.RETRY_DELAY
+        while True:
+            try:
+                self._write_batch(batch)
+                return True
+            except Exception as e:
+                self.delayed.emit(str(e))
+            if self._stop_requested.wait(delay):
+                return False
+            delay = min(delay * 2, self.MAX_RETRY_DELAY)
+            # Penjualan yang sudah tersimpan sebelum error tidak dikirim ulang
+            batch = [job for job in batch if self.journal.is_pending(job[1]['sale_key'])]
+
+    def _write_batch(self, batch):
+        if len(batch) > 1:
+            try:
+                transaction_ids = self.db.record_sales([(header, items) for _, header, items in batch])
+            except Exception:
+                # Satu penjualan bermasalah tidak boleh menggagalkan penjualan lain
+                pass
+            else:
+                self._saved(batch, transaction_ids)
+                return
+        for job in batch:
+            self._write_one(job)
+
+    def _write_one(self, job):
+        token, header, items = job
+        try:
+            transaction_id = self.db.record_sale(header, items)
+        except Exception as e:
+            if self.journal is not None and not self._rejected(header['sale_key'], e):
+                raise
+            if self.journal is not None:
+                self._attempts.pop(header['sale_key'], None)
+                self.journal.remove([header['sale_key']])
+            self.failed.emit(token, str(e))
+        else:
+            self._saved([job], [transaction_id])
+
+    def _rejected(self, sale_key, error):
+        """True bila penjualan ditolak (failed) alih-alih disimpan ulang nanti"""
+        if isinstance(error, RemoteError):
+            # Error dari pos_server dibawa sebagai nama tipe exception (kind)
+            if error.kind in {cls.__name__ for cls in self.REJECTED_ERRORS}:
+                return True
+            if error.kind is None or error.kind in {cls.__name__ for cls in self.UNAVAILABLE_ERRORS}:
+                return False
+        elif isinstance(error, self.REJECTED_ERRORS):
+            return True
+        elif isinstance(error, self.UNAVAILABLE_ERRORS):
+            return False
+        attempts = self._attempts.get(sale_key, 0) + 1
+        self._attempts[sale_key] = attempts
+        return attempts >= self.MAX_ATTEMPTS
+
+    def _saved(self, jobs, transaction_ids):
+        try:
+            if self.journal is not None:
+                for _, header, _ in jobs:
+                    self._attempts.pop(header['sale_key'], None)
+                self.journal.remove([header['sale_key'] for _, header, _ in jobs])
+        finally:
+            for (token, _, _), transaction_id in zip(jobs, transaction_ids):
+                self.saved.emit(token, transaction_id)
+
+    def run(self):
+        try:
+            for start in range(0, len(self._recovered), self.max_batch):
+                if not self._save(self._recovered[start:start + self.max_batch]):
+                    return
+            if self._recovered:
+                self.recovered.emit(len(self._recovered))
+            while True:
+                batch, stopping = self._next_batch()
+                if batch and not self._save(batch):
+                    break
+                if stopping:
+                    break
+        finally:
+            self.db.release_connection()
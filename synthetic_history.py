@@ -0,0 +1,117 @@
+"""
+Generator riwayat penjualan sintetis untuk benchmark lapisan data
+
+Hasilnya deterministik untuk seed yang sama: jumlah transaksi per hari,
+jam transaksi (mengikuti pola trafik harian), item yang dibeli (sebagian
+kecil menu paling laris) dan metode bayar. Baris ditulis langsung per
+hari dengan executemany, lalu tabel rollup dibangun ulang sekali di akhir.
+"""
+
+from datetime import date, datetime, timedelta
+import random
+
+from money import tax_for
+
+# Bobot relatif transaksi per jam (indeks 0-23)
+TRAFFIC_SHAPES = {
+    # Ramai pagi dan makan siang, sepi setelah jam 8 malam
+    "cafe": [0, 0, 0, 0, 0, 0, 1, 6, 10, 8, 5, 6, 9, 8, 5, 4, 5, 6, 4, 3, 2, 1, 0, 0],
+    # Sama rata selama jam buka 07-22
+    "flat": [0] * 7 + [1] * 15 + [0] * 2,
+    # Ramai sore sampai malam
+    "evening": [0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 3, 4, 3, 3, 4, 5, 7, 9, 10, 9, 6, 3, 1],
+}
+PAYMENT_METHODS = ["Cash", "Credit Card", "Debit Card", "E-Wallet"]
+PAYMENT_WEIGHTS = [45, 10, 15, 30]
+# Pengali jumlah transaksi per hari, Senin (0) sampai Minggu (6)
+WEEKDAY_FACTORS = [0.9, 0.9, 0.95, 1.0, 1.1, 1.3, 1.25]
+
+
+def seed_menu(db, item_count, category_count=10):
+    """Ganti menu contoh dengan item_count item yang tersebar di beberapa kategori"""
+    conn = db.get_connection()
+    with conn:
+        conn.execute("DELETE FROM menu_items")
+        conn.execute("DELETE FROM categories")
+        conn.executemany("INSERT INTO categories (id, name) VALUES (?, ?)",
+                         [(i + 1, f"Kategori {i + 1:02d}") for i in range(category_count)])
+        conn.executemany(
+            "INSERT INTO menu_items (name, price, category_id, description) VALUES (?, ?, ?, ?)",
+            [(f"Menu {i:04d}", 10000 + (i % 20) * 1000, i % category_count + 1,
+              f"Deskripsi menu {i:04d}") for i in range(item_count)])
+
+
+def generate_history(db, years=1.0, sales_per_day=150, lines=(1, 4), menu_size=None,
+                     shape="cafe", seed=42, end_date=None):
+    """Isi db dengan riwayat penjualan sintetis; mengembalikan (jumlah transaksi, jumlah item).
+
+    years: panjang riwayat (boleh pecahan), berakhir pada end_date (default kemarin).
+    sales_per_day: rata-rata transaksi per hari sebelum pengali hari dalam minggu.
+    lines: (min, max) baris item per transaksi.
+    menu_size: jika diisi, menu diganti dengan menu sintetis sebanyak itu.
+    shape: key TRAFFIC_SHAPES untuk sebaran jam transaksi.
+    """
+    if shape not in TRAFFIC_SHAPES:
+        raise ValueError(f"Pola trafik tidak dikenal: {shape} (pilihan: {', '.join(TRAFFIC_SHAPES)})")
+    min_lines, max_lines = lines
+    if not 1 <= min_lines <= max_lines:
+        raise ValueError("Jumlah baris item per transaksi tidak valid")
+
+    rng = random.Random(seed)
+    if menu_size:
+        seed_menu(db, menu_size)
+    menu = db.get_menu_items()
+    # Popularitas mirip Zipf: item ke-n dipilih ~1/n kali item pertama
+    menu = rng.sample(menu, len(menu))
+    menu_weights = [1 / (rank + 1) for rank in range(len(menu))]
+    hours = [hour for hour, weight in enumerate(TRAFFIC_SHAPES[shape]) if weight]
+    hour_weights = [TRAFFIC_SHAPES[shape][hour] for hour in hours]
+
+    end_date = end_date or date.today() - timedelta(days=1)
+    day = end_date - timedelta(days=max(1, round(years * 365)) - 1)
+
+    conn = db.get_connection()
+    transaction_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM transactions").fetchone()[0]
+    transaction_count = line_count = 0
+    while day <= end_date:
+        count = max(0, round(sales_per_day * WEEKDAY_FACTORS[day.weekday()] * rng.uniform(0.8, 1.2)))
+        seconds = sorted(hour * 3600 + rng.randrange(3600)
+                         for hour in rng.choices(hours, hour_weights, k=count))
+        midnight = datetime(day.year, day.month, day.day)
+
+        headers = []
+        items = []
+        for offset in seconds:
+            transaction_id += 1
+            subtotal = 0
+            picked = rng.choices(menu, menu_weights, k=rng.randint(min_lines, max_lines))
+            for menu_item in picked:
+                quantity = rng.choice((1, 1, 1, 2, 2, 3))
+                subtotal += menu_item[2] * quantity
+                items.append((transaction_id, menu_item[0], quantity, menu_item[2],
+                              menu_item[2] * quantity, '', menu_item[1], menu_item[7]))
+            tax = tax_for(subtotal)
+            headers.append((transaction_id,
+                            (midnight + timedelta(seconds=offset)).strftime("%Y-%m-%d %H:%M:%S"),
+                            subtotal, tax, 0, subtotal + tax,
+                            rng.choices(PAYMENT_METHODS, PAYMENT_WEIGHTS)[0],
+                            f"Pelanggan {transaction_id}", "Kasir"))
+
+        with conn:
+            conn.executemany('''
+                INSERT INTO transactions (id, transaction_date, total_amount, tax_amount, discount_amount,
+                                          final_amount, payment_method, customer_name, cashier_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', headers)
+            conn.executemany('''
+                INSERT INTO transaction_items (transaction_id, menu_item_id, quantity, unit_price,
+                                               total_price, notes, item_name, category_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', items)
+        transaction_count += len(headers)
+        line_count += len(items)
+        day += timedelta(days=1)
+
+    db.rebuild_sales_summaries()
+    conn.execute("ANALYZE")
+    return transaction_count, line_count
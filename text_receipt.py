@@ -0,0 +1,147 @@
+from datetime import datetime
+from functools import lru_cache
+import os
+import textwrap
+
+from money import TAX_LABEL, format_rupiah
+from receipt_printer import ReceiptPrinter
+
+# Lebar kertas printer thermal -> jumlah karakter per baris (font A)
+PAPER_COLUMNS = {58: 32, 80: 48}
+
+# Perintah ESC/POS (ASCII, di-encode sekali bersama teks struk)
+ESC_INIT = "\x1b@"
+ESC_ALIGN_LEFT = "\x1ba\x00"
+ESC_ALIGN_CENTER = "\x1ba\x01"
+ESC_BOLD_ON = "\x1bE\x01"
+ESC_BOLD_OFF = "\x1bE\x00"
+GS_DOUBLE_HEIGHT = "\x1d!\x01"
+GS_NORMAL_SIZE = "\x1d!\x00"
+ESC_FEED_4 = "\x1bd\x04"
+GS_PARTIAL_CUT = "\x1dV\x01"
+
+
+def centered_lines(text, width, bold=False):
+    return [(part, True, bold) for part in textwrap.wrap(text, width)]
+
+
+@lru_cache(maxsize=None)
+def static_lines(width):
+    """Header dan footer toko per lebar kertas; dihitung sekali"""
+    header = (centered_lines(ReceiptPrinter.STORE_NAME, width, bold=True)
+              + centered_lines(ReceiptPrinter.STORE_ADDRESS, width)
+              + centered_lines(ReceiptPrinter.STORE_PHONE, width))
+    footer = (centered_lines("Terima kasih atas kunjungan Anda!", width)
+              + centered_lines("Selamat menikmati!", width))
+    return tuple(header), tuple(footer)
+
+
+def receipt_lines(transaction, width=32):
+    """Susun struk menjadi daftar (teks, center, bold) dengan lebar tetap.
+
+    transaction adalah TransactionRecord dari Database.load_transaction.
+    """
+    header, footer = static_lines(width)
+    lines = list(header)
+    rule = "-" * width
+
+    def left(text, bold=False):
+        lines.append((text[:width], False, bold))
+
+    def pair(label, value, bold=False):
+        value = value[:width - len(label) - 1]
+        left(label + value.rjust(width - len(label)), bold)
+
+    left(rule)
+    pair("No. Transaksi", f"#{transaction.id}")
+    pair("Tanggal", transaction.transaction_date.strftime("%d/%m/%Y %H:%M"))
+    pair("Kasir", transaction.cashier_name or "Kasir")
+    pair("Pelanggan", transaction.customer_name or "-")
+    pair("Metode Bayar", transaction.payment_method or "-")
+    left(rule)
+    for item in transaction.items:
+        left(item.item_name)
+        pair(f"  {item.quantity} x {item.unit_price:,}", f"{item.total_price:,}")
+    left(rule)
+    pair("Subtotal", format_rupiah(transaction.total_amount))
+    pair(TAX_LABEL, format_rupiah(transaction.tax_amount))
+    pair("TOTAL", format_rupiah(transaction.final_amount), bold=True)
+    left("=" * width)
+    lines.extend(footer)
+    return lines
+
+
+def render_text(transaction, width=32):
+    """Struk sebagai teks polos berlebar tetap"""
+    return "\n".join(text.center(width).rstrip() if centered else text
+                     for text, centered, _ in receipt_lines(transaction, width)) + "\n"
+
+
+def render_escpos(transaction, width=32, encoding="cp437"):
+    """Struk sebagai byte stream ESC/POS (rata tengah, tebal, potong kertas)"""
+    out = [ESC_INIT]
+    for index, (text, centered, bold) in enumerate(receipt_lines(transaction, width)):
+        out.append(ESC_ALIGN_CENTER if centered else ESC_ALIGN_LEFT)
+        if bold:
+            out.append(ESC_BOLD_ON)
+        if index == 0:
+            # Nama toko dicetak dua kali lebih tinggi; lebar karakter tetap
+            out.append(GS_DOUBLE_HEIGHT)
+        out.append(text + "\n")
+        if index == 0:
+            out.append(GS_NORMAL_SIZE)
+        if bold:
+            out.append(ESC_BOLD_OFF)
+    out.append(ESC_FEED_4)
+    out.append(GS_PARTIAL_CUT)
+    return "".join(out).encode(encoding, errors="replace")
+
+
+class TextReceiptPrinter:
+    """Backend struk untuk printer thermal 58/80 mm.
+
+    Memakai TransactionRecord yang sama dengan ReceiptPrinter, tetapi dirender
+    ke teks berlebar tetap (escpos=False) atau ESC/POS (escpos=True) tanpa
+    reportlab. write() menulis ke stream biner apa pun (file, pipe, BytesIO);
+    generate_receipt() menulis ke device printer jika diset, atau ke file di
+    receipts_dir.
+    """
+
+    def __init__(self, database, receipts_dir="receipts",
+                 paper_width=58, escpos=False, device=None):
+        if paper_width not in PAPER_COLUMNS:
+            raise ValueError(f"Lebar kertas tidak didukung: {paper_width} mm")
+        self.db = database
+        self.receipts_dir = receipts_dir
+        self.width = PAPER_COLUMNS[paper_width]
+        self.escpos = escpos
+        self.device = device
+        if device is None and not os.path.exists(self.receipts_dir):
+            os.makedirs(self.receipts_dir)
+
+    def render(self, transaction):
+        """Render TransactionRecord menjadi bytes siap kirim ke printer"""
+        if self.escpos:
+            return render_escpos(transaction, self.width)
+        return render_text(transaction, self.width).encode("utf-8")
+
+    def write(self, transaction, stream):
+        stream.write(self.render(transaction))
+
+    def generate_receipt(self, transaction_id):
+        """Cetak struk transaksi; mengembalikan path file atau device tujuan"""
+        transaction = self.db.load_transaction(transaction_id)
+        if not transaction:
+            raise Exception("Transaksi tidak ditemukan")
+
+        if self.device:
+            filepath = self.device
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            extension = "bin" if self.escpos else "txt"
+            filepath = os.path.join(self.receipts_dir, f"receipt_{transaction_id}_{timestamp}.{extension}")
+
+        # Mode append agar device printer (mis. /dev/usb/lp0) tidak di-truncate
+        with open(filepath, "ab" if self.device else "wb") as stream:
+            self.write(transaction, stream)
+        return filepath